@@ -0,0 +1,338 @@
+# api.py
+
+"""HTTP API (JSON) untuk terminal POS dan mesin absen, berjalan di samping UI Streamlit.
+
+Logika bisnis yang sama dengan app.py (checkout, portions, attendance, pagination)
+dipanggil langsung tanpa rerun skrip Streamlit. Aplikasi Starlette bersifat async;
+pekerjaan database (SQLAlchemy sinkron + SQLite) dijalankan di threadpool dengan
+session dari pool engine bersama (db_config.SessionLocal). Skema disiapkan sekali
+saat startup, dan setiap request hanya menyinkronkan versi cache dengan proses
+lain (utils.sync_table_versions).
+
+Endpoint:
+    GET  /health
+    GET  /menu                      menu, harga, dan porsi tersedia
+    GET  /stock, /stock/{bahan_id}  stok bahan baku
+    POST /checkout                  {transaksi_id, pelanggan_id, karyawan_id, items, tanggal_pembelian?}
+    POST /attendance/scan           {fingerprint_id, waktu?}
+    POST /attendance/batch          {scans: [{fingerprint_id, waktu}]}
+    GET  /transaksi, /absensi       daftar keyset: start, end, karyawan_id, pelanggan_id, limit, cursor
+
+Pemakaian:
+    python api.py [--host 127.0.0.1] [--port 8502] [--workers 1]
+"""
+
+import argparse
+import contextlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import select
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse as BaseJSONResponse
+from starlette.routing import Route
+
+from attendance import AKSI_TIDAK_DIKENAL, ingest_batch, scan
+from checkout import CheckoutError, InsufficientStockError, checkout
+from concurrency import DatabaseBusyError
+from db_config import SessionLocal, init_db
+from models import Absensi, BahanBaku, Menu, Transaksi
+from pagination import ListColumn, ListSpec, build_filters, fetch_page
+from portions import get_portions
+from utils import cached_by_version, sync_table_versions
+
+DEFAULT_PORT = 8502
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+TRANSAKSI_LIST = ListSpec(
+    key="transaksi",
+    columns=[
+        ListColumn("transaksi_id", Transaksi.transaksi_id),
+        ListColumn("tanggal_pembelian", Transaksi.tanggal_pembelian),
+        ListColumn("pelanggan_id", Transaksi.pelanggan_id),
+        ListColumn("karyawan_id", Transaksi.karyawan_id),
+        ListColumn("total_transaksi", Transaksi.total_transaksi, money=True),
+    ],
+    pk=Transaksi.transaksi_id,
+    sort_columns={"tanggal": Transaksi.tanggal_pembelian},
+    date_column=Transaksi.tanggal_pembelian,
+    karyawan_column=Transaksi.karyawan_id,
+    pelanggan_column=Transaksi.pelanggan_id,
+)
+
+ABSENSI_LIST = ListSpec(
+    key="absensi",
+    columns=[
+        ListColumn("absensi_id", Absensi.absensi_id),
+        ListColumn("karyawan_id", Absensi.karyawan_id),
+        ListColumn("tanggal", Absensi.tanggal),
+        ListColumn("status", Absensi.status),
+        ListColumn("jam_masuk", Absensi.jam_masuk),
+        ListColumn("jam_keluar", Absensi.jam_keluar),
+    ],
+    pk=Absensi.absensi_id,
+    sort_columns={"tanggal": Absensi.tanggal},
+    date_column=Absensi.tanggal,
+    karyawan_column=Absensi.karyawan_id,
+)
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Tipe {type(value).__name__} tidak bisa dijadikan JSON")
+
+
+class JSONResponse(BaseJSONResponse):
+    """JSONResponse yang juga menerima Decimal, date, dan datetime."""
+
+    def render(self, content):
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"),
+                          default=_json_default).encode("utf-8")
+
+
+def _in_session(handler, *args):
+    # Penulisan di dalam handler sudah diantrekan lewat concurrency.run_write
+    with SessionLocal() as session:
+        sync_table_versions(session)
+        try:
+            return handler(session, *args)
+        except DatabaseBusyError as exc:
+            raise HTTPException(503, str(exc))
+
+
+async def _run(handler, *args, status_code=200):
+    """Menjalankan handler(session, *args) di threadpool dan membungkus hasilnya sebagai JSON."""
+    result = await run_in_threadpool(_in_session, handler, *args)
+    return JSONResponse(result, status_code=status_code)
+
+
+async def _json_body(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(400, "Body harus berupa JSON.")
+    if not isinstance(body, dict):
+        raise HTTPException(400, "Body harus berupa objek JSON.")
+    return body
+
+
+def _parse(parser, value, field):
+    try:
+        return parser(value)
+    except (TypeError, ValueError):
+        raise HTTPException(400, f"Nilai {field} tidak valid: {value!r}.")
+
+
+def _parse_optional(parser, value, field):
+    return None if value in (None, "") else _parse(parser, value, field)
+
+
+def _parse_items(items):
+    """items JSON ({menu_id: jumlah} atau [[menu_id, jumlah], ...]) menjadi [(menu_id, jumlah)].
+
+    jumlah harus bilangan bulat (angka atau teks angka); 1.5, true, dan null ditolak.
+    """
+    if not isinstance(items, (dict, list)):
+        raise HTTPException(400, "items harus berupa {menu_id: jumlah} atau [[menu_id, jumlah], ...].")
+    parsed = []
+    for pair in items.items() if isinstance(items, dict) else items:
+        if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+            raise HTTPException(400, f"Item harus berupa pasangan [menu_id, jumlah]: {pair!r}.")
+        menu_id, jumlah = pair
+        if isinstance(jumlah, str):
+            jumlah = _parse(int, jumlah, f"jumlah menu {menu_id}")
+        elif isinstance(jumlah, float) and jumlah.is_integer():
+            jumlah = int(jumlah)
+        if isinstance(jumlah, bool) or not isinstance(jumlah, int):
+            raise HTTPException(400, f"Jumlah menu {menu_id} harus bilangan bulat: {jumlah!r}.")
+        parsed.append((str(menu_id), jumlah))
+    return parsed
+
+
+def _parse_scan(scan):
+    """{fingerprint_id, waktu} menjadi (fingerprint_id, datetime); nilai yang tidak valid
+    diteruskan apa adanya agar dilaporkan ingest_batch di tidak_valid tanpa menggagalkan batch."""
+    if not isinstance(scan, dict):
+        return scan
+    fingerprint_id, waktu = scan.get("fingerprint_id"), scan.get("waktu")
+    with contextlib.suppress(TypeError, ValueError):
+        waktu = datetime.fromisoformat(waktu)
+    return (None if fingerprint_id is None else str(fingerprint_id), waktu)
+
+
+def _parse_limit(value):
+    """limit halaman; di atas MAX_LIMIT dipotong, di bawah 1 ditolak (fetch_page menganggapnya tanpa batas)."""
+    limit = _parse(int, value, "limit")
+    if limit < 1:
+        raise HTTPException(400, f"limit harus antara 1 dan {MAX_LIMIT}.")
+    return min(limit, MAX_LIMIT)
+
+
+# -------------------- HANDLER (berjalan di threadpool) --------------------
+def _menu(session):
+    def load():
+        return session.execute(select(Menu.menu_id, Menu.nama_menu, Menu.harga).order_by(Menu.menu_id)).all()
+
+    porsi = get_portions(session)
+    return [
+        {"menu_id": menu_id, "nama_menu": nama, "harga": harga, "porsi_tersedia": porsi.available(menu_id)}
+        for menu_id, nama, harga in cached_by_version(("api_menu",), (Menu.__tablename__,), load)
+    ]
+
+
+def _stock(session, bahan_id=None):
+    stmt = select(BahanBaku.bahan_id, BahanBaku.nama_bahan, BahanBaku.stock, BahanBaku.satuan)
+    if bahan_id is not None:
+        row = session.execute(stmt.where(BahanBaku.bahan_id == bahan_id)).first()
+        if row is None:
+            raise HTTPException(404, f"Bahan baku {bahan_id} tidak ditemukan.")
+        return row._asdict()
+    return [row._asdict() for row in session.execute(stmt.order_by(BahanBaku.bahan_id))]
+
+
+def _checkout(session, body):
+    try:
+        result = checkout(session, body.get("transaksi_id"), body["tanggal_pembelian"],
+                          body.get("pelanggan_id"), body.get("karyawan_id"), body.get("items") or {})
+    except InsufficientStockError as exc:
+        raise HTTPException(409, {"detail": str(exc), "kurang": [k._asdict() for k in exc.shortages]})
+    except CheckoutError as exc:
+        raise HTTPException(400, str(exc))
+    return {
+        "transaksi_id": result.transaksi_id,
+        "total_transaksi": result.total_transaksi,
+        "lines": [line._asdict() for line in result.lines],
+    }
+
+
+def _scan(session, fingerprint_id, waktu):
+    result = scan(session, fingerprint_id, waktu)
+    if result.aksi == AKSI_TIDAK_DIKENAL:
+        raise HTTPException(404, "Sidik jari tidak dikenali.")
+    return result._asdict()
+
+
+def _batch(session, scans):
+    result = ingest_batch(session, scans)
+    return {
+        "diterima": result.diterima,
+        "ditolak": [{"fingerprint_id": fp, "waktu": waktu} for fp, waktu in result.ditolak],
+        "baris_absensi": result.baris_absensi,
+        "tidak_valid": [{"urutan": urutan, "scan": scan, "alasan": alasan}
+                        for urutan, scan, alasan in result.tidak_valid],
+    }
+
+
+def _list(session, spec, params):
+    page = fetch_page(session, spec, "tanggal", descending=True, limit=params["limit"], cursor=params["cursor"],
+                      filters=build_filters(spec, (params["start"], params["end"]),
+                                            params["karyawan_id"], params["pelanggan_id"]))
+    labels = [c.label for c in spec.columns]
+    next_cursor = None
+    if page.next_cursor is not None:
+        next_cursor = f"{page.next_cursor[0].isoformat()}|{page.next_cursor[1]}"
+    return {"rows": [dict(zip(labels, row)) for row in page.rows], "next_cursor": next_cursor}
+
+
+# -------------------- ENDPOINT --------------------
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def menu(request):
+    return await _run(_menu)
+
+
+async def stock(request):
+    return await _run(_stock, request.path_params.get("bahan_id"))
+
+
+async def checkout_endpoint(request):
+    body = await _json_body(request)
+    body["tanggal_pembelian"] = _parse_optional(date.fromisoformat, body.get("tanggal_pembelian"),
+                                                "tanggal_pembelian") or date.today()
+    body["items"] = _parse_items(body.get("items"))
+    return await _run(_checkout, body, status_code=201)
+
+
+async def attendance_scan(request):
+    body = await _json_body(request)
+    if not body.get("fingerprint_id"):
+        raise HTTPException(400, "fingerprint_id wajib diisi.")
+    waktu = _parse_optional(datetime.fromisoformat, body.get("waktu"), "waktu")
+    return await _run(_scan, str(body["fingerprint_id"]), waktu)
+
+
+async def attendance_batch(request):
+    body = await _json_body(request)
+    scans = body.get("scans")
+    if not isinstance(scans, list):
+        raise HTTPException(400, "scans harus berupa daftar {fingerprint_id, waktu}.")
+    return await _run(_batch, [_parse_scan(s) for s in scans])
+
+
+def _list_endpoint(spec):
+    async def endpoint(request):
+        query = request.query_params
+        cursor = None
+        if query.get("cursor"):
+            tanggal, _, pk = query["cursor"].partition("|")
+            cursor = (_parse(date.fromisoformat, tanggal, "cursor"),
+                      _parse(spec.pk.type.python_type, pk, "cursor"))
+        params = {
+            "start": _parse_optional(date.fromisoformat, query.get("start"), "start"),
+            "end": _parse_optional(date.fromisoformat, query.get("end"), "end"),
+            "karyawan_id": query.get("karyawan_id"),
+            "pelanggan_id": query.get("pelanggan_id"),
+            "limit": _parse_limit(query.get("limit", DEFAULT_LIMIT)),
+            "cursor": cursor,
+        }
+        return await _run(_list, spec, params)
+    return endpoint
+
+
+async def http_error(request, exc):
+    detail = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+    return JSONResponse(detail, status_code=exc.status_code)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # Skema (create_all + migrasi) sekali saat startup, bukan per request
+    await run_in_threadpool(init_db)
+    yield
+
+
+app = Starlette(
+    routes=[
+        Route("/health", health),
+        Route("/menu", menu),
+        Route("/stock", stock),
+        Route("/stock/{bahan_id}", stock),
+        Route("/checkout", checkout_endpoint, methods=["POST"]),
+        Route("/attendance/scan", attendance_scan, methods=["POST"]),
+        Route("/attendance/batch", attendance_batch, methods=["POST"]),
+        Route("/transaksi", _list_endpoint(TRANSAKSI_LIST)),
+        Route("/absensi", _list_endpoint(ABSENSI_LIST)),
+    ],
+    exception_handlers={HTTPException: http_error},
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Jalankan HTTP API Restorify.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=1, help="jumlah proses uvicorn")
+    args = parser.parse_args()
+    uvicorn.run("api:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
@@ -0,0 +1,155 @@
+# attendance.py
+
+"""Scan sidik jari untuk absensi (masuk/pulang), satuan maupun batch dari mesin absen.
+
+Pencarian sidik jari memakai peta {fingerprint_id: (karyawan_id, nama)} di memori
+yang di-cache per versi tabel karyawan, sehingga otomatis dimuat ulang setiap kali
+ada pendaftaran sidik jari. Setiap karyawan hanya punya satu baris absensi per hari
+(indeks unik karyawan_id + tanggal); scan ditulis dengan satu UPSERT:
+
+- scan pertama hari itu membuat baris "Hadir" dengan jam_masuk,
+- scan berikutnya mengisi jam_keluar dengan scan terakhir,
+- jam_masuk selalu scan paling awal, sehingga scan buffer yang datang tidak
+  berurutan tetap menghasilkan jam yang benar.
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from concurrency import run_write
+from models import Absensi, Karyawan
+from utils import cached_by_version
+
+PRESENT_STATUS = "Hadir"
+
+AKSI_MASUK = "masuk"
+AKSI_PULANG = "pulang"
+AKSI_TIDAK_DIKENAL = "tidak dikenal"
+
+
+class ScanResult(NamedTuple):
+    fingerprint_id: str
+    karyawan_id: Optional[str]
+    employee_name: Optional[str]
+    aksi: str
+    jam_masuk: Optional[datetime] = None
+    jam_keluar: Optional[datetime] = None
+
+
+class BatchResult(NamedTuple):
+    diterima: int
+    ditolak: list        # [(fingerprint_id, waktu)] sidik jari yang tidak dikenal
+    baris_absensi: int   # jumlah (karyawan, tanggal) yang ditulis
+    tidak_valid: list    # [(urutan, scan, alasan)] scan rusak yang dilewati, urutan mulai 1
+
+
+def fingerprint_map(session: Session):
+    """{fingerprint_id: (karyawan_id, employee_name)}, dimuat ulang jika tabel karyawan berubah."""
+    def load():
+        return {
+            fp: (karyawan_id, nama)
+            for fp, karyawan_id, nama in session.execute(
+                select(Karyawan.fingerprint_id, Karyawan.karyawan_id, Karyawan.employee_name)
+                .where(Karyawan.fingerprint_id.is_not(None))
+            )
+        }
+
+    return cached_by_version(("fingerprint_map",), (Karyawan.__tablename__,), load)
+
+
+def _upsert():
+    """INSERT ... ON CONFLICT (karyawan_id, tanggal) yang menggabungkan jam dengan baris yang ada.
+
+    Nilai baru: jam_masuk = scan paling awal, jam_keluar = scan paling akhir (atau
+    NULL jika hanya satu scan). Baris yang sudah ada tanpa jam_masuk (diisi manual,
+    mis. "Sakit") diambil alih oleh scan dan menjadi "Hadir".
+    """
+    stmt = sqlite_insert(Absensi)
+    new = stmt.excluded
+    masuk, keluar = Absensi.jam_masuk, Absensi.jam_keluar
+    return stmt.on_conflict_do_update(
+        index_elements=[Absensi.karyawan_id, Absensi.tanggal],
+        set_={
+            "status": PRESENT_STATUS,
+            # min()/max() multi-argumen SQLite adalah fungsi skalar, bukan agregat
+            "jam_masuk": func.min(func.coalesce(masuk, new.jam_masuk), new.jam_masuk),
+            "jam_keluar": case(
+                (masuk.is_(None), new.jam_keluar),
+                else_=func.max(func.coalesce(keluar, masuk),
+                               func.coalesce(new.jam_keluar, new.jam_masuk)),
+            ),
+        },
+    )
+
+
+def scan(session: Session, fingerprint_id, waktu=None):
+    """Mencatat satu scan sidik jari lalu commit. Mengembalikan ScanResult."""
+    waktu = waktu or datetime.now()
+    karyawan = fingerprint_map(session).get(fingerprint_id)
+    if karyawan is None:
+        return ScanResult(fingerprint_id, None, None, AKSI_TIDAK_DIKENAL)
+    karyawan_id, nama = karyawan
+    stmt = (
+        _upsert().values(karyawan_id=karyawan_id, tanggal=waktu.date(), status=PRESENT_STATUS,
+                         jam_masuk=waktu, jam_keluar=None)
+        .returning(Absensi.jam_masuk, Absensi.jam_keluar)
+    )
+    jam_masuk, jam_keluar = run_write(session, lambda session: session.execute(stmt).one())
+    aksi = AKSI_MASUK if jam_keluar is None else AKSI_PULANG
+    return ScanResult(fingerprint_id, karyawan_id, nama, aksi, jam_masuk, jam_keluar)
+
+
+def _scan_error(item):
+    """Alasan item batch tidak bisa diproses, atau None jika berupa (fingerprint_id, datetime)."""
+    try:
+        fingerprint_id, waktu = item
+    except (TypeError, ValueError):
+        return "bukan pasangan (fingerprint_id, waktu)"
+    if not isinstance(fingerprint_id, str) or not fingerprint_id:
+        return "fingerprint_id kosong"
+    # waktu != waktu menangkap NaT dari pandas (subclass datetime)
+    if not isinstance(waktu, datetime) or waktu != waktu:
+        return "waktu bukan tanggal dan jam yang valid"
+    return None
+
+
+def ingest_batch(session: Session, scans):
+    """Mencatat sekumpulan scan [(fingerprint_id, waktu)] dari buffer mesin absen, lalu commit.
+
+    Scan dikelompokkan dulu per (karyawan, tanggal) di memori, lalu ditulis dengan
+    satu UPSERT executemany dalam satu transaksi tulis (concurrency.run_write).
+    Sidik jari yang tidak dikenal dilewati dan dikembalikan di BatchResult.ditolak;
+    scan rusak (mis. baris CSV tanpa waktu) dilewati dan dikembalikan di
+    BatchResult.tidak_valid.
+    """
+    fingerprints = fingerprint_map(session)
+    diterima = 0
+    ditolak = []
+    tidak_valid = []
+    per_hari = {}
+    for urutan, item in enumerate(scans, start=1):
+        alasan = _scan_error(item)
+        if alasan is not None:
+            tidak_valid.append((urutan, item, alasan))
+            continue
+        fingerprint_id, waktu = item
+        karyawan = fingerprints.get(fingerprint_id)
+        if karyawan is None:
+            ditolak.append((fingerprint_id, waktu))
+            continue
+        diterima += 1
+        key = (karyawan[0], waktu.date())
+        first, last = per_hari.get(key, (waktu, waktu))
+        per_hari[key] = (min(first, waktu), max(last, waktu))
+    if per_hari:
+        rows = [
+            {"karyawan_id": karyawan_id, "tanggal": tanggal, "status": PRESENT_STATUS,
+             "jam_masuk": first, "jam_keluar": last if last > first else None}
+            for (karyawan_id, tanggal), (first, last) in per_hari.items()
+        ]
+        run_write(session, lambda session: session.execute(_upsert(), rows))
+    return BatchResult(diterima, ditolak, len(per_hari), tidak_valid)
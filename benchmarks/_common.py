@@ -0,0 +1,75 @@
+# benchmarks/_common.py
+
+"""Utilitas bersama untuk skrip benchmark (database sementara, pengukur waktu)."""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def scratch_db_url(name="bench"):
+    """Membuat path file SQLite baru di direktori sementara dan mengembalikan URL-nya."""
+    directory = tempfile.mkdtemp(prefix="restorify_")
+    return f"sqlite:///{os.path.join(directory, name + '.db')}"
+
+
+def timeit(fn, repeat=50, warmup=3):
+    """Menjalankan fn berulang kali dan mengembalikan ringkasan latensi dalam milidetik."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def print_result(label, result):
+    parts = ", ".join(f"{k}={v:.3f}" for k, v in result.items())
+    print(f"{label:<40} {parts}")
+
+
+def seed_catalog(session, n_menu=50, n_bahan=20, n_pelanggan=100, n_karyawan=10,
+                 stock=10**9, bahan_per_menu=3):
+    """Mengisi data master minimal (supplier, bahan, menu, komposisi, pelanggan, karyawan)."""
+    from sqlalchemy import insert
+
+    from models import BahanBaku, Karyawan, KomposisiMenu, Menu, Pelanggan, Supplier
+
+    session.execute(insert(Supplier), [
+        {"supplier_id": "S1", "supplier_name": "Supplier", "address": "Jakarta"}
+    ])
+    session.execute(insert(BahanBaku), [
+        {"bahan_id": f"B{i}", "nama_bahan": f"Bahan {i}", "stock": stock, "satuan": "Kg",
+         "harga_bahan": 1000 + i, "supplier_id": "S1"}
+        for i in range(n_bahan)
+    ])
+    session.execute(insert(Menu), [
+        {"menu_id": f"M{i}", "nama_menu": f"Menu {i}", "harga": 10000 + 500 * i}
+        for i in range(n_menu)
+    ])
+    session.execute(insert(KomposisiMenu), [
+        {"menu_id": f"M{i}", "bahan_id": f"B{(i + j) % n_bahan}", "jumlah_bahan": 1 + j}
+        for i in range(n_menu) for j in range(bahan_per_menu)
+    ])
+    session.execute(insert(Pelanggan), [
+        {"pelanggan_id": f"P{i}", "cus_name": f"Pelanggan {i}", "contact_info": "08123"}
+        for i in range(n_pelanggan)
+    ])
+    session.execute(insert(Karyawan), [
+        {"karyawan_id": f"K{i}", "employee_name": f"Karyawan {i}", "position": "Cashier"}
+        for i in range(n_karyawan)
+    ])
+    session.commit()
@@ -0,0 +1,139 @@
+# benchmarks/bench_api.py
+
+"""Uji beban api.py dibandingkan jalur Streamlit.
+
+Menjalankan api.py (uvicorn) sebagai proses terpisah di database sementara, lalu
+N_CLIENTS thread klien dengan koneksi keep-alive menembakkan request ke setiap
+endpoint selama DURATION detik: lookup stok, daftar menu + porsi, scan absensi,
+checkout, dan daftar transaksi. Sebagai pembanding, satu rerun halaman Transaksi
+app.py diukur dengan streamlit.testing AppTest (satu interaksi kasir = satu rerun).
+
+Jalankan: python benchmarks/bench_api.py
+"""
+
+import http.client
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from _common import ROOT, print_result, scratch_db_url, timeit
+
+DATABASE_URL = scratch_db_url("api")
+# Harus diset sebelum db_config diimpor (AppTest memakai modul yang sama)
+os.environ["RESTORIFY_DATABASE_URL"] = DATABASE_URL
+
+from sqlalchemy import func, select, update  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from _common import seed_catalog  # noqa: E402
+from db_config import create_db_engine, init_db  # noqa: E402
+from models import Karyawan, Transaksi  # noqa: E402
+
+PORT = 8599
+N_CLIENTS = 8
+DURATION = 3.0
+
+
+def seed():
+    engine = create_db_engine(DATABASE_URL)
+    init_db(engine)
+    with sessionmaker(bind=engine)() as session:
+        seed_catalog(session, n_karyawan=200)
+        session.execute(update(Karyawan).values(fingerprint_id="FID" + func.substr(Karyawan.karyawan_id, 2)))
+        session.commit()
+    return engine
+
+
+def start_server():
+    server = subprocess.Popen([sys.executable, "api.py", "--port", str(PORT)], cwd=ROOT,
+                              env=dict(os.environ), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("api.py tidak merespons")
+
+
+def load(label, make_request):
+    """Menembakkan make_request(nomor) dari N_CLIENTS thread selama DURATION detik."""
+    counter = itertools.count()
+    latencies, errors = [], []
+    stop = time.perf_counter() + DURATION
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", PORT)
+        while time.perf_counter() < stop:
+            method, path, body = make_request(next(counter))
+            start = time.perf_counter()
+            conn.request(method, path, body=json.dumps(body) if body is not None else None,
+                         headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status >= 400:
+                errors.append(response.status)
+
+    threads = [threading.Thread(target=client) for _ in range(N_CLIENTS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    assert not errors, f"{label}: {len(errors)} request gagal ({set(errors)})"
+    print_result(label, {"req_per_detik": len(latencies) / elapsed,
+                         "p50_ms": latencies[len(latencies) // 2],
+                         "p95_ms": latencies[int(len(latencies) * 0.95)]})
+    return len(latencies) / elapsed
+
+
+def streamlit_rerun():
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=30).run()
+    app.sidebar.selectbox[0].select("Transaksi").run()
+    result = timeit(app.run, repeat=10, warmup=2)
+    print_result("streamlit: rerun halaman Transaksi", result)
+    return 1000 / result["mean_ms"]
+
+
+def main():
+    engine = seed()
+    server = start_server()
+    try:
+        rates = {
+            "stok": load("GET /stock/{bahan_id}", lambda i: ("GET", f"/stock/B{i % 20}", None)),
+            "menu": load("GET /menu", lambda i: ("GET", "/menu", None)),
+            "scan": load("POST /attendance/scan",
+                         lambda i: ("POST", "/attendance/scan", {"fingerprint_id": f"FID{i % 200}"})),
+            "checkout": load("POST /checkout", lambda i: ("POST", "/checkout", {
+                "transaksi_id": f"T{i}", "pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{i % 200}",
+                "items": {f"M{i % 50}": 1, f"M{(i + 7) % 50}": 2},
+            })),
+            "daftar": load("GET /transaksi", lambda i: ("GET", "/transaksi?limit=50", None)),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+    with engine.connect() as conn:
+        n_transaksi = conn.scalar(select(func.count()).select_from(Transaksi))
+    print(f"{n_transaksi} transaksi tersimpan lewat API")
+
+    rerun_rate = streamlit_rerun()
+    print(f"checkout API {rates['checkout'] / rerun_rate:.0f}x dan lookup stok "
+          f"{rates['stok'] / rerun_rate:.0f}x lebih banyak per detik dibanding satu rerun Streamlit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/bench_attendance.py
+
+"""Throughput scan sidik jari saat pergantian shift.
+
+Mengukur attendance.scan() satu per satu (scan masuk lalu scan pulang untuk
+N_KARYAWAN karyawan, masing-masing satu UPSERT + commit), scan bersamaan dari
+beberapa thread, dan attendance.ingest_batch() untuk buffer mesin absen berisi
+scan acak yang tidak berurutan. Setelah itu memeriksa tidak ada baris absensi
+ganda dan jam masuk/pulang sama dengan scan paling awal/akhir.
+
+Jalankan: python benchmarks/bench_attendance.py
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from _common import print_result, scratch_db_url
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from attendance import ingest_batch, scan
+from db_config import create_db_engine, init_db
+from models import Absensi, Karyawan
+
+N_KARYAWAN = 2_000
+N_THREADS = 4
+BATCH_SCANS = 50_000
+HARI_1 = datetime(2024, 3, 1)
+
+
+def seed(session):
+    session.execute(insert(Karyawan), [
+        {"karyawan_id": f"K{i}", "employee_name": f"Karyawan {i}", "position": "Waiter",
+         "fingerprint_id": f"FID{i}"}
+        for i in range(N_KARYAWAN)
+    ])
+    session.commit()
+
+
+def rate(label, n, seconds):
+    print_result(label, {"scan_per_detik": n / seconds, "ms_per_scan": seconds * 1000 / n})
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed(session)
+
+        # Scan satu per satu: masuk pukul 08:xx, pulang pukul 16:xx
+        for label, jam in [("scan masuk (satuan)", 8), ("scan pulang (satuan)", 16)]:
+            start = time.perf_counter()
+            for i in range(N_KARYAWAN):
+                scan(session, f"FID{i}", HARI_1.replace(hour=jam, minute=i % 60))
+            rate(label, N_KARYAWAN, time.perf_counter() - start)
+
+    # Scan bersamaan dari beberapa mesin: setiap karyawan scan di semua thread
+    hari_2 = HARI_1 + timedelta(days=1)
+
+    def worker(offset):
+        with Session() as session:
+            for i in range(N_KARYAWAN):
+                scan(session, f"FID{i}", hari_2.replace(hour=8 + offset, minute=i % 60))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(N_THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    rate(f"scan bersamaan ({N_THREADS} thread)", N_KARYAWAN * N_THREADS, time.perf_counter() - start)
+
+    # Buffer mesin absen: scan acak hari ke-3 dan ke-4, urutan diacak, plus sidik jari asing dan baris rusak
+    rng = random.Random(5)
+    hari_3 = HARI_1 + timedelta(days=2)
+    scans = [(f"FID{rng.randrange(N_KARYAWAN)}",
+              hari_3 + timedelta(days=rng.randrange(2), minutes=rng.randrange(6 * 60, 22 * 60)))
+             for _ in range(BATCH_SCANS)]
+    scans += [("FID-ASING", hari_3)] * 10
+    rng.shuffle(scans)
+    batch = scans + [("FID0", None), ("", hari_3), ("FID0",)]  # baris rusak dari mesin absen
+    with Session() as session:
+        start = time.perf_counter()
+        hasil = ingest_batch(session, batch)
+        rate("ingest_batch", len(batch), time.perf_counter() - start)
+        assert hasil.diterima == BATCH_SCANS and len(hasil.ditolak) == 10, hasil[:1]
+        assert len(hasil.tidak_valid) == 3, hasil.tidak_valid
+
+        total = session.scalar(select(func.count()).select_from(Absensi))
+        unik = session.scalar(select(func.count()).select_from(
+            select(Absensi.karyawan_id, Absensi.tanggal).distinct().subquery()))
+        assert total == unik, (total, unik)
+
+        rows = session.execute(select(Absensi.karyawan_id, Absensi.tanggal, Absensi.jam_masuk,
+                                      Absensi.jam_keluar)).all()
+        actual = {(k, t): (masuk, keluar) for k, t, masuk, keluar in rows}
+        assert actual[("K7", HARI_1.date())] == (HARI_1.replace(hour=8, minute=7),
+                                                  HARI_1.replace(hour=16, minute=7))
+        assert actual[("K7", hari_2.date())] == (hari_2.replace(hour=8, minute=7),
+                                                  hari_2.replace(hour=8 + N_THREADS - 1, minute=7))
+        expected = {}
+        for fp, waktu in scans:
+            if fp != "FID-ASING":
+                key = (f"K{fp[3:]}", waktu.date())
+                first, last = expected.get(key, (waktu, waktu))
+                expected[key] = (min(first, waktu), max(last, waktu))
+        for key, (first, last) in expected.items():
+            assert actual[key] == (first, last if last > first else None), key
+        print(f"{total} baris absensi, tanpa duplikat (karyawan, tanggal); jam masuk/pulang sesuai scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/bench_cart.py
+
+"""Biaya menambah item ke keranjang transaksi sampai 20 baris.
+
+Dua bagian, dengan database dari datagen.py (--scale, atau --db untuk memakai
+salinan database yang sudah ada):
+- model keranjang: satu kali tambah item tanpa Streamlit. Cara lama menyalin
+  dict keranjang lalu menghargai ulang seluruh keranjang dengan price_cart()
+  (satu query per tambah); Cart menghitung baris yang berubah saja dari cache
+  harga menu
+- layar kasir: AppTest membuka halaman Transaksi lalu menekan Tambah Item untuk
+  LINES menu berbeda. AppTest selalu menjalankan seluruh skrip per klik, jadi
+  dicatat dua angka: waktu satu klik penuh, dan waktu fragment cart_editor
+  menurut instrumentation.page_scope (biaya rerun fragment di server) beserta
+  jumlah query-nya
+
+Jalankan: python benchmarks/bench_cart.py [--scale small] [--db path.db]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import time
+
+from _common import ROOT, print_result, scratch_db_url, timeit
+
+APP = os.path.join(ROOT, "app.py")
+LINES = 20
+
+
+def measure_model(url):
+    from sqlalchemy.orm import Session
+
+    from cart import Cart, menu_prices
+    from checkout import price_cart
+    from db_config import create_db_engine
+    from models import Menu
+    from portions import get_portions
+    from utils import get_reference_ids
+
+    engine = create_db_engine(url)
+    with Session(engine) as session:
+        menu_ids = get_reference_ids(session, Menu)[:LINES]
+        porsi = get_portions(session)
+        prices = menu_prices(session)
+
+        def old_build():
+            keranjang = {}
+            for menu_id in menu_ids:
+                keranjang_baru = dict(keranjang)
+                keranjang_baru[menu_id] = keranjang_baru.get(menu_id, 0) + 1
+                if not porsi.shortages(keranjang_baru):
+                    keranjang = keranjang_baru
+                lines = price_cart(session, keranjang)
+                sum(line.subtotal for line in lines)
+
+        def new_build():
+            keranjang = Cart()
+            for menu_id in menu_ids:
+                if not porsi.shortages(keranjang.with_added(menu_id, 1)):
+                    keranjang.add(menu_id, 1, prices)
+                keranjang.total
+
+        results = {"dict + price_cart": timeit(old_build, repeat=20),
+                   "Cart": timeit(new_build, repeat=20)}
+    engine.dispose()
+    for label, result in results.items():
+        print_result(f"keranjang {LINES} baris, {label}",
+                     {key: value / LINES for key, value in result.items()})
+
+
+def measure_screen():
+    import instrumentation
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    at.sidebar.selectbox[0].select("Transaksi").run()
+    assert not at.exception, at.exception
+
+    clicks, fragments, queries = [], [], []
+    for index in range(LINES):
+        [picker] = [s for s in at.selectbox if s.label == "Menu"]
+        picker.select_index(index).run()
+        [button] = [b for b in at.button if b.label == "Tambah Item"]
+        instrumentation.reset()
+        start = time.perf_counter()
+        button.click().run()
+        clicks.append((time.perf_counter() - start) * 1000)
+        assert not at.exception, at.exception
+        stats = {p["halaman"]: p for p in instrumentation.snapshot()["halaman"]}
+        fragments.append(stats["cart_editor"]["rata_rata_ms"])
+        queries.append(stats["cart_editor"]["query_per_rerun"])
+
+    assert len(at.table[0].value) == LINES, "keranjang tidak berisi semua item"
+    print_result("klik Tambah Item (seluruh skrip)",
+                 {"p50_ms": statistics.median(clicks), "maks_ms": max(clicks)})
+    print_result("fragment cart_editor",
+                 {"p50_ms": statistics.median(fragments), "maks_ms": max(fragments),
+                  "query_maks": max(queries)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Biaya menambah item ke keranjang transaksi.")
+    parser.add_argument("--scale", default="small", help="skala datagen.py bila --db tidak diberikan")
+    parser.add_argument("--db", help="path database yang dipakai (disalin, tidak diubah)")
+    args = parser.parse_args()
+
+    url = scratch_db_url("cart")
+    # db_config dan instrumentation membaca environment saat diimpor
+    os.environ["RESTORIFY_DATABASE_URL"] = url
+    os.environ["RESTORIFY_SQL_STATS"] = "1"
+    if args.db:
+        import sqlalchemy
+        shutil.copyfile(args.db, sqlalchemy.engine.make_url(url).database)
+    else:
+        from datagen import generate
+        generate(url, args.scale, verbose=False).dispose()
+
+    measure_model(url)
+    measure_screen()
+
+
+if __name__ == "__main__":
+    main()
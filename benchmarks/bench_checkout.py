@@ -0,0 +1,53 @@
+# benchmarks/bench_checkout.py
+
+"""Throughput checkout (pesanan per detik) lewat checkout.checkout().
+
+Setiap pesanan berisi beberapa baris menu; header, detail, dan pengurangan stok
+disimpan dalam satu transaksi database.
+
+Jalankan: python benchmarks/bench_checkout.py
+"""
+
+import random
+import time
+from datetime import date
+
+from _common import scratch_db_url, seed_catalog
+
+from sqlalchemy.orm import sessionmaker
+
+from checkout import checkout
+from db_config import create_db_engine, init_db
+
+N_ORDERS = 2000
+LINES_PER_ORDER = 4
+N_MENU = 50
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU)
+
+    rng = random.Random(42)
+    carts = [
+        {f"M{rng.randrange(N_MENU)}": rng.randint(1, 3) for _ in range(LINES_PER_ORDER)}
+        for _ in range(N_ORDERS)
+    ]
+
+    session = Session()
+    start = time.perf_counter()
+    for i, cart in enumerate(carts):
+        checkout(session, f"T{i}", date.today(), f"P{i % 100}", f"K{i % 10}", cart)
+    elapsed = time.perf_counter() - start
+    session.close()
+
+    print(f"{N_ORDERS} pesanan x {LINES_PER_ORDER} baris dalam {elapsed:.2f} s "
+          f"-> {N_ORDERS / elapsed:.0f} pesanan/detik "
+          f"({elapsed / N_ORDERS * 1000:.2f} ms/pesanan)")
+
+
+if __name__ == "__main__":
+    main()
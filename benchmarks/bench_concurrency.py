@@ -0,0 +1,184 @@
+# benchmarks/bench_concurrency.py
+
+"""Uji beban banyak kasir yang menulis ke database SQLite yang sama.
+
+THREADS kasir masing-masing melakukan CHECKOUTS checkout (sesi sendiri, menu
+acak yang berbagi bahan), bersamaan dengan satu admin yang berulang kali
+mengedit stok bahan lewat form (baca baris, jeda, tulis stok + TAMBAH_STOK).
+Dua mode dibandingkan:
+- tanpa koordinasi: pola lama, baca stok lalu tulis nilai absolut dalam
+  transaksi DEFERRED tanpa nomor versi (with_for_update tidak berlaku di SQLite)
+- run_write: checkout.checkout() dan repositories.bahan_baku.update() dengan
+  expected_version, keduanya lewat concurrency.run_write (BEGIN IMMEDIATE + retry)
+Setelah selesai stok akhir setiap bahan dibandingkan dengan stok awal dikurangi
+pemakaian semua transaksi yang tersimpan, ditambah edit admin yang berhasil.
+Selisihnya adalah lost update. Dicatat juga latensi per penulisan (p50/p99/maks)
+dan jumlah penulisan yang gagal karena database terkunci.
+
+Jalankan: python benchmarks/bench_concurrency.py
+"""
+
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from datetime import date
+
+from _common import print_result, scratch_db_url, seed_catalog
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from checkout import CheckoutError, checkout
+from concurrency import DatabaseBusyError, WriteConflictError, is_busy_error
+from db_config import create_db_engine, init_db
+from models import BahanBaku, DetailTransaksi, KomposisiMenu, Transaksi
+from repositories import bahan_baku as bahan_baku_repo
+
+THREADS = 8
+CHECKOUTS = 50
+ADMIN_EDITS = 40
+TAMBAH_STOK = 100
+N_MENU = 20
+N_BAHAN = 20
+STOK_AWAL = 10**6
+
+
+def legacy_checkout(session, transaksi_id, items, karyawan_id):
+    """Pola lama: baca stok di transaksi baca, lalu tulis stok absolut."""
+    try:
+        kebutuhan = Counter()
+        for menu_id, bahan_id, jumlah_bahan in session.execute(
+                select(KomposisiMenu.menu_id, KomposisiMenu.bahan_id, KomposisiMenu.jumlah_bahan)
+                .where(KomposisiMenu.menu_id.in_(list(items)))):
+            kebutuhan[bahan_id] += jumlah_bahan * items[menu_id]
+        stok = dict(session.execute(select(BahanBaku.bahan_id, BahanBaku.stock)
+                                    .where(BahanBaku.bahan_id.in_(list(kebutuhan)))).all())
+        for bahan_id, total in kebutuhan.items():
+            session.execute(update(BahanBaku).where(BahanBaku.bahan_id == bahan_id)
+                            .values(stock=stok[bahan_id] - total))
+        session.execute(insert(Transaksi).values(
+            transaksi_id=transaksi_id, tanggal_pembelian=date(2024, 1, 1), pelanggan_id="P0",
+            karyawan_id=karyawan_id, total_transaksi=0))
+        session.execute(insert(DetailTransaksi), [
+            {"transaksi_id": transaksi_id, "menu_id": m, "jumlah": j, "harga": 0} for m, j in items.items()])
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+def legacy_edit(session, bahan_id, pause):
+    row = bahan_baku_repo.get(session, bahan_id)
+    time.sleep(pause)
+    session.execute(update(BahanBaku).where(BahanBaku.bahan_id == bahan_id)
+                    .values(stock=row.stock + TAMBAH_STOK))
+    session.commit()
+
+
+def versioned_edit(session, bahan_id, pause):
+    row = bahan_baku_repo.get(session, bahan_id)
+    session.commit()  # form ditampilkan, transaksi baca selesai
+    time.sleep(pause)
+    bahan_baku_repo.update(session, bahan_id, row.version_id, stock=row.stock + TAMBAH_STOK)
+
+
+def run(mode):
+    engine = create_db_engine(scratch_db_url(f"concurrency_{mode}"))
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU, n_bahan=N_BAHAN, n_pelanggan=1, n_karyawan=THREADS,
+                     stock=STOK_AWAL)
+
+    latencies, errors, conflicts = [], Counter(), Counter()
+    admin_added = Counter()
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(THREADS)
+
+    def record(fn):
+        start = time.perf_counter()
+        try:
+            fn()
+        except (OperationalError, DatabaseBusyError) as exc:
+            if not isinstance(exc, DatabaseBusyError) and not is_busy_error(exc):
+                raise
+            with lock:
+                errors["terkunci"] += 1
+            return False
+        except WriteConflictError:
+            with lock:
+                conflicts["versi"] += 1
+            return False
+        except CheckoutError as exc:
+            with lock:
+                errors[str(exc)[:40]] += 1
+            return False
+        with lock:
+            latencies.append((time.perf_counter() - start) * 1000)
+        return True
+
+    def cashier(k):
+        rng = random.Random(k)
+        start_barrier.wait()
+        with Session() as session:
+            for i in range(CHECKOUTS):
+                items = {f"M{rng.randrange(N_MENU)}": 1 + rng.randrange(3) for _ in range(3)}
+                transaksi_id = f"{k}{i:03d}"
+                if mode == "legacy":
+                    record(lambda: legacy_checkout(session, transaksi_id, items, f"K{k}"))
+                else:
+                    record(lambda: checkout(session, transaksi_id, date(2024, 1, 1), "P0", f"K{k}", items))
+
+    def admin():
+        rng = random.Random(-1)
+        edit = legacy_edit if mode == "legacy" else versioned_edit
+        start_barrier.wait()
+        with Session() as session:
+            for _ in range(ADMIN_EDITS):
+                bahan_id = f"B{rng.randrange(N_BAHAN)}"
+                if record(lambda: edit(session, bahan_id, rng.uniform(0, 0.01))):
+                    admin_added[bahan_id] += TAMBAH_STOK
+
+    threads = [threading.Thread(target=cashier, args=(k,)) for k in range(THREADS - 1)]
+    threads.append(threading.Thread(target=admin))
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with Session() as session:
+        dipakai = dict(session.execute(
+            select(KomposisiMenu.bahan_id, func.sum(KomposisiMenu.jumlah_bahan * DetailTransaksi.jumlah))
+            .join(DetailTransaksi, DetailTransaksi.menu_id == KomposisiMenu.menu_id)
+            .group_by(KomposisiMenu.bahan_id)).all())
+        stok = dict(session.execute(select(BahanBaku.bahan_id, BahanBaku.stock)).all())
+        n_transaksi = session.scalar(select(func.count()).select_from(Transaksi))
+    engine.dispose()
+    lost = sum(abs(STOK_AWAL - dipakai.get(b, 0) + admin_added[b] - stok[b]) for b in stok)
+
+    latencies.sort()
+    print_result(f"{mode}: penulisan berhasil", {
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99)],
+        "maks_ms": latencies[-1],
+        "per_detik": len(latencies) / elapsed,
+    })
+    print(f"{'':<40} transaksi={n_transaksi}, gagal={dict(errors)}, konflik versi={conflicts['versi']}, "
+          f"edit admin berhasil={sum(admin_added.values()) // TAMBAH_STOK}, selisih stok (lost update)={lost}")
+    return lost, errors
+
+
+def main():
+    run("legacy")
+    lost, errors = run("run_write")
+    assert lost == 0, f"lost update: selisih stok {lost}"
+    assert not errors, f"penulisan gagal: {dict(errors)}"
+
+
+if __name__ == "__main__":
+    main()
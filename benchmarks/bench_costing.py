@@ -0,0 +1,71 @@
+# benchmarks/bench_costing.py
+
+"""Perhitungan biaya bahan dan margin untuk ribuan menu dan bahan.
+
+Mengukur pemuatan penuh (matriks komposisi + harga), pembaruan inkremental saat
+satu harga bahan berubah, dan membandingkannya dengan perhitungan per menu lewat
+relasi ORM. Hasil inkremental diverifikasi sama dengan perhitungan ulang penuh.
+
+Jalankan: python benchmarks/bench_costing.py
+"""
+
+import time
+
+import numpy as np
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from costing import MenuCosting, get_costing
+from db_config import create_db_engine, init_db
+from models import BahanBaku, Menu
+
+N_MENU = 5_000
+N_BAHAN = 2_000
+BAHAN_PER_MENU = 8
+
+
+def orm_costs(session):
+    # Cara naif: lazy-load komposisi dan bahan untuk setiap menu
+    return {
+        menu.menu_id: sum(k.jumlah_bahan * float(k.bahan_baku.harga_bahan) for k in menu.komposisi_menu)
+        for menu in session.query(Menu).all()
+    }
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU, n_bahan=N_BAHAN, bahan_per_menu=BAHAN_PER_MENU)
+
+    with Session() as session:
+        start = time.perf_counter()
+        orm_costs(session)
+        print_result("ORM per menu (sekali)", {"ms": (time.perf_counter() - start) * 1000})
+
+    with Session() as session:
+        print_result("MenuCosting.load (penuh)", timeit(lambda: MenuCosting.load(session), repeat=10))
+        costing = get_costing(session)
+
+        prices = iter(range(10**6))
+
+        def change_one_price():
+            harga = 2000 + next(prices)
+            session.execute(update(BahanBaku).where(BahanBaku.bahan_id == "B7").values(harga_bahan=harga))
+            session.commit()
+            get_costing(session)
+
+        print_result("ubah 1 harga + sinkron inkremental", timeit(change_one_price, repeat=50))
+        print_result("get_costing tanpa perubahan", timeit(lambda: get_costing(session), repeat=200))
+
+        fresh = MenuCosting.load(session)
+        assert np.allclose(costing.biaya, fresh.biaya), "hasil inkremental berbeda dari hitung ulang"
+        print(f"{costing.matrix.n_menu} menu x {costing.matrix.n_bahan} bahan, "
+              f"{len(costing.matrix.qty)} entri komposisi: hasil inkremental = hitung ulang penuh")
+
+
+if __name__ == "__main__":
+    main()
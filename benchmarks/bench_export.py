@@ -0,0 +1,99 @@
+# benchmarks/bench_export.py
+
+"""Waktu dan memori puncak ekspor transaksi+detail+menu sebanyak 1 juta baris.
+
+Setiap mode dijalankan di proses terpisah agar RSS puncak (ru_maxrss) hanya
+mencerminkan ekspor itu sendiri:
+  naive   : DataFrame penuh lalu df.to_csv().encode() (cara lama tombol Download CSV)
+  csv     : export.export_csv bertahap
+  parquet : export.export_parquet bertahap
+
+Jalankan: python benchmarks/bench_export.py
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from _common import scratch_db_url, seed_catalog
+
+N_DETAIL = 1_000_000
+LINES_PER_ORDER = 4
+
+
+def seed(url):
+    from sqlalchemy.orm import sessionmaker
+
+    from db_config import create_db_engine, init_db
+
+    engine = create_db_engine(url)
+    init_db(engine)
+    with sessionmaker(bind=engine)() as session:
+        seed_catalog(session)
+    n_orders = N_DETAIL // LINES_PER_ORDER
+    start = date(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO transaksi VALUES (?, ?, ?, ?, ?)",
+            [(f"T{i}", (start + timedelta(days=i % 365)).isoformat(), f"P{i % 100}", f"K{i % 10}", 100000)
+             for i in range(n_orders)])
+        conn.exec_driver_sql(
+            "INSERT INTO detail_transaksi (transaksi_id, menu_id, jumlah, harga) VALUES (?, ?, ?, ?)",
+            [(f"T{i // LINES_PER_ORDER}", f"M{i % 50}", 1 + i % 3, 25000) for i in range(N_DETAIL)])
+
+
+def run_mode(url, mode):
+    from sqlalchemy import event
+
+    from db_config import create_db_engine
+    from export import export_csv, export_parquet, export_query
+
+    import pandas as pd
+
+    engine = create_db_engine(url)
+
+    # Halaman mmap SQLite ikut terhitung di RSS; matikan agar yang terukur adalah heap ekspor
+    @event.listens_for(engine, "connect")
+    def disable_mmap(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA mmap_size=0")
+
+    with engine.connect():
+        pass
+    baseline_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    out = os.path.join(tempfile.mkdtemp(prefix="restorify_export_"), "out")
+    start = time.perf_counter()
+    if mode == "naive":
+        with engine.connect() as conn:
+            df = pd.read_sql(export_query("transaksi_detail"), conn)
+        data = df.to_csv(index=False).encode("utf-8")
+        rows = len(df)
+        with open(out, "wb") as handle:
+            handle.write(data)
+    elif mode == "csv":
+        rows = export_csv(engine, "transaksi_detail", out)
+    else:
+        rows = export_parquet(engine, "transaksi_detail", out)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    size_mb = os.path.getsize(out) / 1024 / 1024
+    print(f"{mode:<8} {rows} baris  {elapsed:6.2f} s  RSS puncak {peak_mb:7.1f} MB "
+          f"(+{peak_mb - baseline_mb:.1f} MB di atas baseline)  file {size_mb:6.1f} MB")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run_mode(sys.argv[2], sys.argv[3])
+        return
+    url = scratch_db_url()
+    print(f"Menyiapkan {N_DETAIL} baris detail_transaksi...")
+    seed(url)
+    for mode in ("naive", "csv", "parquet"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--run", url, mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
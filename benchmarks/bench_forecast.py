@@ -0,0 +1,82 @@
+# benchmarks/bench_forecast.py
+
+"""Perkiraan pemakaian bahan atas riwayat penjualan bertahun-tahun.
+
+Mengisi 3 tahun penjualan harian (rollup) untuk 300 menu, lalu mengukur
+pembangunan penuh pemakaian_bahan_harian, refresh inkremental satu hari baru,
+perhitungan titik pesan ulang, dan pembuatan draft pesanan sekaligus.
+Hasil pemakaian diverifikasi terhadap join SQL penjualan_harian x komposisi_menu.
+
+Jalankan: python benchmarks/bench_forecast.py
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from _common import print_result, scratch_db_url, seed_catalog
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from forecast import create_draft_orders, refresh_usage, reorder_plan
+from models import KomposisiMenu, PemakaianBahanHarian, PenjualanHarian
+
+N_MENU = 300
+N_BAHAN = 150
+YEARS = 3
+END = date(2024, 12, 31)
+
+
+def seed_sales(session, days):
+    rng = random.Random(3)
+    session.execute(insert(PenjualanHarian), [
+        {"tanggal": day, "menu_id": f"M{m}",
+         "pendapatan": 0, "jumlah_order": 1, "jumlah_item": rng.randint(2, 10) * (2 if day.weekday() >= 5 else 1)}
+        for day in days for m in range(N_MENU) if rng.random() < 0.5
+    ])
+    session.commit()
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    value = fn()
+    print_result(label, {"ms": (time.perf_counter() - start) * 1000})
+    return value
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    days = [END - timedelta(days=d) for d in range(365 * YEARS)][::-1]
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU, n_bahan=N_BAHAN, stock=200)
+        seed_sales(session, days[:-1])
+        n_sales = session.scalar(select(func.count()).select_from(PenjualanHarian))
+        print(f"{n_sales} baris penjualan_harian, {len(days)} hari")
+
+        written = timed("refresh_usage penuh", lambda: refresh_usage(session, full=True))
+        session.commit()
+
+        total_sql = session.scalar(
+            select(func.sum(PenjualanHarian.jumlah_item * KomposisiMenu.jumlah_bahan))
+            .join(KomposisiMenu, KomposisiMenu.menu_id == PenjualanHarian.menu_id)
+        )
+        total_usage = session.scalar(select(func.sum(PemakaianBahanHarian.jumlah)))
+        assert total_sql == total_usage, (total_sql, total_usage)
+        print(f"{written} baris pemakaian, total sama dengan join SQL")
+
+        seed_sales(session, days[-1:])
+        timed("refresh_usage inkremental (1 hari)", lambda: refresh_usage(session))
+        session.commit()
+
+        plan = timed("reorder_plan", lambda: reorder_plan(session, END + timedelta(days=1)))
+        print(f"{int((plan['saran_pesan'] > 0).sum())} bahan perlu dipesan")
+        orders = timed("create_draft_orders", lambda: create_draft_orders(session, plan, END))
+        print(f"{len(orders)} draft pesanan dibuat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_import.py
+
+"""Impor riwayat penjualan besar lewat importer.import_file().
+
+Membuat file CSV berisi N_LINES baris detail (LINES_PER_TRANSAKSI baris per
+transaksi, tersebar selama N_DAYS hari) ditambah beberapa baris rusak, lalu
+mengukur validasi + bulk insert per potongan + rebuild rollup + refresh
+pemakaian bahan. Setelah itu memeriksa jumlah baris, total rollup terhadap
+detail_transaksi, dan bahwa baris rusak ditolak dengan alasannya. Juga mengukur
+upsert data master (pelanggan) yang diimpor dua kali.
+
+Jalankan: python benchmarks/bench_import.py
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from _common import print_result, scratch_db_url, seed_catalog
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from importer import import_file
+from models import DetailTransaksi, Pelanggan, PenjualanHarian, Transaksi
+
+N_LINES = 1_000_000
+LINES_PER_TRANSAKSI = 4
+N_DAYS = 730
+N_MENU = 50
+N_PELANGGAN_IMPORT = 100_000
+DIGITS = np.array(list("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+
+def base36_ids(prefix, n):
+    # Awalan + 4 digit basis 36 agar muat di kolom ID VARCHAR(5)
+    k = np.arange(n)
+    return np.char.add(prefix, ["".join(d) for d in zip(*(DIGITS[(k // 36 ** p) % 36] for p in (3, 2, 1, 0)))])
+
+
+def history_csv(path):
+    rng = np.random.default_rng(3)
+    n_tx = N_LINES // LINES_PER_TRANSAKSI
+    tx = np.repeat(np.arange(n_tx), LINES_PER_TRANSAKSI)
+    tanggal = pd.Timestamp("2022-01-01") + pd.to_timedelta(np.sort(rng.integers(0, N_DAYS, n_tx)), unit="D")
+    frame = pd.DataFrame({
+        "transaksi_id": base36_ids("H", n_tx)[tx],
+        "tanggal_pembelian": tanggal.strftime("%Y-%m-%d")[tx],
+        "pelanggan_id": [f"P{i}" for i in rng.integers(0, 100, n_tx)[tx]],
+        "karyawan_id": [f"K{i}" for i in rng.integers(0, 10, n_tx)[tx]],
+        # Menu berbeda dalam satu transaksi: geser dari menu awal transaksi
+        "menu_id": [f"M{i}" for i in (rng.integers(0, N_MENU, n_tx)[tx] + np.arange(N_LINES) % 4) % N_MENU],
+        "jumlah": rng.integers(1, 4, N_LINES),
+        "harga": "",
+    })
+    bad = pd.DataFrame({
+        "transaksi_id": ["ZBAD1", "ZBAD2", "ZBAD3"], "tanggal_pembelian": ["2023-13-01", "2023-01-01", "2023-01-01"],
+        "pelanggan_id": ["P1", "P404", "P1"], "karyawan_id": ["K1", "K1", "K1"],
+        "menu_id": ["M1", "M1", "M1"], "jumlah": ["1", "1", "dua"], "harga": ["", "", ""],
+    })
+    pd.concat([frame, bad]).to_csv(path, index=False)
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    directory = os.path.dirname(engine.url.database)
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU)
+
+        path = os.path.join(directory, "riwayat.csv")
+        history_csv(path)
+        start = time.perf_counter()
+        hasil = import_file(session, "transaksi", path)
+        print_result(f"impor {N_LINES} baris detail", {"detik": time.perf_counter() - start,
+                                                       "potongan": hasil.potongan})
+
+        assert hasil.diterima == N_LINES, hasil.diterima
+        assert sorted(hasil.ditolak["transaksi_id"]) == ["ZBAD1", "ZBAD2", "ZBAD3"], hasil.ditolak
+        n_detail = session.scalar(select(func.count()).select_from(DetailTransaksi))
+        n_transaksi = session.scalar(select(func.count()).select_from(Transaksi))
+        assert n_detail == N_LINES and n_transaksi == N_LINES // LINES_PER_TRANSAKSI
+        detail_total = session.scalar(select(func.sum(DetailTransaksi.harga)))
+        header_total = session.scalar(select(func.sum(Transaksi.total_transaksi)))
+        rollup_total = session.scalar(select(func.sum(PenjualanHarian.pendapatan)))
+        assert detail_total == header_total == rollup_total, (detail_total, header_total, rollup_total)
+        print(f"{n_transaksi} transaksi, {n_detail} detail; total header = detail = rollup")
+        print(hasil.ditolak[["transaksi_id", "baris", "alasan"]].to_string(index=False))
+
+        pelanggan = pd.DataFrame({
+            "pelanggan_id": base36_ids("Q", N_PELANGGAN_IMPORT),
+            "cus_name": [f"Pelanggan {i}" for i in range(N_PELANGGAN_IMPORT)],
+            "contact_info": "0812",
+        })
+        path = os.path.join(directory, "pelanggan.csv")
+        pelanggan.to_csv(path, index=False)
+        for label in ["impor pelanggan (baru)", "impor pelanggan (upsert ulang)"]:
+            start = time.perf_counter()
+            import_file(session, "pelanggan", path)
+            print_result(label, {"detik": time.perf_counter() - start})
+        n_pelanggan = session.scalar(select(func.count()).select_from(Pelanggan))
+        assert n_pelanggan == N_PELANGGAN_IMPORT + 100, n_pelanggan
+
+
+if __name__ == "__main__":
+    main()
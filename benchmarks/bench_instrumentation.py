@@ -0,0 +1,84 @@
+# benchmarks/bench_instrumentation.py
+
+"""Overhead instrumentation.instrument() pada query kecil dan halaman daftar.
+
+Mengukur lookup per primary key, satu halaman daftar Transaksi, dan SELECT 10 ribu
+baris tanpa dan dengan instrumentasi secara bergantian (ROUNDS putaran, p50
+terbaik dari setiap mode) di database yang sama.
+Setelah itu memeriksa jumlah panggilan dan baris yang tercatat, serta bahwa
+lookup berulang di dalam satu page_scope ditandai sebagai pola N+1.
+
+Jalankan: python benchmarks/bench_instrumentation.py
+"""
+
+from datetime import date, timedelta
+
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+import instrumentation
+from views.transaksi import TRANSAKSI_LIST
+from db_config import create_db_engine, init_db
+from models import Pelanggan, Transaksi
+from pagination import fetch_page
+
+N_TRANSAKSI = 50_000
+ROUNDS = 3
+REPEAT = 100
+
+
+def cases(session):
+    return {
+        "lookup pelanggan per PK": lambda: session.execute(
+            select(Pelanggan.cus_name).where(Pelanggan.pelanggan_id == "P7")).scalar(),
+        "halaman daftar transaksi": lambda: fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True),
+        "SELECT 10 ribu baris": lambda: session.execute(
+            select(Transaksi.transaksi_id, Transaksi.total_transaksi).limit(10_000)).all(),
+    }
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session)
+        start = date(2024, 1, 1)
+        session.execute(insert(Transaksi), [
+            {"transaksi_id": f"T{i}", "tanggal_pembelian": start + timedelta(days=i % 365),
+             "pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{i % 10}", "total_transaksi": 25000}
+            for i in range(N_TRANSAKSI)
+        ])
+        session.commit()
+
+    with Session() as session:
+        for label, fn in cases(session).items():
+            best = {"tanpa_ms": float("inf"), "dengan_ms": float("inf")}
+            for _ in range(ROUNDS):
+                best["tanpa_ms"] = min(best["tanpa_ms"], timeit(fn, repeat=REPEAT)["p50_ms"])
+                instrumentation.instrument(engine)
+                with instrumentation.page_scope(label):
+                    best["dengan_ms"] = min(best["dengan_ms"], timeit(fn, repeat=REPEAT)["p50_ms"])
+                instrumentation.uninstrument(engine)
+            print_result(label, dict(best, overhead_us=(best["dengan_ms"] - best["tanpa_ms"]) * 1000))
+
+        stats = {(s["halaman"], s["bentuk"][:30]): s for s in instrumentation.snapshot()["statement"]}
+        rows = stats[("SELECT 10 ribu baris", "SELECT transaksi.transaksi_id,")]
+        calls = ROUNDS * (REPEAT + 3)
+        assert rows["panggilan"] == calls and rows["baris"] == calls * 10_000, rows
+
+        instrumentation.instrument(engine)
+
+        with instrumentation.page_scope("manage_n_plus_1"):
+            for i in range(20):
+                session.get(Pelanggan, f"P{i}")
+        findings = instrumentation.snapshot()["n_plus_1"]
+        assert [(f["halaman"], f["maks_per_rerun"]) for f in findings if f["halaman"] == "manage_n_plus_1"] \
+            == [("manage_n_plus_1", 20)], findings
+        print("panggilan dan baris tercatat sesuai; lookup berulang ditandai N+1")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_pagination.py
+
+"""Latensi paginasi keyset daftar Transaksi pada beberapa ukuran tabel.
+
+Waktu per halaman seharusnya hampir sama untuk halaman pertama maupun halaman
+yang jauh di belakang, dan tidak bergantung pada jumlah baris tabel.
+
+Jalankan: python benchmarks/bench_pagination.py
+"""
+
+from datetime import date, timedelta
+
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from views.transaksi import TRANSAKSI_LIST
+from db_config import create_db_engine, init_db
+from migrations import analyze
+from models import Transaksi
+from pagination import build_filters, fetch_page
+
+SIZES = [10_000, 200_000]
+PAGE_SIZE = 50
+
+
+def bench_size(n_rows):
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session)
+        start = date(2024, 1, 1)
+        session.execute(insert(Transaksi), [
+            {"transaksi_id": f"T{i}", "tanggal_pembelian": start + timedelta(days=i % 365),
+             "pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{i % 10}", "total_transaksi": 25000}
+            for i in range(n_rows)
+        ])
+        session.commit()
+    analyze(engine)
+
+    session = Session()
+    filters = build_filters(TRANSAKSI_LIST, (date(2024, 3, 1), date(2024, 9, 30)), "K3")
+    first = fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True, filters, None, PAGE_SIZE)
+    # Cursor jauh di belakang: lompati banyak halaman dengan ukuran halaman besar
+    deep_cursor = fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True, filters,
+                             None, n_rows // 40).next_cursor
+
+    print_result(f"{n_rows} baris, halaman pertama", timeit(
+        lambda: fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True, filters, None, PAGE_SIZE)))
+    print_result(f"{n_rows} baris, halaman berikutnya", timeit(
+        lambda: fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True, filters,
+                           first.next_cursor, PAGE_SIZE)))
+    print_result(f"{n_rows} baris, halaman jauh", timeit(
+        lambda: fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", True, filters,
+                           deep_cursor, PAGE_SIZE)))
+    session.close()
+
+
+def main():
+    for n_rows in SIZES:
+        bench_size(n_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_payroll.py
+
+"""Penggajian bulanan untuk ribuan karyawan.
+
+Mengisi jadwal mingguan (sebagian karyawan tanpa jadwal) dan absensi satu bulan
+untuk N_KARYAWAN karyawan, lalu mengukur payroll.run_payroll() (hitung + hapus +
+satu bulk insert). Dijalankan dua kali untuk memastikan hasil sama dan tidak ada baris ganda. Juga memeriksa
+hasil beberapa karyawan terhadap perhitungan manual per orang.
+
+Jalankan: python benchmarks/bench_payroll.py
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from _common import print_result, scratch_db_url
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from models import Absensi, JadwalKerja, Karyawan, Penggajian
+from payroll import HARI, POSITION_RATES, STANDARD_HOURS, STANDARD_WORK_DAYS, run_payroll
+
+N_KARYAWAN = 5_000
+BULAN, TAHUN = 3, 2024
+POSITIONS = list(POSITION_RATES)
+
+
+def seed(session):
+    rng = random.Random(11)
+    session.execute(insert(Karyawan), [
+        {"karyawan_id": f"K{i}", "employee_name": f"Karyawan {i}", "position": POSITIONS[i % len(POSITIONS)]}
+        for i in range(N_KARYAWAN)
+    ])
+    jadwal = []
+    for i in range(N_KARYAWAN):
+        if i % 50 == 49:
+            continue  # belum punya jadwal: hanya prorata gaji pokok, tanpa lembur
+        libur = i % 7
+        pulang = "18:00" if i % 5 == 0 else "16:00"
+        jadwal += [{"karyawan_id": f"K{i}", "hari": hari, "jam_masuk": "08:00", "jam_pulang": pulang}
+                   for d, hari in enumerate(HARI) if d != libur]
+    session.execute(insert(JadwalKerja), jadwal)
+    start = date(TAHUN, BULAN, 1)
+    session.execute(insert(Absensi), [
+        {"karyawan_id": f"K{i}", "tanggal": start + timedelta(days=d),
+         "status": "Hadir" if rng.random() < 0.9 else "Sakit"}
+        for i in range(N_KARYAWAN) for d in range(31)
+    ])
+    session.commit()
+
+
+def manual(session, karyawan_id):
+    # Perhitungan per orang dengan ORM, hanya untuk verifikasi
+    karyawan = session.get(Karyawan, karyawan_id)
+    jadwal = {j.hari: j for j in karyawan.jadwal_kerja}
+    hadir = {a.tanggal for a in karyawan.absensi if a.status == "Hadir" and a.tanggal.month == BULAN}
+    terjadwal = hadir_terjadwal = lembur = 0
+    for d in range(31):
+        tanggal = date(TAHUN, BULAN, 1) + timedelta(days=d)
+        j = jadwal.get(HARI[tanggal.weekday()])
+        if j:
+            terjadwal += 1
+            if tanggal in hadir:
+                hadir_terjadwal += 1
+                jam = int(j.jam_pulang[:2]) - int(j.jam_masuk[:2])
+                lembur += max(jam - STANDARD_HOURS, 0)
+        elif tanggal in hadir:
+            lembur += STANDARD_HOURS
+    pokok, tarif = POSITION_RATES[karyawan.position]
+    if not jadwal:
+        return round(pokok * min(len(hadir) / STANDARD_WORK_DAYS, 1), 2)
+    return round(pokok * hadir_terjadwal / terjadwal, 2) + lembur * tarif
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed(session)
+        n_absensi = session.scalar(select(func.count()).select_from(Absensi))
+        print(f"{N_KARYAWAN} karyawan, {n_absensi} baris absensi")
+
+        start = time.perf_counter()
+        first = run_payroll(session, BULAN, TAHUN)
+        print_result("run_payroll (pertama)", {"ms": (time.perf_counter() - start) * 1000})
+        start = time.perf_counter()
+        second = run_payroll(session, BULAN, TAHUN)
+        print_result("run_payroll (ulang)", {"ms": (time.perf_counter() - start) * 1000})
+
+        rows = session.scalar(select(func.count()).select_from(Penggajian))
+        assert rows == N_KARYAWAN, rows
+        assert first["jumlah_gaji"].equals(second["jumlah_gaji"])
+        hasil = dict(zip(first["karyawan_id"], first["jumlah_gaji"]))
+        for karyawan_id in ["K0", "K1", "K5", "K49", "K123", "K4999"]:
+            assert abs(hasil[karyawan_id] - manual(session, karyawan_id)) < 0.01, karyawan_id
+        print(f"{rows} baris penggajian setelah dijalankan dua kali; sampel cocok dengan perhitungan manual")
+
+
+if __name__ == "__main__":
+    main()
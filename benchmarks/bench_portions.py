@@ -0,0 +1,58 @@
+# benchmarks/bench_portions.py
+
+"""Indeks porsi tersedia untuk ribuan menu dan bahan.
+
+Mengukur pembuatan indeks penuh, sinkronisasi inkremental setelah satu checkout
+(hanya menu yang memakai bahan yang stoknya berubah), dan pengecekan keranjang
+di memori. Hasil inkremental diverifikasi sama dengan pembuatan ulang penuh.
+
+Jalankan: python benchmarks/bench_portions.py
+"""
+
+from datetime import date
+from itertools import count
+
+import numpy as np
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy.orm import sessionmaker
+
+from checkout import checkout
+from db_config import create_db_engine, init_db
+from portions import PortionIndex, get_portions
+
+N_MENU = 5_000
+N_BAHAN = 2_000
+BAHAN_PER_MENU = 8
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU, n_bahan=N_BAHAN, bahan_per_menu=BAHAN_PER_MENU,
+                     stock=1_000_000)
+
+    with Session() as session:
+        print_result("PortionIndex.load (penuh)", timeit(lambda: PortionIndex.load(session), repeat=10))
+        index = get_portions(session)
+
+        ids = count()
+
+        def checkout_then_sync():
+            checkout(session, f"T{next(ids)}", date(2024, 1, 1), "P1", "K1", {"M42": 1, "M1234": 2})
+            get_portions(session)
+
+        print_result("checkout + sinkron inkremental", timeit(checkout_then_sync, repeat=50))
+        print_result("get_portions tanpa perubahan", timeit(lambda: get_portions(session), repeat=200))
+        print_result("cek keranjang 10 menu di memori", timeit(
+            lambda: index.shortages({f"M{i}": 2 for i in range(0, 1000, 100)}), repeat=200))
+
+        fresh = PortionIndex.load(session)
+        assert np.array_equal(index.porsi, fresh.porsi), "hasil inkremental berbeda dari hitung ulang"
+        print(f"{N_MENU} menu x {N_BAHAN} bahan: hasil inkremental = hitung ulang penuh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_purchasing.py
+
+"""Penerimaan barang pesanan bahan: latensi untuk 500 baris dan keamanan konkuren.
+
+Bagian pertama mengukur purchasing.receive() untuk pesanan 500 baris. Bagian
+kedua menjalankan checkout dan penerimaan barang bersamaan di beberapa thread
+pada bahan yang sama, lalu memeriksa bahwa stok akhir = stok awal - pemakaian
+checkout yang berhasil + barang yang diterima.
+
+Jalankan: python benchmarks/bench_purchasing.py
+"""
+
+import threading
+from datetime import date
+from itertools import count
+
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from checkout import CheckoutError, checkout
+from db_config import create_db_engine, init_db
+from models import BahanBaku, KomposisiMenu
+from purchasing import STATUS_DIPESAN, create_orders, receive
+
+N_BAHAN = 600
+LINES = 500
+N_THREADS = 4
+OPS_PER_THREAD = 100
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_menu=50, n_bahan=N_BAHAN, stock=1000)
+
+    lines = [(f"B{i}", 5, 1000) for i in range(LINES)]
+    with Session() as session:
+        def receive_new_order():
+            ids = create_orders(session, date(2024, 1, 1), {"S1": lines}, status=STATUS_DIPESAN)
+            return ids["S1"]
+
+        pending = iter([receive_new_order() for _ in range(60)])
+        print_result(f"receive() {LINES} baris", timeit(lambda: receive(session, next(pending)),
+                                                         repeat=50, warmup=5))
+
+    # Konkuren: checkout dan penerimaan barang pada bahan yang sama
+    with Session() as session:
+        stok_awal = session.scalar(select(func.sum(BahanBaku.stock)))
+        per_menu = dict(session.execute(
+            select(KomposisiMenu.menu_id, func.sum(KomposisiMenu.jumlah_bahan)).group_by(KomposisiMenu.menu_id)
+        ).all())
+    ids = count()
+    lock = threading.Lock()
+    terpakai = [0]
+    diterima = [0]
+    errors = []
+
+    def worker(n):
+        session = Session()
+        for k in range(OPS_PER_THREAD):
+            try:
+                if k % 10 == 0:
+                    order = create_orders(session, date(2024, 1, 2), {"S1": [("B1", 7, 1000), ("B2", 3, 1000)]},
+                                          status=STATUS_DIPESAN)
+                    receive(session, order["S1"])
+                    with lock:
+                        diterima[0] += 10
+                else:
+                    menu_id = f"M{(n * 7 + k) % 50}"
+                    with lock:
+                        transaksi_id = f"T{next(ids)}"
+                    checkout(session, transaksi_id, date(2024, 1, 2), "P1", "K1", {menu_id: 1})
+                    with lock:
+                        terpakai[0] += per_menu[menu_id]
+            except (CheckoutError, OperationalError) as exc:
+                errors.append(exc)
+        session.close()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(N_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with Session() as session:
+        stok_akhir = session.scalar(select(func.sum(BahanBaku.stock)))
+    assert stok_akhir == stok_awal - terpakai[0] + diterima[0], (stok_awal, terpakai, diterima, stok_akhir)
+    print(f"{N_THREADS} thread x {OPS_PER_THREAD} operasi: stok akhir konsisten "
+          f"(-{terpakai[0]} checkout, +{diterima[0]} diterima, {len(errors)} operasi gagal)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_reference_cache.py
+
+"""Membandingkan pengisian selectbox ID pelanggan: ORM .all() vs cache berversi.
+
+Jalankan: python benchmarks/bench_reference_cache.py
+"""
+
+from _common import print_result, scratch_db_url, timeit
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from models import Pelanggan
+from utils import get_reference_ids
+
+N_PELANGGAN = 50000
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.execute(insert(Pelanggan), [
+            {"pelanggan_id": f"P{i}", "cus_name": f"Pelanggan {i}", "contact_info": "08123"}
+            for i in range(N_PELANGGAN)
+        ])
+        session.commit()
+
+    def orm_all():
+        with Session() as session:
+            [p.pelanggan_id for p in session.query(Pelanggan).all()]
+
+    def cached():
+        with Session() as session:
+            get_reference_ids(session, Pelanggan)
+
+    print_result(f"ORM .all() ({N_PELANGGAN} pelanggan)", timeit(orm_all, repeat=10))
+    print_result("get_reference_ids (cache berversi)", timeit(cached, repeat=10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_reports.py
+
+"""Waktu pembuatan laporan penjualan pada 1 juta baris detail_transaksi.
+
+Membandingkan agregasi langsung atas detail_transaksi dengan laporan dari
+tabel rollup (tanpa cache dan dengan cache). Target: di bawah 300 ms.
+Kardinalitas mendekati restoran ramai: N_MENU menu dan N_KARYAWAN kasir yang
+bergiliran, sehingga ukuran tabel rollup ikut tercatat.
+
+Jalankan: python benchmarks/bench_reports.py
+"""
+
+import random
+from datetime import date, timedelta
+
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+import rollup
+from db_config import create_db_engine, init_db
+from migrations import analyze
+from models import DetailTransaksi, Transaksi
+from reports import REPORT_TABLES, sales_report
+from utils import bump_table_version
+
+N_LINES = 1_000_000
+LINES_PER_ORDER = 4
+N_DAYS = 365
+N_MENU = 300
+N_KARYAWAN = 60
+BATCH = 50_000
+
+
+def seed(Session):
+    rng = random.Random(7)
+    start = date(2024, 1, 1)
+    n_orders = N_LINES // LINES_PER_ORDER
+    with Session() as session:
+        seed_catalog(session, n_menu=N_MENU, n_karyawan=N_KARYAWAN)
+        for offset in range(0, n_orders, BATCH):
+            orders = range(offset, min(offset + BATCH, n_orders))
+            session.execute(insert(Transaksi), [
+                {"transaksi_id": f"T{i}", "tanggal_pembelian": start + timedelta(days=i % N_DAYS),
+                 "pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{rng.randrange(N_KARYAWAN)}", "total_transaksi": 0}
+                for i in orders
+            ])
+            session.execute(insert(DetailTransaksi), [
+                {"transaksi_id": f"T{i}", "menu_id": f"M{rng.randrange(N_MENU)}",
+                 "jumlah": rng.randint(1, 3), "harga": 10000 * rng.randint(1, 3)}
+                for i in orders for j in range(LINES_PER_ORDER)
+            ])
+        session.commit()
+        rollup.rebuild(session)
+        session.commit()
+
+
+def naive_report(session, start, end):
+    # Agregasi langsung atas tabel detail (tanpa rollup), sebagai pembanding
+    in_range = (Transaksi.tanggal_pembelian >= start, Transaksi.tanggal_pembelian <= end)
+    joined = select(DetailTransaksi).join(Transaksi, Transaksi.transaksi_id == DetailTransaksi.transaksi_id)
+    session.execute(joined.with_only_columns(
+        Transaksi.tanggal_pembelian, func.sum(DetailTransaksi.harga)
+    ).where(*in_range).group_by(Transaksi.tanggal_pembelian)).all()
+    session.execute(joined.with_only_columns(
+        DetailTransaksi.menu_id, func.sum(DetailTransaksi.jumlah)
+    ).where(*in_range).group_by(DetailTransaksi.menu_id)).all()
+    session.execute(joined.with_only_columns(
+        Transaksi.karyawan_id, func.sum(DetailTransaksi.harga)
+    ).where(*in_range).group_by(Transaksi.karyawan_id)).all()
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session)
+    analyze(engine)
+
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+    with Session() as session:
+        for table in REPORT_TABLES[:2]:
+            print(f"{table}: {session.execute(text(f'SELECT count(*) FROM {table}')).scalar()} baris")
+        print_result("detail_transaksi langsung (1 tahun)", timeit(
+            lambda: naive_report(session, start, end), repeat=3, warmup=1))
+
+        def cold():
+            bump_table_version(*REPORT_TABLES)
+            return sales_report(session, start, end)
+
+        print_result("rollup, tanpa cache (1 tahun)", timeit(cold, repeat=20))
+        print_result("rollup, dari cache (1 tahun)", timeit(
+            lambda: sales_report(session, start, end), repeat=200))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_repositories.py
+
+"""Objek ORM vs baris NamedTuple dari repositories untuk N baris yang sama.
+
+Untuk pelanggan dan transaksi, N_ROWS baris diambil berdasarkan ID dengan:
+- ORM: select(Model) berdasarkan ID, objeknya tetap di identity map sesi
+- repositories: get_many() (SELECT kolom, batch IN) yang mengembalikan NamedTuple
+Dicatat waktu (timeit) dan memori puncak per baris menurut tracemalloc selama
+hasilnya masih dipegang dan sesinya masih terbuka.
+
+Jalankan: python benchmarks/bench_repositories.py
+"""
+
+import tracemalloc
+from datetime import date
+
+from _common import print_result, scratch_db_url, seed_catalog, timeit
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from models import Pelanggan, Transaksi
+from repositories import base, pelanggan as pelanggan_repo, transaksi as transaksi_repo
+
+N_ROWS = 20000
+
+
+def orm_get_many(session, model, ids):
+    pk = base.primary_key(model)
+    objects = []
+    for batch in base.batches(ids):
+        objects.extend(session.scalars(select(model).where(pk.in_(batch))))
+    return objects
+
+
+def peak_bytes_per_row(Session, load):
+    with Session() as session:
+        tracemalloc.start()
+        rows = load(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(rows) == N_ROWS
+    return peak / N_ROWS
+
+
+def main():
+    engine = create_db_engine(scratch_db_url("repositories"))
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        seed_catalog(session, n_pelanggan=N_ROWS)
+        session.execute(insert(Transaksi), [
+            {"transaksi_id": f"T{i}", "tanggal_pembelian": date(2024, 1, 1 + i % 28),
+             "pelanggan_id": f"P{i}", "karyawan_id": f"K{i % 10}", "total_transaksi": 10000 + i}
+            for i in range(N_ROWS)
+        ])
+        session.commit()
+
+    cases = {
+        "pelanggan": (Pelanggan, pelanggan_repo, [f"P{i}" for i in range(N_ROWS)]),
+        "transaksi": (Transaksi, transaksi_repo, [f"T{i}" for i in range(N_ROWS)]),
+    }
+    for name, (model, repo, ids) in cases.items():
+        def orm(session, model=model, ids=ids):
+            return orm_get_many(session, model, ids)
+
+        def rows(session, repo=repo, ids=ids):
+            return repo.get_many(session, ids)
+
+        for label, load in (("ORM", orm), ("repositories", rows)):
+            def run(load=load):
+                with Session() as session:
+                    load(session)
+
+            result = timeit(run, repeat=10)
+            result["byte_per_baris"] = peak_bytes_per_row(Session, load)
+            print_result(f"{name} {N_ROWS} baris, {label}", result)
+
+
+if __name__ == "__main__":
+    main()
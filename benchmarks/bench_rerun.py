@@ -0,0 +1,83 @@
+# benchmarks/bench_rerun.py
+
+"""Membandingkan latensi bagian database dari satu rerun Streamlit.
+
+"Sebelum": engine echo=True, Base.metadata.create_all di setiap rerun.
+"Sesudah": profil production (WAL, pragma, pool) dan init_db() sekali per proses.
+
+Jalankan: python benchmarks/bench_rerun.py
+"""
+
+import contextlib
+import io
+import logging
+
+from _common import print_result, scratch_db_url, timeit
+
+from sqlalchemy.orm import sessionmaker
+
+from db_config import Base, create_db_engine, init_db
+from models import Karyawan, Menu, Pelanggan
+
+N_PELANGGAN = 2000
+
+
+def seed(engine):
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add_all(Pelanggan(pelanggan_id=f"P{i}", cus_name=f"Pelanggan {i}", contact_info="08123")
+                        for i in range(N_PELANGGAN))
+        session.add_all(Karyawan(karyawan_id=f"K{i}", employee_name=f"Karyawan {i}", position="Cashier")
+                        for i in range(20))
+        session.add_all(Menu(menu_id=f"M{i}", nama_menu=f"Menu {i}", harga=10000) for i in range(50))
+        session.commit()
+
+
+def make_rerun(engine, per_rerun_schema, with_queries=True):
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def rerun():
+        if per_rerun_schema:
+            Base.metadata.create_all(bind=engine)
+        else:
+            init_db(engine)
+        session = Session()
+        if not with_queries:
+            session.close()
+            return
+        # Pola query form Transaksi: daftar pelanggan, karyawan, dan menu
+        [p.pelanggan_id for p in session.query(Pelanggan).all()]
+        [k.karyawan_id for k in session.query(Karyawan).all()]
+        [m.menu_id for m in session.query(Menu).all()]
+        session.close()
+
+    return rerun
+
+
+def main():
+    url = scratch_db_url()
+    seed(create_db_engine(url, "production"))
+
+    before = create_db_engine(url, "debug")
+    after = create_db_engine(url, "production")
+
+    # Log echo=True tetap diproduksi (seperti di server) tetapi dibuang dari layar
+    sink = io.StringIO()
+    for handler in logging.getLogger("sqlalchemy.engine.Engine").handlers:
+        handler.setStream(sink)
+    with contextlib.redirect_stdout(sink):
+        setup_before = timeit(make_rerun(before, per_rerun_schema=True, with_queries=False))
+        result_before = timeit(make_rerun(before, per_rerun_schema=True))
+    setup_after = timeit(make_rerun(after, per_rerun_schema=False, with_queries=False))
+    result_after = timeit(make_rerun(after, per_rerun_schema=False))
+
+    print_result("setup sebelum (echo + create_all)", setup_before)
+    print_result("setup sesudah (init_db sekali)", setup_after)
+    print_result("rerun sebelum (setup + form Transaksi)", result_before)
+    print_result("rerun sesudah (setup + form Transaksi)", result_after)
+    print(f"percepatan p50: {result_before['p50_ms'] / result_after['p50_ms']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
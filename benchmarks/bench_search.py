@@ -0,0 +1,77 @@
+# benchmarks/bench_search.py
+
+"""Pencarian pelanggan untuk selectbox: daftar ID penuh vs LIKE vs FTS5.
+
+Dengan N_PELANGGAN pelanggan bernama acak, satu ketikan pengguna diukur dengan:
+- daftar penuh: query get_reference_list() tanpa cache (daftar yang dulu dikirim
+  utuh ke selectbox) lalu disaring di Python
+- LIKE: WHERE cus_name LIKE '%q%' OR contact_info LIKE '%q%', scan seluruh tabel
+- FTS5: search.search(), awalan ID lalu kecocokan awalan kata dari indeks cari_pelanggan
+Juga dicatat biaya trigger sinkronisasi indeks pada insert massal.
+
+Jalankan: python benchmarks/bench_search.py
+"""
+
+import random
+
+from _common import print_result, scratch_db_url, timeit
+
+from sqlalchemy import insert, or_, select, text
+from sqlalchemy.orm import sessionmaker
+
+from db_config import create_db_engine, init_db
+from models import Pelanggan
+from search import search
+from utils import REFERENCE_COLUMNS
+
+N_PELANGGAN = 50000
+QUERIES = ["bu", "budi", "sari 0812", "P123", "wulan hartono"]
+FIRST = ["Budi", "Sari", "Wulan", "Agus", "Dewi", "Rina", "Joko", "Putri", "Andi", "Siti"]
+LAST = ["Santoso", "Hartono", "Wijaya", "Lestari", "Saputra", "Kurnia", "Pratama", "Utami"]
+
+
+def rows(start, n, rng):
+    return [{"pelanggan_id": f"P{i}", "cus_name": f"{rng.choice(FIRST)} {rng.choice(LAST)} {i}",
+             "contact_info": f"08{rng.randrange(10**9, 10**10)}"} for i in range(start, start + n)]
+
+
+def main():
+    engine = create_db_engine(scratch_db_url("search"))
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    rng = random.Random(1)
+
+    def insert_batch(start=[0]):
+        with Session() as session:
+            session.execute(insert(Pelanggan), rows(start[0], 1000, rng))
+            session.commit()
+        start[0] += 1000
+
+    print_result("insert 1000 pelanggan (dengan trigger FTS)", timeit(insert_batch, repeat=N_PELANGGAN // 1000 - 3))
+
+    with Session() as session:
+        for query in QUERIES:
+            def full_list(query=query):
+                needle = query.lower()
+                all_rows = session.execute(select(*REFERENCE_COLUMNS[Pelanggan])
+                                           .order_by(Pelanggan.pelanggan_id)).all()
+                return [row for row in all_rows if needle in str(tuple(row)).lower()][:20]
+
+            def like(query=query):
+                pattern = f"%{query}%"
+                return session.execute(
+                    select(Pelanggan.pelanggan_id, Pelanggan.cus_name)
+                    .where(or_(Pelanggan.cus_name.like(pattern), Pelanggan.contact_info.like(pattern)))
+                    .limit(20)).all()
+
+            def fts(query=query):
+                return search(session, Pelanggan, query)
+
+            for label, fn in (("daftar penuh", full_list), ("LIKE", like), ("FTS5", fts)):
+                print_result(f"'{query}', {label}", timeit(fn, repeat=20))
+        count = session.execute(text("SELECT count(*) FROM cari_pelanggan")).scalar_one()
+        assert count == N_PELANGGAN, count
+
+
+if __name__ == "__main__":
+    main()
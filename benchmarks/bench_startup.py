@@ -0,0 +1,124 @@
+# benchmarks/bench_startup.py
+
+"""Waktu cold start dan waktu rerun per klik aplikasi Streamlit.
+
+Memakai streamlit.testing AppTest terhadap app.py dengan database dari datagen.py
+(--scale, atau --db untuk memakai salinan database yang sudah ada):
+- cold start: proses Python baru mengimpor Streamlit lalu menjalankan app.py
+  pertama kali (bootstrap, skema, halaman Beranda); median dari COLD_RUNS proses
+- kunjungan pertama: rerun saat sebuah halaman dibuka pertama kali (modul halaman
+  dan modul layanannya baru diimpor di sini)
+- rerun: klik berikutnya di halaman yang sama (p50 dari REPEAT rerun), beserta
+  waktu di dalam fungsi halaman menurut instrumentation.page_scope
+- navigasi: klik menu sidebar bolak-balik antara dua halaman yang sudah pernah dibuka
+
+AppTest mem-parse dan mengompilasi app.py di setiap run (seperti server setelah
+file berubah), jadi ukuran skrip utama ikut terukur.
+
+Jalankan: python benchmarks/bench_startup.py [--scale small] [--db path.db]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from _common import ROOT, print_result, scratch_db_url, timeit
+
+APP = os.path.join(ROOT, "app.py")
+COLD_RUNS = 3
+REPEAT = 20
+
+
+def cold_start():
+    """Dijalankan di proses anak: mencetak waktu impor Streamlit dan run pertama (JSON)."""
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    imported = time.perf_counter()
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    done = time.perf_counter()
+    assert not at.exception, at.exception
+    print(json.dumps({
+        "impor_streamlit_ms": (imported - start) * 1000,
+        "run_pertama_ms": (done - imported) * 1000,
+        "total_ms": (done - start) * 1000,
+    }))
+
+
+def measure_cold_start(env):
+    samples = []
+    for _ in range(COLD_RUNS):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--cold"], env=env,
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def measure_clicks(pages):
+    import instrumentation
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    navigation = at.sidebar.selectbox[0]
+
+    def run():
+        at.run()
+        assert not at.exception, at.exception
+
+    first_visit = {}
+    for label in pages:
+        start = time.perf_counter()
+        navigation.select(label).run()
+        first_visit[label] = (time.perf_counter() - start) * 1000
+        assert not at.exception, (label, at.exception)
+
+    results = {}
+    for label in pages:
+        navigation.select(label).run()
+        instrumentation.reset()
+        result = timeit(run, repeat=REPEAT, warmup=2)
+        page_ms = instrumentation.snapshot()["halaman"][0]["rata_rata_ms"]
+        results[label] = dict(kunjungan_pertama_ms=first_visit[label], **result, fungsi_halaman_ms=page_ms)
+
+    labels = iter(list(pages)[:2] * REPEAT)
+    navigate = timeit(lambda: navigation.select(next(labels)).run(), repeat=REPEAT * 2 - 2, warmup=2)
+    return results, navigate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start dan rerun per klik aplikasi Streamlit.")
+    parser.add_argument("--scale", default="small", help="skala datagen.py bila --db tidak diberikan")
+    parser.add_argument("--db", help="path database yang dipakai (disalin, tidak diubah)")
+    parser.add_argument("--cold", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.cold:
+        cold_start()
+        return
+
+    url = scratch_db_url("startup")
+    # db_config membaca URL saat diimpor, jadi harus diset sebelum app.py/datagen diimpor
+    os.environ["RESTORIFY_DATABASE_URL"] = url
+    if args.db:
+        import sqlalchemy
+        shutil.copyfile(args.db, sqlalchemy.engine.make_url(url).database)
+    else:
+        from datagen import generate
+        generate(url, args.scale, verbose=False).dispose()
+
+    from views import PAGES
+
+    print_result("cold start (impor + run pertama)", measure_cold_start(dict(os.environ)))
+    results, navigate = measure_clicks(PAGES)
+    for label, result in results.items():
+        print_result(f"rerun {label}", result)
+    print_result("navigasi antar halaman", navigate)
+    p50 = sorted(r["p50_ms"] for r in results.values())
+    print(f"rerun p50 median semua halaman: {statistics.median(p50):.1f} ms, terlama: {p50[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/check_query_counts.py
+
+"""Pemeriksaan jumlah query tampilan daftar: harus tetap, tidak tumbuh dengan jumlah baris.
+
+Untuk setiap tampilan (halaman daftar Transaksi/Feedback dengan nama pelanggan dan
+karyawan, objek Transaksi beserta detail dan menunya, komposisi menu beserta bahan,
+riwayat absensi dengan nama karyawan), query dihitung lewat
+instrumentation.page_scope pada N_SMALL dan N_LARGE baris dan harus sama dengan
+jumlah yang diharapkan. Juga memeriksa bahwa relasi yang tidak dideklarasikan
+gagal (raiseload) alih-alih memicu lazy load per baris, dan mencetak jumlah query
+versi lazy load sebagai pembanding.
+
+Jalankan: python benchmarks/check_query_counts.py
+"""
+
+import random
+from datetime import date, timedelta
+
+from _common import scratch_db_url, seed_catalog
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+import instrumentation
+from db_config import create_db_engine, init_db
+from models import Absensi, DetailTransaksi, Feedback, Karyawan, KomposisiMenu, Transaksi
+from pagination import fetch_page
+from utils import list_objects, list_rows
+from views.feedback import FEEDBACK_LIST
+from views.transaksi import TRANSAKSI_LIST
+
+N_SMALL = 10
+N_LARGE = 200
+
+
+def seed(Session):
+    rng = random.Random(11)
+    start = date(2024, 1, 1)
+    with Session() as session:
+        seed_catalog(session, n_menu=100, n_karyawan=N_LARGE)
+        session.execute(insert(Transaksi), [
+            {"transaksi_id": f"T{i}", "tanggal_pembelian": start + timedelta(days=i),
+             "pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{i}", "total_transaksi": 30000}
+            for i in range(N_LARGE)
+        ])
+        session.execute(insert(DetailTransaksi), [
+            {"transaksi_id": f"T{i}", "menu_id": f"M{(i + j) % 50}", "jumlah": 1, "harga": 10000}
+            for i in range(N_LARGE) for j in range(3)
+        ])
+        session.execute(insert(Feedback), [
+            {"pelanggan_id": f"P{i % 100}", "karyawan_id": f"K{i}", "tanggal": start + timedelta(days=i),
+             "rating": rng.randint(1, 5)}
+            for i in range(N_LARGE)
+        ])
+        session.execute(insert(Absensi), [
+            {"karyawan_id": f"K{i}", "tanggal": start, "status": "Hadir"} for i in range(N_LARGE)
+        ])
+        session.commit()
+
+
+def transaksi_objects(session, n):
+    rows = list_objects(session, Transaksi, ["pelanggan", "karyawan", "detail_transaksi.menu"],
+                        order_by=[Transaksi.tanggal_pembelian], limit=n)
+    return [(t.pelanggan.cus_name, t.karyawan.employee_name, [d.menu.nama_menu for d in t.detail_transaksi])
+            for t in rows]
+
+
+def komposisi_objects(session, n):
+    rows = list_objects(session, KomposisiMenu, ["bahan_baku"], order_by=[KomposisiMenu.menu_id], limit=n)
+    return [(k.menu_id, k.bahan_baku.nama_bahan) for k in rows]
+
+
+def absensi_rows(session, n):
+    return list_rows(session, [Absensi.absensi_id, Karyawan.employee_name], joins=[Absensi.karyawan],
+                     order_by=[Absensi.absensi_id.desc()], limit=n)
+
+
+def lazy_transaksi(session, n):
+    # Pembanding: lazy load default memicu satu query per relasi per baris
+    rows = session.scalars(select(Transaksi).order_by(Transaksi.tanggal_pembelian).limit(n)).all()
+    return [(t.pelanggan.cus_name, t.karyawan.employee_name) for t in rows]
+
+
+# nama -> (fungsi(session, n), jumlah query yang diharapkan)
+VIEWS = {
+    "halaman daftar transaksi": (
+        lambda session, n: fetch_page(session, TRANSAKSI_LIST, "Tanggal Pembelian", limit=n).rows, 1),
+    "halaman daftar feedback": (
+        lambda session, n: fetch_page(session, FEEDBACK_LIST, "Tanggal", limit=n).rows, 1),
+    "transaksi + pelanggan, karyawan, detail, menu": (transaksi_objects, 2),
+    "komposisi menu + bahan": (komposisi_objects, 1),
+    "riwayat absensi + nama karyawan": (absensi_rows, 1),
+}
+
+
+def count_queries(Session, fn, n):
+    with Session() as session, instrumentation.page_scope("check_query_counts") as rerun:
+        result = fn(session, n)
+    assert len(result) == n, (len(result), n)
+    return sum(rerun.shapes.values()), result
+
+
+def main():
+    engine = create_db_engine(scratch_db_url())
+    init_db(engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session)
+    instrumentation.instrument(engine)
+
+    for name, (fn, expected) in VIEWS.items():
+        counts = [count_queries(Session, fn, n)[0] for n in (N_SMALL, N_LARGE)]
+        print(f"{name:<48} {N_SMALL} baris: {counts[0]} query, {N_LARGE} baris: {counts[1]} query")
+        assert counts == [expected, expected], (name, counts, expected)
+
+    _, rows = count_queries(Session, VIEWS["halaman daftar transaksi"][0], N_SMALL)
+    assert all(row[3] and row[5] for row in rows), "nama pelanggan/karyawan kosong"
+
+    with Session() as session:
+        transaksi = list_objects(session, Transaksi, ["pelanggan"], limit=1)[0]
+        try:
+            transaksi.karyawan
+        except InvalidRequestError:
+            pass
+        else:
+            raise AssertionError("relasi yang tidak dideklarasikan seharusnya tidak di-lazy load")
+
+    lazy = [count_queries(Session, lazy_transaksi, n)[0] for n in (N_SMALL, N_LARGE)]
+    print(f"{'pembanding: lazy load pelanggan + karyawan':<48} {N_SMALL} baris: {lazy[0]} query, "
+          f"{N_LARGE} baris: {lazy[1]} query")
+    print("Jumlah query semua tampilan tetap; relasi yang tidak dideklarasikan ditolak.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+# benchmarks/datagen.py
+
+"""Generator data sintetis bervolume realistis untuk database uji performa.
+
+Mengisi database kosong dengan supplier, bahan baku, ribuan menu beserta
+komposisinya, 100 ribu pelanggan, karyawan dengan sidik jari dan jadwal kerja,
+jutaan transaksi dan detailnya, absensi harian, feedback, pesanan bahan, dan
+penggajian. Semua data konsisten dengan models.py: FK valid, total transaksi sama
+dengan jumlah harga detail, satu baris absensi per karyawan per hari, ID muat di
+kolom VARCHAR(5). Rollup penjualan, pemakaian bahan, dan statistik ANALYZE
+dibangun ulang di akhir. Hasilnya deterministik untuk seed dan tanggal akhir yang sama.
+
+Popularitas menu dan pelanggan mengikuti sebaran miring (Zipf), penjualan lebih
+ramai di akhir pekan dan tumbuh sepanjang periode. Stok bahan dibuat besar agar
+benchmark checkout tidak kehabisan. Baris ditulis lewat executemany driver per
+potongan (tanpa objek ORM) supaya jutaan baris selesai dalam hitungan menit.
+
+Pemakaian:
+    python benchmarks/datagen.py [--scale small|medium|large] [--seed 1] [--url sqlite:///path.db]
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from _common import scratch_db_url
+
+import forecast
+import rollup
+from db_config import create_db_engine, init_db
+from migrations import analyze
+from models import (
+    Absensi, BahanBaku, DetailPemesananBahan, DetailTransaksi, Feedback, JadwalKerja,
+    Karyawan, KomposisiMenu, Menu, Pelanggan, PemesananBahan, Supplier, Transaksi
+)
+from payroll import HARI, run_payroll
+from purchasing import ID_PREFIX, STATUS_DIPESAN, STATUS_DITERIMA, STATUS_DRAFT
+
+
+class Scale(NamedTuple):
+    n_supplier: int
+    n_bahan: int
+    n_menu: int
+    n_pelanggan: int
+    n_karyawan: int
+    n_transaksi: int
+    n_hari: int
+    max_item: int = 6  # baris detail per transaksi: 1..max_item
+
+
+SCALES = {
+    "small": Scale(10, 100, 300, 10_000, 50, 50_000, 180),
+    "medium": Scale(50, 500, 2_000, 100_000, 300, 500_000, 365),
+    "large": Scale(100, 1_500, 5_000, 100_000, 2_000, 2_000_000, 730),
+}
+
+CHUNK_SIZE = 200_000  # transaksi per potongan insert
+DIGITS = np.array(list("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+ID_WIDTH = 5
+
+# posisi -> bobot jumlah karyawan
+POSITIONS = {"Waiter": 40, "Cashier": 20, "Chef": 20, "Operational": 15, "Manager": 5}
+# posisi yang mencatat transaksi di kasir
+SALES_POSITIONS = ("Waiter", "Cashier")
+SHIFTS = [("08:00", "16:00"), ("14:00", "22:00")]
+PRESENT_RATE = 0.95
+LEAVE_RATE = 0.02  # Izin/Sakit tanpa jam scan
+FEEDBACK_RATE = 0.03
+RATING_WEIGHTS = [0.04, 0.06, 0.15, 0.35, 0.40]
+KOMENTAR = [None, None, "Enak", "Pelayanan cepat", "Porsi kurang", "Harga pas", "Akan datang lagi"]
+SATUAN = ["Kg", "Liter", "Pcs", "Gram", "Ikat"]
+MAX_PEMESANAN = 900  # ID pesanan PB001..PB999, sisakan nomor untuk aplikasi
+
+
+def make_ids(prefix, n):
+    """n ID berurutan: awalan + nomor basis 36 rata kanan, total ID_WIDTH karakter."""
+    width = ID_WIDTH - len(prefix)
+    if n > 36 ** width:
+        raise ValueError(f"{n} ID tidak muat dengan awalan {prefix!r}")
+    k = np.arange(n)
+    ids = np.full(n, prefix, dtype=f"<U{ID_WIDTH}")
+    for p in range(width - 1, -1, -1):
+        ids = np.char.add(ids, DIGITS[(k // 36 ** p) % 36])
+    return ids
+
+
+def _zipf_weights(n, s=0.8):
+    weights = 1.0 / np.arange(1, n + 1) ** s
+    return weights / weights.sum()
+
+
+def _weekday(days):
+    """date.weekday() untuk array datetime64[D] (Senin = 0; 1970-01-01 hari Kamis)."""
+    return (days.astype("datetime64[D]").view("int64") + 3) % 7
+
+
+def _insert(conn, table, columns, rows):
+    """INSERT executemany langsung ke driver; rows berupa daftar tuple sesuai urutan columns."""
+    sql = str(insert(table.__table__).compile(dialect=conn.dialect, column_keys=list(columns)))
+    conn.exec_driver_sql(sql, rows)
+
+
+def _datetimes(days, seconds):
+    """String DATETIME SQLite (format SQLAlchemy) dari tanggal datetime64[D] + detik."""
+    values = days.astype("datetime64[s]") + seconds.astype("timedelta64[s]")
+    text = np.char.replace(np.datetime_as_string(values, unit="s"), "T", " ")
+    return np.char.add(text, ".000000")
+
+
+def _master(conn, rng, scale):
+    suppliers = make_ids("S", scale.n_supplier)
+    _insert(conn, Supplier, ["supplier_id", "supplier_name", "address"], [
+        (s, f"Supplier {i}", f"Jl. Pasar No. {i}, Jakarta") for i, s in enumerate(suppliers.tolist())
+    ])
+
+    bahan = make_ids("B", scale.n_bahan)
+    bahan_supplier = suppliers[np.arange(scale.n_bahan) % scale.n_supplier]
+    _insert(conn, BahanBaku, ["bahan_id", "nama_bahan", "stock", "satuan", "harga_bahan", "supplier_id"], list(zip(
+        bahan.tolist(), [f"Bahan {i}" for i in range(scale.n_bahan)],
+        rng.integers(10**6, 10**7, scale.n_bahan).tolist(),
+        [SATUAN[i % len(SATUAN)] for i in range(scale.n_bahan)],
+        (500 * rng.integers(1, 200, scale.n_bahan)).tolist(), bahan_supplier.tolist(),
+    )))
+
+    menus = make_ids("M", scale.n_menu)
+    harga_menu = 1000 * rng.integers(8, 86, scale.n_menu)
+    _insert(conn, Menu, ["menu_id", "nama_menu", "harga"], list(zip(
+        menus.tolist(), [f"Menu {i}" for i in range(scale.n_menu)], harga_menu.tolist()
+    )))
+    komposisi = []
+    for menu_id in menus.tolist():
+        k = int(rng.integers(2, 7))
+        for b, jumlah in zip(rng.choice(scale.n_bahan, k, replace=False), rng.integers(1, 6, k)):
+            komposisi.append((menu_id, bahan[b], int(jumlah)))
+    _insert(conn, KomposisiMenu, ["menu_id", "bahan_id", "jumlah_bahan"], komposisi)
+
+    pelanggan = make_ids("P", scale.n_pelanggan)
+    _insert(conn, Pelanggan, ["pelanggan_id", "cus_name", "contact_info"], list(zip(
+        pelanggan.tolist(), [f"Pelanggan {i}" for i in range(scale.n_pelanggan)],
+        [f"08{n:010d}" for n in rng.integers(10**9, 10**10, scale.n_pelanggan).tolist()],
+    )))
+
+    karyawan = make_ids("K", scale.n_karyawan)
+    names = list(POSITIONS)
+    weights = np.array(list(POSITIONS.values()), dtype=float)
+    position = np.array(names)[rng.choice(len(names), scale.n_karyawan, p=weights / weights.sum())]
+    # Minimal satu karyawan penjualan agar transaksi punya kasir
+    position[0] = "Cashier"
+    _insert(conn, Karyawan, ["karyawan_id", "employee_name", "position", "fingerprint_id"], list(zip(
+        karyawan.tolist(), [f"Karyawan {i}" for i in range(scale.n_karyawan)], position.tolist(),
+        [f"FP-{k}" for k in karyawan.tolist()],
+    )))
+
+    # Enam hari kerja seminggu dengan hari libur bergiliran, shift pagi atau sore
+    libur = np.arange(scale.n_karyawan) % 7
+    shift = rng.integers(0, len(SHIFTS), scale.n_karyawan)
+    _insert(conn, JadwalKerja, ["karyawan_id", "hari", "jam_masuk", "jam_pulang"], [
+        (k, HARI[h], *SHIFTS[s])
+        for k, off, s in zip(karyawan.tolist(), libur.tolist(), shift.tolist())
+        for h in range(7) if h != off
+    ])
+    return {
+        "bahan": bahan, "bahan_supplier": bahan_supplier, "suppliers": suppliers, "menus": menus,
+        "harga_menu": harga_menu, "pelanggan": pelanggan, "karyawan": karyawan, "libur": libur,
+        "shift": shift, "kasir": np.flatnonzero(np.isin(position, SALES_POSITIONS)),
+    }
+
+
+def _transactions(engine, rng, scale, master, days):
+    n_tx = scale.n_transaksi
+    # Akhir pekan lebih ramai, volume tumbuh dari 80% ke 120% sepanjang periode
+    day_weights = np.where(_weekday(days) >= 5, 1.4, 1.0) * np.linspace(0.8, 1.2, len(days))
+    tx_day = np.sort(rng.choice(len(days), n_tx, p=day_weights / day_weights.sum()))
+    tx_ids = make_ids("", n_tx)
+    day_text = np.datetime_as_string(days, unit="D")
+    n_items = rng.integers(1, scale.max_item + 1, n_tx)
+    menu_weights = _zipf_weights(scale.n_menu)
+    pelanggan_weights = _zipf_weights(scale.n_pelanggan, 0.5)
+
+    for start in range(0, n_tx, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, n_tx)
+        n = end - start
+        pelanggan = master["pelanggan"][rng.choice(scale.n_pelanggan, n, p=pelanggan_weights)]
+        karyawan = master["karyawan"][master["kasir"][rng.integers(0, len(master["kasir"]), n)]]
+
+        # Menu berbeda dalam satu transaksi: menu pertama menurut popularitas, sisanya menu berikutnya
+        items = n_items[start:end]
+        line_tx = np.repeat(np.arange(n), items)
+        position = np.arange(len(line_tx)) - np.repeat(np.cumsum(items) - items, items)
+        first_menu = rng.choice(scale.n_menu, n, p=menu_weights)
+        menu = (first_menu[line_tx] + position) % scale.n_menu
+        jumlah = np.minimum(1 + rng.poisson(0.6, len(line_tx)), 10)
+        harga = master["harga_menu"][menu] * jumlah
+        total = np.bincount(line_tx, weights=harga, minlength=n)
+
+        ids = tx_ids[start:end]
+        tanggal = day_text[tx_day[start:end]]
+        with engine.begin() as conn:
+            _insert(conn, Transaksi, ["transaksi_id", "tanggal_pembelian", "pelanggan_id", "karyawan_id",
+                                      "total_transaksi"],
+                    list(zip(ids.tolist(), tanggal.tolist(), pelanggan.tolist(), karyawan.tolist(),
+                             total.tolist())))
+            _insert(conn, DetailTransaksi, ["transaksi_id", "menu_id", "jumlah", "harga"],
+                    list(zip(ids[line_tx].tolist(), master["menus"][menu].tolist(), jumlah.tolist(),
+                             harga.tolist())))
+
+            has_feedback = rng.random(n) < FEEDBACK_RATE
+            n_feedback = int(has_feedback.sum())
+            rating = rng.choice(5, n_feedback, p=RATING_WEIGHTS) + 1
+            komentar = rng.integers(0, len(KOMENTAR), n_feedback)
+            _insert(conn, Feedback, ["pelanggan_id", "karyawan_id", "tanggal", "rating", "komentar"],
+                    list(zip(pelanggan[has_feedback].tolist(), karyawan[has_feedback].tolist(),
+                             tanggal[has_feedback].tolist(), rating.tolist(),
+                             [KOMENTAR[k] for k in komentar.tolist()])))
+
+
+def _attendance(engine, rng, scale, master, days):
+    """Absensi per karyawan per hari terjadwal: Hadir dengan jam scan, Izin/Sakit, atau tidak ada baris."""
+    weekday = _weekday(days)
+    for k, karyawan_id in enumerate(master["karyawan"].tolist()):
+        scheduled = days[weekday != master["libur"][k]]
+        roll = rng.random(len(scheduled))
+        hadir = roll < PRESENT_RATE
+        izin = (roll >= PRESENT_RATE) & (roll < PRESENT_RATE + LEAVE_RATE)
+        masuk_jam, pulang_jam = (int(t[:2]) for t in SHIFTS[master["shift"][k]])
+        n_hadir = int(hadir.sum())
+        masuk = _datetimes(scheduled[hadir], masuk_jam * 3600 + rng.normal(-300, 420, n_hadir).astype(int))
+        pulang = _datetimes(scheduled[hadir], pulang_jam * 3600 + rng.normal(600, 900, n_hadir).astype(int))
+        rows = list(zip([karyawan_id] * n_hadir, np.datetime_as_string(scheduled[hadir], unit="D").tolist(),
+                        ["Hadir"] * n_hadir, masuk.tolist(), pulang.tolist()))
+        rows += [(karyawan_id, t, status, None, None) for t, status in zip(
+            np.datetime_as_string(scheduled[izin], unit="D").tolist(),
+            rng.choice(["Izin", "Sakit"], int(izin.sum())).tolist(),
+        )]
+        rows.sort(key=lambda row: row[1])
+        with engine.begin() as conn:
+            _insert(conn, Absensi, ["karyawan_id", "tanggal", "status", "jam_masuk", "jam_keluar"], rows)
+
+
+def _purchase_orders(engine, rng, scale, master, days):
+    n_orders = min(MAX_PEMESANAN, scale.n_supplier * (len(days) // 14))
+    order_day = np.sort(rng.integers(0, len(days), n_orders))
+    supplier = rng.integers(0, scale.n_supplier, n_orders)
+    status = np.where(order_day < len(days) - 14, STATUS_DITERIMA,
+                      rng.choice([STATUS_DRAFT, STATUS_DIPESAN], n_orders))
+    ids = [f"{ID_PREFIX}{k:03d}" for k in range(1, n_orders + 1)]
+    details = []
+    for pemesanan_id, s in zip(ids, supplier.tolist()):
+        own = np.flatnonzero(master["bahan_supplier"] == master["suppliers"][s])
+        for b in rng.choice(own, min(len(own), int(rng.integers(1, 6))), replace=False):
+            details.append((pemesanan_id, master["bahan"][b], int(rng.integers(10, 500)),
+                            int(500 * rng.integers(1, 200))))
+    with engine.begin() as conn:
+        _insert(conn, PemesananBahan, ["pemesanan_id", "supplier_id", "tanggal_pemesanan", "status"], list(zip(
+            ids, master["suppliers"][supplier].tolist(),
+            np.datetime_as_string(days[order_day], unit="D").tolist(), status.tolist(),
+        )))
+        _insert(conn, DetailPemesananBahan, ["pemesanan_id", "bahan_id", "jumlah", "harga_satuan"], details)
+
+
+def row_counts(bind):
+    """{nama tabel: jumlah baris} untuk tabel data utama."""
+    tables = [Supplier, BahanBaku, Menu, KomposisiMenu, Pelanggan, Karyawan, JadwalKerja, Transaksi,
+              DetailTransaksi, Absensi, Feedback, PemesananBahan, DetailPemesananBahan]
+    with bind.connect() as conn:
+        return {t.__tablename__: conn.scalar(select(func.count()).select_from(t)) for t in tables}
+
+
+def generate(url, scale="medium", seed=1, end=None, verbose=True):
+    """Mengisi database kosong di url dengan data sintetis; mengembalikan engine-nya.
+
+    end adalah tanggal transaksi terakhir (default: kemarin), riwayat mundur scale.n_hari hari.
+    """
+    scale = SCALES[scale] if isinstance(scale, str) else scale
+    end = end or date.today() - timedelta(days=1)
+    engine = create_db_engine(url)
+    init_db(engine)
+    with engine.connect() as conn:
+        if conn.scalar(select(func.count()).select_from(Transaksi)):
+            raise ValueError(f"Database {url} tidak kosong; generator hanya mengisi database baru.")
+
+    rng = np.random.default_rng(seed)
+    first = end - timedelta(days=scale.n_hari - 1)
+    days = np.datetime64(first) + np.arange(scale.n_hari).astype("timedelta64[D]")
+
+    def step(label, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        if verbose:
+            print(f"{label:<30} {time.perf_counter() - start:8.1f} detik")
+        return result
+
+    with engine.begin() as conn:
+        master = step("data master", _master, conn, rng, scale)
+    step("transaksi + detail + feedback", _transactions, engine, rng, scale, master, days)
+    step("absensi", _attendance, engine, rng, scale, master, days)
+    step("pesanan bahan", _purchase_orders, engine, rng, scale, master, days)
+
+    def derived():
+        with Session(engine) as session:
+            rollup.rebuild(session)
+            forecast.refresh_usage(session, full=True)
+            session.commit()
+            # Penggajian untuk setiap bulan penuh dalam riwayat
+            month = (end.replace(day=1) - timedelta(days=1)).replace(day=1)
+            while month >= first:
+                run_payroll(session, month.month, month.year)
+                month = (month - timedelta(days=1)).replace(day=1)
+
+    step("rollup, pemakaian, penggajian", derived)
+    step("ANALYZE", analyze, engine)
+    with engine.connect() as conn:
+        # Pindahkan isi WAL ke file utama agar database bisa langsung disalin
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Isi database uji dengan data sintetis.")
+    parser.add_argument("--scale", choices=SCALES, default="medium")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--url", help="URL database kosong (default: file sementara baru)")
+    parser.add_argument("--end", type=date.fromisoformat, help="tanggal transaksi terakhir (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    url = args.url or scratch_db_url(f"datagen_{args.scale}")
+    engine = generate(url, args.scale, args.seed, args.end)
+    for table, count in row_counts(engine).items():
+        print(f"{table:<25} {count:>10,}")
+    print(f"Database: {url}")
+
+
+if __name__ == "__main__":
+    main()
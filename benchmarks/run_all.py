@@ -0,0 +1,246 @@
+# benchmarks/run_all.py
+
+"""Suite benchmark jalur panas dengan hasil JSON untuk melacak regresi antar-versi.
+
+Memakai database dari datagen.py (dibuat baru sesuai --scale, atau --db untuk
+memakai ulang database yang sudah dibangkitkan; disalin dulu ke file sementara
+agar aslinya tidak berubah dan setiap putaran mulai dari data yang sama), lalu mengukur:
+- halaman daftar: transaksi (halaman pertama, halaman jauh, filter karyawan/pelanggan),
+  absensi 30 hari, pelanggan urut nama, pencarian pelanggan (awalan ID dan nama)
+- laporan: laporan penjualan tanpa cache (30 hari, 1 tahun), hitung gaji sebulan,
+  rencana pemesanan bahan
+- ekspor CSV: detail transaksi 30 hari, seluruh pelanggan
+- penulisan: checkout dan scan absensi (dijalankan terakhir karena mengubah data)
+
+Hasil (mean/p50/p95 ms per kasus) beserta meta (commit git, versi pustaka, skala,
+jumlah baris) ditulis ke --output (default benchmarks/results/<waktu>_<commit>.json).
+Dengan --compare hasil_lama.json, p50 setiap kasus dibandingkan dan skrip keluar
+dengan kode 1 bila ada kasus yang lebih lambat dari --threshold kali semula.
+
+Jalankan: python benchmarks/run_all.py [--scale small] [--db path.db] [--compare hasil_lama.json]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, time, timedelta
+
+from _common import ROOT, print_result, scratch_db_url, timeit
+
+import sqlalchemy
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from api import ABSENSI_LIST
+from attendance import scan
+from checkout import checkout
+from datagen import SCALES, generate, make_ids, row_counts
+from db_config import create_db_engine, init_db
+from export import export_csv
+from forecast import reorder_plan
+from models import Karyawan, Menu, Pelanggan, Transaksi
+from pagination import build_filters, fetch_page
+from payroll import compute_payroll
+from reports import REPORT_TABLES, sales_report
+from search import search
+from utils import bump_table_version
+from views.pelanggan import PELANGGAN_LIST
+from views.transaksi import TRANSAKSI_LIST
+
+PAGE_SIZE = 50
+WRITE_REPEAT = 200
+DEFAULT_THRESHOLD = 1.25
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def list_cases(session, end):
+    """Kasus halaman daftar: (nama, fungsi, repeat)."""
+    karyawan_id, pelanggan_id = session.execute(
+        select(Transaksi.karyawan_id, Transaksi.pelanggan_id).order_by(Transaksi.tanggal_pembelian.desc()).limit(1)
+    ).one()
+    # Cursor jauh di belakang: setelah kira-kira separuh tabel transaksi
+    n_transaksi = session.scalar(select(func.count()).select_from(Transaksi))
+    deep_cursor = session.execute(
+        select(Transaksi.tanggal_pembelian, Transaksi.transaksi_id)
+        .order_by(Transaksi.tanggal_pembelian.desc(), Transaksi.transaksi_id.desc())
+        .offset(n_transaksi // 2).limit(1)
+    ).one()
+    per_karyawan = build_filters(TRANSAKSI_LIST, karyawan_id=karyawan_id)
+    per_pelanggan = build_filters(TRANSAKSI_LIST, pelanggan_id=pelanggan_id)
+    absensi_30_hari = build_filters(ABSENSI_LIST, (end - timedelta(days=29), end))
+
+    def page(spec, sort_label, descending=True, filters=(), cursor=None):
+        return lambda: fetch_page(session, spec, sort_label, descending, filters, cursor, PAGE_SIZE)
+
+    return [
+        ("daftar_transaksi_halaman_1", page(TRANSAKSI_LIST, "Tanggal Pembelian"), 50),
+        ("daftar_transaksi_halaman_jauh", page(TRANSAKSI_LIST, "Tanggal Pembelian", cursor=tuple(deep_cursor)), 50),
+        ("daftar_transaksi_per_karyawan", page(TRANSAKSI_LIST, "Tanggal Pembelian", filters=per_karyawan), 50),
+        ("daftar_transaksi_per_pelanggan", page(TRANSAKSI_LIST, "Tanggal Pembelian", filters=per_pelanggan), 50),
+        ("daftar_absensi_30_hari", page(ABSENSI_LIST, "tanggal", filters=absensi_30_hari), 50),
+        ("daftar_pelanggan_urut_nama", page(PELANGGAN_LIST, "Nama", descending=False), 20),
+        ("cari_pelanggan_awalan_id", lambda: search(session, Pelanggan, pelanggan_id[:3]), 50),
+        ("cari_pelanggan_awalan_nama", lambda: search(session, Pelanggan, "pel"), 50),
+    ]
+
+
+def report_cases(session, end):
+    last_month = end.replace(day=1) - timedelta(days=1)
+
+    def uncached_report(days):
+        def run():
+            bump_table_version(*REPORT_TABLES)
+            return sales_report(session, end - timedelta(days=days - 1), end)
+        return run
+
+    return [
+        ("laporan_penjualan_30_hari", uncached_report(30), 20),
+        ("laporan_penjualan_1_tahun", uncached_report(365), 10),
+        ("hitung_gaji_1_bulan", lambda: compute_payroll(session, last_month.month, last_month.year), 5),
+        ("rencana_pemesanan_bahan", lambda: reorder_plan(session, end + timedelta(days=1)), 5),
+    ]
+
+
+def export_cases(engine, end):
+    return [
+        ("ekspor_csv_detail_30_hari",
+         lambda: export_csv(engine, "transaksi_detail", os.devnull, end - timedelta(days=29), end), 5),
+        ("ekspor_csv_pelanggan", lambda: export_csv(engine, "pelanggan", os.devnull), 5),
+    ]
+
+
+def write_cases(session, end, repeat=WRITE_REPEAT):
+    """Checkout dan scan absensi di hari setelah data terakhir; setiap panggilan commit sendiri."""
+    menus = session.scalars(select(Menu.menu_id).order_by(Menu.menu_id).limit(100)).all()
+    pelanggan = session.scalars(select(Pelanggan.pelanggan_id).order_by(Pelanggan.pelanggan_id).limit(100)).all()
+    kasir = session.scalars(select(Transaksi.karyawan_id).distinct().limit(20)).all()
+    fingerprints = session.scalars(
+        select(Karyawan.fingerprint_id).where(Karyawan.fingerprint_id.is_not(None)).order_by(Karyawan.karyawan_id)
+    ).all()
+    tanggal = end + timedelta(days=1)
+    # ID "Z...." tidak bentrok dengan ID transaksi datagen (angka basis 36 tanpa awalan)
+    transaksi_ids = iter(make_ids("Z", repeat + 10).tolist())
+    counter = itertools.count()
+
+    def one_checkout():
+        i = next(counter)
+        items = {menus[(i + k * 7) % len(menus)]: 1 + k for k in range(3)}
+        checkout(session, next(transaksi_ids), tanggal, pelanggan[i % len(pelanggan)], kasir[i % len(kasir)], items)
+
+    # Scan pertama setiap karyawan = masuk, berikutnya = pulang
+    scans = itertools.count()
+    shift_start = datetime.combine(tanggal, time(8))
+
+    def one_scan():
+        i = next(scans)
+        scan(session, fingerprints[i % len(fingerprints)], shift_start + timedelta(seconds=30 * i))
+
+    return [
+        ("checkout", one_checkout, repeat),
+        ("scan_absensi", one_scan, repeat),
+    ]
+
+
+def run(engine):
+    """Menjalankan semua kasus; mengembalikan {nama kasus: ringkasan latensi}."""
+    results = {}
+    with Session(engine) as session:
+        end = session.scalar(select(func.max(Transaksi.tanggal_pembelian)))
+        cases = (list_cases(session, end) + report_cases(session, end) + export_cases(engine, end)
+                 + write_cases(session, end))
+        for name, fn, repeat in cases:
+            result = timeit(fn, repeat=repeat, warmup=min(3, repeat))
+            print_result(name, result)
+            results[name] = dict(result, repeat=repeat)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Mencetak rasio p50 terhadap baseline; mengembalikan daftar kasus yang melambat."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<40} baru")
+            continue
+        ratio = result["p50_ms"] / before["p50_ms"] if before["p50_ms"] else float("inf")
+        flag = " REGRESI" if ratio > threshold else ""
+        print(f"{name:<40} {before['p50_ms']:9.3f} -> {result['p50_ms']:9.3f} ms  x{ratio:.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark jalur panas Restorify dengan output JSON.")
+    parser.add_argument("--scale", choices=SCALES, default="medium",
+                        help="skala data yang dibangkitkan bila --db tidak diberikan")
+    parser.add_argument("--db", help="path database hasil datagen.py yang dipakai ulang (disalin, tidak diubah)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="file JSON hasil (default: benchmarks/results/<waktu>_<commit>.json)")
+    parser.add_argument("--compare", help="file JSON hasil sebelumnya sebagai baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="rasio p50 baru/lama yang dianggap regresi")
+    args = parser.parse_args()
+
+    if args.db:
+        url = scratch_db_url("run_all")
+        shutil.copyfile(args.db, sqlalchemy.engine.make_url(url).database)
+        engine = create_db_engine(url)
+        init_db(engine)
+    else:
+        url = scratch_db_url(f"datagen_{args.scale}")
+        engine = generate(url, args.scale, args.seed)
+    counts = row_counts(engine)
+
+    commit = _git("rev-parse", "HEAD")
+    started = datetime.now()
+    results = run(engine)
+    report = {
+        "meta": {
+            "waktu": started.isoformat(timespec="seconds"),
+            "commit": commit,
+            "perubahan_belum_commit": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "skala": None if args.db else args.scale,
+            "database": os.path.abspath(args.db) if args.db else url,
+            "jumlah_baris": counts,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "hasil": results,
+    }
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{started:%Y%m%d-%H%M%S}_{(commit or 'tanpa-git')[:7]}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Hasil: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)["hasil"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} kasus melambat lebih dari {args.threshold}x: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
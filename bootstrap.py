@@ -0,0 +1,31 @@
+# bootstrap.py
+
+"""Persiapan aplikasi Streamlit yang cukup dijalankan sekali per proses.
+
+Streamlit menjalankan ulang app.py di setiap interaksi. Semua yang tidak
+bergantung pada interaksi pengguna (locale, skema database, instrumentasi SQL)
+ada di bootstrap(), yang di-cache dengan st.cache_resource: rerun berikutnya dan
+sesi browser lain langsung memakai hasilnya.
+"""
+
+import locale
+
+import streamlit as st
+
+from db_config import engine, init_db
+from instrumentation import SQL_STATS_ENABLED, instrument
+
+
+@st.cache_resource(show_spinner=False)
+def bootstrap():
+    """Mengatur locale, menyiapkan skema database, dan memasang instrumentasi bila aktif."""
+    # Mengatur locale untuk format mata uang (opsional)
+    try:
+        locale.setlocale(locale.LC_ALL, '')
+    except locale.Error:
+        # Jika environment tidak punya locale ID, bisa diabaikan
+        pass
+    init_db(engine)
+    if SQL_STATS_ENABLED:
+        instrument(engine)
+    return engine
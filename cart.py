@@ -0,0 +1,97 @@
+# cart.py
+
+"""Model keranjang kasir untuk editor keranjang di layar transaksi.
+
+Keranjang disimpan di st.session_state dan diubah per baris: menambah atau
+menghapus satu menu hanya mengubah baris itu dan total berjalan, tanpa
+menghargai ulang seluruh keranjang. Nama dan harga menu diambil dari cache
+berversi tabel menu (menu_prices), jadi menambah item tidak memicu query;
+semua baris dihargai ulang hanya jika tabel menu berubah. Harga final tetap
+dihitung dari database oleh checkout.checkout().
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from checkout import CartLine, CheckoutError
+from models import Menu
+from utils import cached_by_version, table_version
+
+
+def menu_prices(session: Session):
+    """{menu_id: (nama_menu, harga)} untuk semua menu, dari cache berversi tabel menu."""
+    def load():
+        rows = session.execute(select(Menu.menu_id, Menu.nama_menu, Menu.harga))
+        return {menu_id: (nama_menu, harga) for menu_id, nama_menu, harga in rows}
+
+    return cached_by_version(("harga_menu",), (Menu.__tablename__,), load)
+
+
+class Cart:
+    """Baris keranjang {menu_id: CartLine} sesuai urutan ditambahkan, beserta total berjalan."""
+
+    def __init__(self):
+        self.lines = {}
+        self.total = Decimal(0)
+        self.menu_version = None
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __iter__(self):
+        return iter(self.lines.values())
+
+    def items(self):
+        """{menu_id: jumlah} untuk PortionIndex.shortages() dan checkout()."""
+        return {menu_id: line.jumlah for menu_id, line in self.lines.items()}
+
+    def with_added(self, menu_id, jumlah):
+        """items() seandainya jumlah menu_id ditambah, untuk memeriksa stok sebelum add()."""
+        items = self.items()
+        items[menu_id] = items.get(menu_id, 0) + jumlah
+        return items
+
+    def _set(self, line):
+        old = self.lines.get(line.menu_id)
+        self.total += line.subtotal - (old.subtotal if old is not None else 0)
+        self.lines[line.menu_id] = line
+        return line
+
+    def add(self, menu_id, jumlah, prices):
+        """Menambah jumlah satu menu dengan harga dari menu_prices(); mengembalikan barisnya."""
+        if jumlah <= 0:
+            raise CheckoutError(f"Jumlah untuk menu {menu_id} harus lebih dari nol.")
+        if menu_id not in prices:
+            raise CheckoutError(f"Menu tidak dikenal: {menu_id}.")
+        nama_menu, harga = prices[menu_id]
+        old = self.lines.get(menu_id)
+        jumlah += old.jumlah if old is not None else 0
+        return self._set(CartLine(menu_id, nama_menu, jumlah, harga, harga * jumlah))
+
+    def remove(self, menu_id):
+        """Menghapus satu baris menu dari keranjang."""
+        line = self.lines.pop(menu_id, None)
+        if line is not None:
+            self.total -= line.subtotal
+
+    def clear(self):
+        self.lines = {}
+        self.total = Decimal(0)
+
+    def sync(self, session: Session):
+        """Menghargai ulang semua baris jika tabel menu berubah sejak pemeriksaan terakhir.
+
+        Baris untuk menu yang sudah dihapus dibuang.
+        """
+        version = table_version(Menu.__tablename__)
+        if version == self.menu_version:
+            return
+        prices = menu_prices(session)
+        lines = [line for line in self.lines.values() if line.menu_id in prices]
+        self.clear()
+        for line in lines:
+            nama_menu, harga = prices[line.menu_id]
+            self._set(CartLine(line.menu_id, nama_menu, line.jumlah, harga, harga * line.jumlah))
+        self.menu_version = version
@@ -0,0 +1,129 @@
+# checkout.py
+
+"""Layanan checkout: menyimpan satu pesanan utuh dalam satu transaksi database.
+
+Keranjang dihargai sekaligus dari tabel Menu, stok semua bahan dipesan lewat
+stock.reserve_items, lalu header Transaksi dan seluruh DetailTransaksi disisipkan
+dengan bulk insert dan rollup penjualan harian ikut diperbarui. Penulisan berjalan
+dalam satu transaksi BEGIN IMMEDIATE lewat concurrency.run_write (diulang bila
+database sibuk). Jika salah satu langkah gagal, semuanya di-rollback sehingga tidak
+ada transaksi bernilai nol maupun stok yang terlanjur berkurang.
+"""
+
+from collections import Counter
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from concurrency import run_write
+from models import DetailTransaksi, Menu, Transaksi
+from rollup import record_sale
+from stock import reserve_items
+
+
+class CheckoutError(Exception):
+    """Pesanan tidak dapat disimpan."""
+
+
+class InsufficientStockError(CheckoutError):
+    """Stok satu atau lebih bahan baku tidak mencukupi."""
+
+    def __init__(self, shortages):
+        self.shortages = shortages
+        names = ", ".join(k.nama_bahan for k in shortages)
+        super().__init__(f"Stok bahan tidak mencukupi: {names}.")
+
+
+class CartLine(NamedTuple):
+    menu_id: str
+    nama_menu: str
+    jumlah: int
+    harga_satuan: Decimal
+    subtotal: Decimal
+
+
+class CheckoutResult(NamedTuple):
+    transaksi_id: str
+    total_transaksi: Decimal
+    lines: list
+
+
+def normalize_cart(items):
+    """Menggabungkan item keranjang menjadi {menu_id: jumlah}.
+
+    items boleh berupa dict {menu_id: jumlah} atau iterable pasangan (menu_id, jumlah).
+    """
+    pairs = items.items() if hasattr(items, "items") else items
+    cart = Counter()
+    for menu_id, jumlah in pairs:
+        jumlah = int(jumlah)
+        if jumlah <= 0:
+            raise CheckoutError(f"Jumlah untuk menu {menu_id} harus lebih dari nol.")
+        cart[menu_id] += jumlah
+    return dict(cart)
+
+
+def price_cart(session: Session, items):
+    """Menghargai seluruh keranjang dengan satu query ke tabel Menu."""
+    cart = normalize_cart(items)
+    rows = session.execute(
+        select(Menu.menu_id, Menu.nama_menu, Menu.harga).where(Menu.menu_id.in_(list(cart)))
+    )
+    menus = {menu_id: (nama_menu, harga) for menu_id, nama_menu, harga in rows}
+    unknown = [menu_id for menu_id in cart if menu_id not in menus]
+    if unknown:
+        raise CheckoutError(f"Menu tidak dikenal: {', '.join(unknown)}.")
+    lines = []
+    for menu_id, jumlah in cart.items():
+        nama_menu, harga = menus[menu_id]
+        lines.append(CartLine(menu_id, nama_menu, jumlah, harga, harga * jumlah))
+    return lines
+
+
+def checkout(session: Session, transaksi_id, tanggal_pembelian, pelanggan_id, karyawan_id, items):
+    """Menyimpan transaksi beserta seluruh detailnya dan mengurangi stok dalam satu commit.
+
+    DetailTransaksi.harga berisi subtotal baris (harga menu x jumlah), sama seperti
+    yang selama ini disimpan oleh form Transaksi. Mengembalikan CheckoutResult
+    dengan total akhir; melempar CheckoutError (atau InsufficientStockError) jika gagal,
+    dan concurrency.DatabaseBusyError jika database tetap terkunci kasir lain.
+    """
+    if not transaksi_id:
+        raise CheckoutError("ID Transaksi wajib diisi.")
+    lines = price_cart(session, items)
+    if not lines:
+        raise CheckoutError("Keranjang masih kosong.")
+    total = sum((line.subtotal for line in lines), Decimal("0"))
+
+    def write(session):
+        if session.get(Transaksi, transaksi_id) is not None:
+            raise CheckoutError("ID Transaksi sudah ada.")
+        reservation = reserve_items(session, {line.menu_id: line.jumlah for line in lines})
+        if not reservation.ok:
+            raise InsufficientStockError(reservation.shortages)
+        session.execute(insert(Transaksi).values(
+            transaksi_id=transaksi_id,
+            tanggal_pembelian=tanggal_pembelian,
+            pelanggan_id=pelanggan_id,
+            karyawan_id=karyawan_id,
+            total_transaksi=total,
+        ))
+        session.execute(insert(DetailTransaksi), [
+            {
+                "transaksi_id": transaksi_id,
+                "menu_id": line.menu_id,
+                "jumlah": line.jumlah,
+                "harga": line.subtotal,
+            }
+            for line in lines
+        ])
+        record_sale(session, tanggal_pembelian, karyawan_id, lines)
+
+    try:
+        run_write(session, write)
+    except IntegrityError as exc:
+        raise CheckoutError(f"Transaksi gagal disimpan: {exc.orig}") from exc
+    return CheckoutResult(transaksi_id, total, lines)
@@ -0,0 +1,82 @@
+# concurrency.py
+
+"""Koordinasi penulisan dari banyak kasir ke satu database SQLite.
+
+SQLite hanya mengizinkan satu penulis, dan SELECT ... FOR UPDATE tidak ada.
+Setiap penulisan dijalankan lewat run_write():
+- penulis dari thread proses yang sama (sesi-sesi browser Streamlit) antre di
+  satu threading.Lock, sehingga giliran berpindah seketika; busy handler SQLite
+  menunggu dengan tidur bertahap hingga puluhan ms dan membuat p99 melonjak
+- transaksi dibuka dengan BEGIN IMMEDIATE, sehingga kunci tulis diambil di awal
+  (proses lain antre lewat busy_timeout) alih-alih gagal "database is locked"
+  saat transaksi baca dinaikkan menjadi transaksi tulis
+- isi transaksi dibatasi pada langkah tulis beserta pengecekan yang harus atomik
+  dengannya, lalu langsung commit; pembacaan untuk tampilan terjadi di luarnya
+- bila database tetap sibuk, transaksi di-rollback lalu diulang dengan backoff
+  eksponensial ber-jitter sampai MAX_ATTEMPTS kali, lalu DatabaseBusyError
+
+BahanBaku dan Transaksi punya kolom version_id yang naik di setiap perubahan.
+repositories.base.update_row(expected_version=...) menolak perubahan dengan WriteConflictError jika baris sudah diubah orang lain
+sejak dibaca, misalnya stok yang berkurang oleh checkout kasir lain.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from db_config import BEGIN_OPTION
+
+MAX_ATTEMPTS = 5
+BASE_DELAY = 0.01   # detik, backoff percobaan pertama
+MAX_DELAY = 0.5     # detik, batas atas backoff
+
+_write_lock = threading.Lock()
+
+
+class DatabaseBusyError(Exception):
+    """Database tetap terkunci penulis lain setelah semua percobaan ulang."""
+
+
+class WriteConflictError(Exception):
+    """Baris sudah diubah pengguna lain sejak dibaca."""
+
+
+def is_busy_error(exc):
+    """True jika exc adalah SQLITE_BUSY/SQLITE_LOCKED ("database is locked")."""
+    if isinstance(exc, DBAPIError):
+        exc = exc.orig
+    return isinstance(exc, sqlite3.OperationalError) and "locked" in str(exc)
+
+
+def backoff_delay(attempt):
+    """Jeda sebelum percobaan ke-(attempt + 1): eksponensial dengan full jitter."""
+    return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** (attempt - 1)))
+
+
+def run_write(session: Session, work, *args, attempts=MAX_ATTEMPTS, **kwargs):
+    """Menjalankan work(session, *args, **kwargs) dalam satu transaksi BEGIN IMMEDIATE lalu commit.
+
+    Transaksi baca yang masih terbuka di session diakhiri dulu. work tidak boleh
+    commit sendiri dan harus aman diulang. Mengembalikan hasil work; exception
+    selain database sibuk diteruskan setelah rollback.
+    """
+    for attempt in range(1, attempts + 1):
+        if session.in_transaction():
+            session.commit()
+        with _write_lock:
+            try:
+                session.connection(execution_options={BEGIN_OPTION: "IMMEDIATE"})
+                result = work(session, *args, **kwargs)
+                session.commit()
+                return result
+            except Exception as exc:
+                session.rollback()
+                if not is_busy_error(exc):
+                    raise
+                if attempt == attempts:
+                    raise DatabaseBusyError("Database sedang sibuk, coba lagi sebentar lagi.") from exc
+        time.sleep(backoff_delay(attempt))
@@ -0,0 +1,129 @@
+# costing.py
+
+"""Perhitungan biaya bahan (food cost) dan margin untuk semua menu sekaligus.
+
+Biaya bahan = matriks komposisi (menu x bahan) dikali vektor harga bahan, dihitung
+dengan satu operasi NumPy. Saat harga bahan berubah, hanya menu yang memakai
+bahan tersebut yang diperbarui (selisih harga x jumlah bahan), tanpa menghitung
+ulang seluruh matriks. Matriks dimuat ulang hanya jika menu atau komposisi berubah.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, select, type_coerce
+from sqlalchemy.orm import Session
+
+from menu_matrix import MATRIX_TABLES, get_menu_matrix
+from models import BahanBaku, Menu
+from utils import cached_by_version, table_version
+
+
+def _load_bahan_prices(session, matrix):
+    rows = session.execute(select(BahanBaku.bahan_id, type_coerce(BahanBaku.harga_bahan, Float))).all()
+    bahan_ids, harga = zip(*rows) if rows else ((), ())
+    return matrix.align_bahan(bahan_ids, harga)
+
+
+class MenuCosting:
+    """Biaya bahan, harga jual, dan margin per menu dalam bentuk array."""
+
+    def __init__(self, matrix, nama_menu, harga_menu, harga_bahan, price_version):
+        self.matrix = matrix
+        self.nama_menu = nama_menu
+        self.harga_menu = harga_menu
+        self.harga_bahan = harga_bahan
+        self.biaya = matrix.matvec(harga_bahan)
+        self.price_version = price_version
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, session: Session):
+        matrix = get_menu_matrix(session)
+        price_version = table_version(BahanBaku.__tablename__)
+        menus = session.execute(
+            select(Menu.menu_id, Menu.nama_menu, type_coerce(Menu.harga, Float))
+        ).all()
+        nama_menu = np.empty(matrix.n_menu, dtype=object)
+        harga_menu = np.zeros(matrix.n_menu, dtype=np.float64)
+        for menu_id, nama, harga in menus:
+            i = matrix.menu_index.get(menu_id)
+            if i is not None:
+                nama_menu[i] = nama
+                harga_menu[i] = harga
+        return cls(matrix, nama_menu, harga_menu, _load_bahan_prices(session, matrix), price_version)
+
+    def _apply_prices(self, new_prices):
+        # Dipanggil dengan self._lock. biaya dihitung ke array baru lalu diganti dengan
+        # satu assignment, sehingga pembaca tanpa kunci melihat array lama atau baru, tidak campuran
+        changed = np.flatnonzero(new_prices != self.harga_bahan)
+        if changed.size:
+            delta = new_prices - self.harga_bahan
+            entries = self.matrix.entries_for_columns(changed)
+            self.biaya = self.biaya + np.bincount(
+                self.matrix.rows[entries],
+                weights=self.matrix.qty[entries] * delta[self.matrix.cols[entries]],
+                minlength=self.matrix.n_menu,
+            )
+            self.harga_bahan = new_prices
+        return changed.size
+
+    def update_prices(self, new_prices):
+        """Menerapkan vektor harga bahan baru; hanya menu pemakai bahan yang berubah dihitung ulang.
+
+        Mengembalikan jumlah bahan yang harganya berubah.
+        """
+        with self._lock:
+            return self._apply_prices(new_prices)
+
+    def update_price(self, bahan_id, harga_bahan):
+        """Memperbarui harga satu bahan."""
+        j = self.matrix.bahan_index.get(bahan_id)
+        if j is None:
+            return 0
+        with self._lock:
+            new_prices = self.harga_bahan.copy()
+            new_prices[j] = harga_bahan
+            return self._apply_prices(new_prices)
+
+    def sync(self, session: Session):
+        """Menyamakan harga bahan dengan database jika tabel bahan_baku berubah sejak dimuat."""
+        version = table_version(BahanBaku.__tablename__)
+        if version == self.price_version:
+            return
+        with self._lock:
+            if version != self.price_version:
+                self._apply_prices(_load_bahan_prices(session, self.matrix))
+                self.price_version = version
+
+    @property
+    def margin(self):
+        return self.harga_menu - self.biaya
+
+    @property
+    def margin_persen(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.harga_menu > 0, self.margin / self.harga_menu * 100, np.nan)
+
+    def to_frame(self):
+        biaya = self.biaya  # satu snapshot untuk semua kolom
+        margin = self.harga_menu - biaya
+        with np.errstate(divide="ignore", invalid="ignore"):
+            margin_persen = np.where(self.harga_menu > 0, margin / self.harga_menu * 100, np.nan)
+        return pd.DataFrame({
+            "Menu ID": self.matrix.menu_ids,
+            "Nama Menu": self.nama_menu,
+            "Harga Jual": self.harga_menu,
+            "Biaya Bahan": biaya,
+            "Margin": margin,
+            "Margin %": margin_persen,
+        })
+
+
+def get_costing(session: Session):
+    """MenuCosting terkini: dimuat ulang jika menu/komposisi berubah, disinkronkan
+    secara inkremental jika hanya harga bahan yang berubah."""
+    costing = cached_by_version(("menu_costing",), MATRIX_TABLES, lambda: MenuCosting.load(session))
+    costing.sync(session)
+    return costing
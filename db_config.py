@@ -1,15 +1,91 @@
 # db_config.py
 
+import os
+import threading
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# URL database SQLite
-DATABASE_URL = "sqlite:///./restorify.db"
+# URL database SQLite (bisa diganti lewat environment variable)
+DATABASE_URL = os.environ.get("RESTORIFY_DATABASE_URL", "sqlite:///./restorify.db")
+
+# Profil engine: "production" (default) atau "debug" (echo=True, tanpa tuning).
+# Untuk mencari halaman yang lambat, pakai RESTORIFY_SQL_STATS=1 (lihat instrumentation.py)
+DB_PROFILE = os.environ.get("RESTORIFY_DB_PROFILE", "production")
+
+# Opsi eksekusi koneksi untuk jenis BEGIN transaksi, mis. {BEGIN_OPTION: "IMMEDIATE"}
+# (dipakai concurrency.run_write). Tanpa opsi ini sqlite3 membuka transaksi seperti biasa.
+BEGIN_OPTION = "sqlite_begin"
+
+DB_PROFILES = {
+    "debug": {
+        "echo": True,
+        "pragmas": {
+            "foreign_keys": "ON",
+        },
+        "pool": {},
+    },
+    "production": {
+        "echo": False,
+        "pragmas": {
+            "foreign_keys": "ON",
+            "journal_mode": "WAL",        # pembaca tidak memblokir penulis
+            "synchronous": "NORMAL",      # aman dengan WAL, fsync jauh lebih jarang
+            "busy_timeout": 5000,         # ms menunggu lock sebelum "database is locked"
+            "mmap_size": 268435456,       # 256 MB memory-mapped I/O
+            "cache_size": -64000,         # ~64 MB page cache per koneksi
+            "temp_store": "MEMORY",
+        },
+        "pool": {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_recycle": 3600,
+        },
+    },
+}
+
+
+def _is_memory_url(url):
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def create_db_engine(url=DATABASE_URL, profile=DB_PROFILE):
+    """Membuat engine SQLAlchemy sesuai profil yang dipilih."""
+    config = DB_PROFILES[profile]
+    pool_args = {} if _is_memory_url(url) else dict(config["pool"])
+    new_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        echo=config["echo"],
+        **pool_args,
+    )
 
-# Membuat engine SQLAlchemy
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}, echo=True  # echo=True untuk debugging
-)
+    pragmas = config["pragmas"]
+
+    # Mengaktifkan foreign key constraints dan pragma performa di setiap koneksi SQLite
+    @event.listens_for(new_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    # BEGIN IMMEDIATE mengambil kunci tulis di awal transaksi (menunggu lewat busy_timeout),
+    # bukan saat UPDATE pertama ketika snapshot baca bisa sudah basi dan SQLite langsung
+    # menolak dengan "database is locked". Dijalankan lewat driver agar sqlite3 tahu
+    # transaksi sudah terbuka dan tidak ikut terhitung sebagai query di instrumentation.
+    @event.listens_for(new_engine, "begin")
+    def begin_sqlite_transaction(conn):
+        mode = conn.get_execution_options().get(BEGIN_OPTION)
+        if mode:
+            conn.connection.driver_connection.execute(f"BEGIN {mode}")
+
+    return new_engine
+
+
+# Membuat engine SQLAlchemy (sekali per proses, modul hanya diimpor sekali)
+engine = create_db_engine()
 
 # Membuat kelas SessionLocal
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -17,9 +93,24 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Membuat Base kelas deklaratif
 Base = declarative_base()
 
-# Mengaktifkan foreign key constraints di SQLite
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def init_db(bind=None):
+    """Menyiapkan skema database (create_all + migrasi) sekali per proses untuk setiap engine.
+
+    Streamlit menjalankan ulang app.py di setiap interaksi, sedangkan modul ini
+    hanya diimpor sekali, sehingga pemanggilan berikutnya langsung kembali.
+    """
+    bind = bind if bind is not None else engine
+    if bind in _schema_ready:
+        return
+    with _schema_lock:
+        if bind in _schema_ready:
+            return
+        import models  # noqa: F401  (mendaftarkan semua tabel ke Base.metadata)
+        import migrations
+        Base.metadata.create_all(bind=bind)
+        migrations.upgrade(bind)
+        _schema_ready.add(bind)
@@ -0,0 +1,146 @@
+# export.py
+
+"""Ekspor tabel besar ke CSV atau Parquet secara bertahap (chunked).
+
+Baris dibaca dari database per potongan (pd.read_sql dengan chunksize) dan
+langsung ditulis ke file, sehingga memori puncak sebanding dengan ukuran satu
+potongan, bukan ukuran tabel. Parquet memerlukan paket opsional pyarrow.
+"""
+
+from sqlalchemy import Date, DateTime, Float, Integer, Numeric, select, type_coerce
+
+import pandas as pd
+
+from models import (
+    Absensi, BahanBaku, DetailTransaksi, Feedback, Karyawan, Menu, Pelanggan,
+    Supplier, Transaksi
+)
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _money(column):
+    # Hindari konversi ke Decimal per baris; nilai SQLite sudah berupa REAL/INTEGER
+    return type_coerce(column, Float).label(column.key)
+
+
+# nama ekspor -> (fungsi pembuat SELECT, kolom tanggal untuk filter rentang atau None)
+EXPORTS = {
+    "karyawan": (lambda: select(
+        Karyawan.karyawan_id, Karyawan.employee_name, Karyawan.position, Karyawan.fingerprint_id
+    ).order_by(Karyawan.karyawan_id), None),
+    "pelanggan": (lambda: select(
+        Pelanggan.pelanggan_id, Pelanggan.cus_name, Pelanggan.contact_info
+    ).order_by(Pelanggan.pelanggan_id), None),
+    "supplier": (lambda: select(
+        Supplier.supplier_id, Supplier.supplier_name, Supplier.address
+    ).order_by(Supplier.supplier_id), None),
+    "bahan_baku": (lambda: select(
+        BahanBaku.bahan_id, BahanBaku.nama_bahan, BahanBaku.stock, BahanBaku.satuan,
+        _money(BahanBaku.harga_bahan), BahanBaku.supplier_id
+    ).order_by(BahanBaku.bahan_id), None),
+    "menu": (lambda: select(
+        Menu.menu_id, Menu.nama_menu, _money(Menu.harga)
+    ).order_by(Menu.menu_id), None),
+    "transaksi": (lambda: select(
+        Transaksi.transaksi_id, Transaksi.tanggal_pembelian, Transaksi.pelanggan_id,
+        Transaksi.karyawan_id, _money(Transaksi.total_transaksi)
+    ).order_by(Transaksi.tanggal_pembelian, Transaksi.transaksi_id), Transaksi.tanggal_pembelian),
+    "transaksi_detail": (lambda: select(
+        Transaksi.transaksi_id, Transaksi.tanggal_pembelian, Transaksi.pelanggan_id,
+        Transaksi.karyawan_id, DetailTransaksi.detail_id, DetailTransaksi.menu_id,
+        Menu.nama_menu, DetailTransaksi.jumlah, _money(DetailTransaksi.harga)
+    ).join(DetailTransaksi, DetailTransaksi.transaksi_id == Transaksi.transaksi_id)
+     .join(Menu, Menu.menu_id == DetailTransaksi.menu_id)
+     .order_by(Transaksi.tanggal_pembelian, Transaksi.transaksi_id, DetailTransaksi.detail_id),
+        Transaksi.tanggal_pembelian),
+    "feedback": (lambda: select(
+        Feedback.feedback_id, Feedback.pelanggan_id, Feedback.karyawan_id, Feedback.tanggal,
+        Feedback.rating, Feedback.komentar
+    ).order_by(Feedback.feedback_id), Feedback.tanggal),
+    "absensi": (lambda: select(
+        Absensi.absensi_id, Absensi.karyawan_id, Absensi.tanggal, Absensi.status,
+        Absensi.jam_masuk, Absensi.jam_keluar
+    ).order_by(Absensi.absensi_id), Absensi.tanggal),
+}
+
+
+def export_query(name, start=None, end=None):
+    """SELECT untuk ekspor bernama, dengan filter rentang tanggal jika didukung."""
+    build, date_column = EXPORTS[name]
+    stmt = build()
+    if date_column is not None:
+        if start is not None:
+            stmt = stmt.where(date_column >= start)
+        if end is not None:
+            stmt = stmt.where(date_column <= end)
+    return stmt
+
+
+def iter_chunks(bind, stmt, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Menghasilkan DataFrame per potongan hasil query tanpa memuat semuanya sekaligus."""
+    with bind.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+        yield from pd.read_sql(stmt, conn, chunksize=chunk_size)
+
+
+def export_csv(bind, name, target, start=None, end=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Menulis ekspor ke file CSV (path atau file teks terbuka). Mengembalikan jumlah baris."""
+    stmt = export_query(name, start, end)
+    own_file = isinstance(target, str)
+    handle = open(target, "w", encoding="utf-8", newline="") if own_file else target
+    total = 0
+    try:
+        header = True
+        for chunk in iter_chunks(bind, stmt, chunk_size):
+            chunk.to_csv(handle, index=False, header=header)
+            header = False
+            total += len(chunk)
+        if header:
+            # Tabel kosong: tetap tulis baris header
+            pd.DataFrame(columns=[c.key for c in stmt.selected_columns]).to_csv(handle, index=False)
+    finally:
+        if own_file:
+            handle.close()
+    return total
+
+
+def _arrow_schema(pa, stmt):
+    fields = []
+    for column in stmt.selected_columns:
+        if isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, (Float, Numeric)):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us")
+        elif isinstance(column.type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.key, arrow_type))
+    return pa.schema(fields)
+
+
+def export_parquet(bind, name, target, start=None, end=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Menulis ekspor ke file Parquet, satu row group per potongan. Mengembalikan jumlah baris."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Ekspor Parquet memerlukan paket pyarrow.") from exc
+
+    stmt = export_query(name, start, end)
+    schema = _arrow_schema(pa, stmt)
+    total = 0
+    with pq.ParquetWriter(target, schema) as writer:
+        for chunk in iter_chunks(bind, stmt, chunk_size):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            total += len(chunk)
+    return total
+
+
+EXPORT_FORMATS = {
+    "CSV": (export_csv, ".csv", "text/csv"),
+    "Parquet": (export_parquet, ".parquet", "application/vnd.apache.parquet"),
+}
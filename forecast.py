@@ -0,0 +1,177 @@
+# forecast.py
+
+"""Perkiraan pemakaian bahan baku, titik pesan ulang, dan draft pesanan ke supplier.
+
+Pemakaian harian per bahan (pemakaian_bahan_harian) diturunkan dari rollup
+penjualan_harian yang dimekarkan lewat matriks komposisi menu secara vektor
+(tanpa loop per transaksi), dan hanya hari baru yang diproses setiap kali
+refresh_usage() dipanggil. Komposisi yang dipakai adalah komposisi saat ini.
+
+Perkiraan memakai rata-rata bergulir ROLLING_DAYS hari dikali faktor musiman per
+hari dalam seminggu dari HISTORY_DAYS hari terakhir. Titik pesan ulang = perkiraan
+pemakaian selama lead time + stok pengaman; jumlah saran pesan menutup kebutuhan
+lead time + periode tinjauan dikurangi stok dan barang yang sudah dipesan.
+
+Pemakaian:
+    python forecast.py refresh [--full]
+"""
+
+import argparse
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, delete, func, insert, select, type_coerce
+from sqlalchemy.orm import Session
+
+from concurrency import run_write
+from menu_matrix import get_menu_matrix
+from models import BahanBaku, PemakaianBahanHarian, PenjualanHarian
+from purchasing import create_orders, on_order
+
+HISTORY_DAYS = 56     # 8 minggu untuk faktor musiman mingguan
+ROLLING_DAYS = 28     # rata-rata bergulir pemakaian harian
+LEAD_TIME_DAYS = 3    # waktu tunggu pengiriman supplier
+REVIEW_DAYS = 7       # jarak antar pemesanan
+SERVICE_Z = 1.65      # tingkat layanan ~95%
+
+
+def expand_usage(matrix, tanggal, menu_ids, jumlah):
+    """Memekarkan penjualan (tanggal, menu, jumlah) menjadi pemakaian per (tanggal, bahan).
+
+    Mengembalikan DataFrame kolom tanggal, bahan_id, jumlah (hanya nilai bukan nol).
+    """
+    menu_idx = np.fromiter((matrix.menu_index.get(m, -1) for m in menu_ids), dtype=np.int64,
+                           count=len(menu_ids))
+    known = menu_idx >= 0
+    days, day_idx = np.unique(np.asarray(tanggal, dtype=object)[known], return_inverse=True)
+    positions, entries = matrix.expand_menus(menu_idx[known])
+    weights = np.asarray(jumlah, dtype=np.float64)[known][positions] * matrix.qty[entries]
+    usage = np.bincount(day_idx[positions] * matrix.n_bahan + matrix.cols[entries],
+                        weights=weights, minlength=len(days) * matrix.n_bahan)
+    flat = np.flatnonzero(usage)
+    return pd.DataFrame({
+        "tanggal": days[flat // matrix.n_bahan],
+        "bahan_id": matrix.bahan_ids[flat % matrix.n_bahan],
+        "jumlah": usage[flat].round().astype(np.int64),
+    })
+
+
+def refresh_usage(session: Session, full=False):
+    """Menambahkan pemakaian untuk hari-hari yang belum diproses (tanpa commit).
+
+    Hari terakhir yang sudah tersimpan ikut dihitung ulang karena bisa jadi
+    penjualannya belum lengkap saat itu. full=True membangun ulang seluruh riwayat,
+    mis. setelah rollup penjualan dibangun ulang. Mengembalikan jumlah baris ditulis.
+    """
+    since = None if full else session.scalar(select(func.max(PemakaianBahanHarian.tanggal)))
+    in_range = [] if since is None else [PemakaianBahanHarian.tanggal >= since]
+    session.execute(delete(PemakaianBahanHarian).where(*in_range))
+
+    sales = session.execute(
+        select(PenjualanHarian.tanggal, PenjualanHarian.menu_id, func.sum(PenjualanHarian.jumlah_item))
+        .where(*([] if since is None else [PenjualanHarian.tanggal >= since]))
+        .group_by(PenjualanHarian.tanggal, PenjualanHarian.menu_id)
+    ).all()
+    if not sales:
+        return 0
+    tanggal, menu_ids, jumlah = zip(*sales)
+    usage = expand_usage(get_menu_matrix(session), tanggal, menu_ids, jumlah)
+    if len(usage):
+        # Insert Core langsung ke tabel: jauh lebih cepat daripada bulk insert ORM untuk ratusan ribu baris
+        session.execute(insert(PemakaianBahanHarian.__table__), [
+            {"tanggal": t, "bahan_id": b, "jumlah": j}
+            for t, b, j in zip(usage["tanggal"], usage["bahan_id"], usage["jumlah"].tolist())
+        ])
+    return len(usage)
+
+
+def _usage_matrix(session, bahan_ids, as_of):
+    """Array (HISTORY_DAYS x bahan) pemakaian harian sebelum as_of, hari tanpa penjualan = 0."""
+    start = as_of - timedelta(days=HISTORY_DAYS)
+    rows = session.execute(
+        select(PemakaianBahanHarian.tanggal, PemakaianBahanHarian.bahan_id, PemakaianBahanHarian.jumlah)
+        .where(PemakaianBahanHarian.tanggal >= start, PemakaianBahanHarian.tanggal < as_of)
+    ).all()
+    usage = np.zeros((HISTORY_DAYS, len(bahan_ids)), dtype=np.float64)
+    if rows:
+        column = {bahan_id: j for j, bahan_id in enumerate(bahan_ids)}
+        tanggal, bahan, jumlah = zip(*rows)
+        day_idx = np.fromiter(((t - start).days for t in tanggal), dtype=np.int64, count=len(rows))
+        col_idx = np.fromiter((column.get(b, -1) for b in bahan), dtype=np.int64, count=len(rows))
+        known = col_idx >= 0
+        np.add.at(usage, (day_idx[known], col_idx[known]), np.asarray(jumlah, dtype=np.float64)[known])
+    return usage, start
+
+
+def reorder_plan(session: Session, as_of=None):
+    """Perkiraan pemakaian, titik pesan ulang, dan saran pesan untuk setiap bahan baku.
+
+    Semua bahan dihitung sekaligus sebagai array; mengembalikan DataFrame per bahan.
+    """
+    as_of = as_of or date.today()
+    bahan = session.execute(
+        select(BahanBaku.bahan_id, BahanBaku.nama_bahan, BahanBaku.satuan, BahanBaku.supplier_id,
+               BahanBaku.stock, type_coerce(BahanBaku.harga_bahan, Float))
+        .order_by(BahanBaku.bahan_id)
+    ).all()
+    columns = ["bahan_id", "nama_bahan", "satuan", "supplier_id", "stock", "harga_bahan"]
+    plan = pd.DataFrame(bahan, columns=columns)
+    if plan.empty:
+        return plan
+
+    usage, start = _usage_matrix(session, list(plan["bahan_id"]), as_of)
+    recent = usage[-ROLLING_DAYS:]
+    rata_rata = recent.mean(axis=0)
+
+    # Faktor musiman: rata-rata per hari dalam seminggu dibanding rata-rata keseluruhan
+    weekdays = np.array([(start + timedelta(days=d)).weekday() for d in range(HISTORY_DAYS)])
+    overall = usage.mean(axis=0)
+    faktor = np.ones((7, usage.shape[1]))
+    for wd in range(7):
+        per_wd = usage[weekdays == wd].mean(axis=0)
+        np.divide(per_wd, overall, out=faktor[wd], where=overall > 0)
+
+    def demand(days):
+        upcoming = [(as_of + timedelta(days=d)).weekday() for d in range(days)]
+        return (rata_rata * faktor[upcoming]).sum(axis=0)
+
+    pengaman = SERVICE_Z * recent.std(axis=0) * math.sqrt(LEAD_TIME_DAYS)
+    titik_pesan = demand(LEAD_TIME_DAYS) + pengaman
+    target = demand(LEAD_TIME_DAYS + REVIEW_DAYS) + pengaman
+
+    dipesan = on_order(session)
+    plan["dipesan"] = plan["bahan_id"].map(dipesan).fillna(0).astype(np.int64)
+    posisi = plan["stock"].to_numpy() + plan["dipesan"].to_numpy()
+    plan["rata_rata_harian"] = rata_rata
+    plan["titik_pesan_ulang"] = np.ceil(titik_pesan).astype(np.int64)
+    plan["saran_pesan"] = np.where(posisi <= titik_pesan, np.ceil(np.maximum(target - posisi, 0)), 0).astype(np.int64)
+    return plan
+
+
+def create_draft_orders(session: Session, plan, tanggal=None):
+    """Membuat satu draft PemesananBahan per supplier untuk semua bahan dengan saran_pesan > 0.
+
+    Bahan tanpa supplier dilewati. Mengembalikan {supplier_id: pemesanan_id}.
+    """
+    pesan = plan[(plan["saran_pesan"] > 0) & plan["supplier_id"].notna()]
+    orders = {
+        supplier_id: list(zip(group["bahan_id"], group["saran_pesan"].astype(int), group["harga_bahan"]))
+        for supplier_id, group in pesan.groupby("supplier_id")
+    }
+    return create_orders(session, tanggal or date.today(), orders)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kelola data pemakaian bahan harian.")
+    parser.add_argument("command", choices=["refresh"])
+    parser.add_argument("--full", action="store_true", help="bangun ulang seluruh riwayat")
+    args = parser.parse_args()
+
+    from db_config import SessionLocal, init_db
+
+    init_db()
+    with SessionLocal() as session:
+        written = run_write(session, refresh_usage, full=args.full)
+    print(f"{written} baris pemakaian bahan harian ditulis.")
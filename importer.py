@@ -0,0 +1,363 @@
+# importer.py
+
+"""Impor massal data master dan riwayat penjualan dari file CSV atau Excel.
+
+Seluruh file dibaca sebagai teks lalu divalidasi sekaligus dengan operasi vektor
+pandas: kolom wajib kosong, angka/tanggal tidak valid, ID melebihi panjang kolom,
+ID ganda di dalam file, dan foreign key yang tidak ada di database. Baris yang
+lolos ditulis per potongan (chunk_size baris) dengan bulk insert/upsert Core,
+satu transaksi per potongan; baris yang ditolak dikembalikan beserta alasannya.
+
+Data master (menu, bahan_baku, komposisi_menu, pelanggan) di-upsert berdasarkan
+primary key, sehingga file yang sama aman diimpor ulang. Riwayat transaksi
+diimpor dari satu file baris detail (satu baris per menu per transaksi); header
+Transaksi diturunkan dari baris-baris tersebut dan tidak boleh sudah ada. Setelah
+riwayat masuk, rollup penjualan harian dibangun ulang untuk rentang tanggalnya
+dan pemakaian bahan harian dihitung ulang.
+
+Impor data master sebelum data yang merujuknya (menu dan bahan baku sebelum
+komposisi, pelanggan dan menu sebelum transaksi). File Excel memerlukan paket
+opsional openpyxl.
+
+Pemakaian:
+    python importer.py <dataset> <file> [--rejects ditolak.csv] [--dry-run]
+"""
+
+import argparse
+import itertools
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+import forecast
+import rollup
+from concurrency import run_write
+from models import (
+    BahanBaku, DetailTransaksi, Karyawan, KomposisiMenu, Menu, Pelanggan, Supplier, Transaksi
+)
+from utils import mark_tables_changed
+
+DEFAULT_CHUNK_SIZE = 50_000
+# Batas parameter per statement SQLite (SQLITE_MAX_VARIABLE_NUMBER sejak 3.32)
+MAX_SQL_PARAMS = 32766
+# Jumlah nilai per query IN saat memeriksa ID yang sudah ada di database
+LOOKUP_BATCH = 10_000
+
+
+class ImporterError(Exception):
+    """File impor tidak dapat diproses."""
+
+
+class Field(NamedTuple):
+    name: str
+    kind: str = "str"                  # str, int, money, date
+    required: bool = True
+    references: Optional[Any] = None   # kolom yang dirujuk (foreign key)
+
+
+class ImportSpec(NamedTuple):
+    tables: tuple        # model tujuan; yang pertama dipakai untuk upsert data master
+    key: tuple           # kolom yang harus unik di dalam file
+    fields: list
+
+
+class ImportResult(NamedTuple):
+    diterima: int
+    ditolak: pd.DataFrame
+    potongan: int
+
+
+IMPORTS = {
+    "menu": ImportSpec((Menu,), ("menu_id",), [
+        Field("menu_id"), Field("nama_menu"), Field("harga", "money"),
+    ]),
+    "bahan_baku": ImportSpec((BahanBaku,), ("bahan_id",), [
+        Field("bahan_id"), Field("nama_bahan"), Field("stock", "int"), Field("satuan"),
+        Field("harga_bahan", "money"),
+        Field("supplier_id", required=False, references=Supplier.supplier_id),
+    ]),
+    "komposisi_menu": ImportSpec((KomposisiMenu,), ("menu_id", "bahan_id"), [
+        Field("menu_id", references=Menu.menu_id),
+        Field("bahan_id", references=BahanBaku.bahan_id),
+        Field("jumlah_bahan", "int"),
+    ]),
+    "pelanggan": ImportSpec((Pelanggan,), ("pelanggan_id",), [
+        Field("pelanggan_id"), Field("cus_name"), Field("contact_info"),
+    ]),
+    # Satu baris per menu per transaksi; harga = subtotal baris (default harga menu x jumlah)
+    "transaksi": ImportSpec((Transaksi, DetailTransaksi), (), [
+        Field("transaksi_id"), Field("tanggal_pembelian", "date"),
+        Field("pelanggan_id", references=Pelanggan.pelanggan_id),
+        Field("karyawan_id", references=Karyawan.karyawan_id),
+        Field("menu_id", references=Menu.menu_id),
+        Field("jumlah", "int"), Field("harga", "money", required=False),
+    ]),
+}
+
+# Kolom header transaksi yang harus sama di semua baris satu transaksi
+HEADER_FIELDS = ["tanggal_pembelian", "pelanggan_id", "karyawan_id"]
+
+
+def read_file(source, file_name=None):
+    """Membaca CSV/Excel (path atau file terbuka) sebagai DataFrame teks."""
+    name = (file_name or getattr(source, "name", None) or str(source)).lower()
+    if name.endswith((".xlsx", ".xls")):
+        try:
+            return pd.read_excel(source, dtype=str)
+        except ImportError as exc:
+            raise ImporterError("Impor Excel memerlukan paket openpyxl.") from exc
+    return pd.read_csv(source, dtype=str, keep_default_na=False)
+
+
+def _column_length(spec, name):
+    for model in spec.tables:
+        column = model.__table__.c.get(name)
+        if column is not None:
+            return getattr(column.type, "length", None)
+    return None
+
+
+def _existing(session, column, values):
+    """Himpunan nilai yang sudah ada di kolom database, dicari per batch IN (...)."""
+    values = list(values)
+    found = set()
+    for i in range(0, len(values), LOOKUP_BATCH):
+        found.update(session.scalars(select(column).where(column.in_(values[i:i + LOOKUP_BATCH]))))
+    return found
+
+
+def _mask(series):
+    return series.fillna(False).to_numpy(dtype=bool)
+
+
+def validate(session: Session, dataset, frame):
+    """Memvalidasi seluruh DataFrame sekaligus.
+
+    Mengembalikan (clean, ditolak): clean berisi baris valid dengan tipe yang sudah
+    dikonversi, ditolak berisi baris asli beserta nomor baris file dan alasannya.
+    """
+    spec = IMPORTS[dataset]
+    missing = [f.name for f in spec.fields if f.required and f.name not in frame.columns]
+    if missing:
+        raise ImporterError(f"Kolom wajib tidak ada: {', '.join(missing)}.")
+
+    clean = pd.DataFrame(index=frame.index)
+    problems = []   # (mask boolean per baris, alasan)
+    for field in (f for f in spec.fields if f.name in frame.columns):
+        text = frame[field.name].astype("string").str.strip()
+        blank = _mask(text.isna() | (text == ""))
+        if field.required:
+            problems.append((blank, f"{field.name} kosong"))
+        if field.kind == "str":
+            clean[field.name] = text.astype(object).where(~blank, None)
+            length = _column_length(spec, field.name)
+            if length:
+                problems.append((_mask(text.str.len() > length), f"{field.name} lebih dari {length} karakter"))
+        elif field.kind == "date":
+            parsed = pd.to_datetime(text, errors="coerce", format="ISO8601")
+            problems.append((~blank & _mask(parsed.isna()), f"{field.name} bukan tanggal yang valid"))
+            clean[field.name] = parsed
+        else:
+            number = pd.to_numeric(text, errors="coerce")
+            invalid = _mask(number.isna() | (number < 0))
+            if field.kind == "int":
+                invalid |= _mask(number % 1 != 0)
+            problems.append((~blank & invalid, f"{field.name} bukan angka yang valid"))
+            clean[field.name] = number
+        if field.references is not None:
+            values = clean[field.name][~blank]
+            known = _existing(session, field.references, values.unique())
+            unknown = np.zeros(len(frame), dtype=bool)
+            unknown[~blank] = ~values.isin(known).to_numpy()
+            problems.append((unknown, f"{field.name} tidak ditemukan"))
+    if spec.key:
+        problems.append((clean.duplicated(list(spec.key), keep=False).to_numpy(),
+                         f"{' + '.join(spec.key)} ganda di dalam file"))
+    if dataset == "transaksi":
+        problems += _transaksi_problems(session, clean, problems)
+
+    rejected = np.zeros(len(frame), dtype=bool)
+    for mask, _ in problems:
+        rejected |= mask
+    alasan = pd.Series("", index=frame.index[rejected], dtype=object)
+    for mask, reason in problems:
+        hit = mask[rejected]
+        if hit.any():
+            alasan[hit] = alasan[hit] + reason + "; "
+    ditolak = frame[rejected].assign(baris=frame.index[rejected] + 2, alasan=alasan.str.rstrip("; "))
+    return clean[~rejected], ditolak
+
+
+def _transaksi_problems(session, clean, problems):
+    """Pemeriksaan tingkat transaksi: header konsisten, ID belum ada, dan semua baris valid."""
+    ids = clean["transaksi_id"]
+    result = [(_mask(ids.isin(_existing(session, Transaksi.transaksi_id, ids.dropna().unique()))),
+               "transaksi_id sudah ada")]
+    grouped = clean.groupby("transaksi_id", sort=False)
+    inconsistent = (grouped[HEADER_FIELDS].transform("nunique") > 1).any(axis=1)
+    result.append((_mask(inconsistent), "tanggal/pelanggan/karyawan berbeda dalam satu transaksi"))
+
+    # Transaksi disimpan utuh: satu baris ditolak berarti seluruh transaksinya ditolak
+    bad_line = np.zeros(len(clean), dtype=bool)
+    for mask, _ in problems + result:
+        bad_line |= mask
+    bad_ids = ids[bad_line].dropna().unique()
+    result.append((_mask(ids.isin(bad_ids)) & ~bad_line, "baris lain dalam transaksi ini ditolak"))
+    return result
+
+
+def _python_column(series, kind):
+    """Nilai kolom sebagai tipe bawaan sqlite3 (int/float/str/None); tanggal menjadi teks ISO."""
+    if kind == "date":
+        return series.dt.strftime("%Y-%m-%d").tolist()
+    if kind == "int":
+        series = series.astype("Int64")
+    elif kind == "money":
+        series = series.astype("Float64")
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _rows(frame, kinds):
+    return list(zip(*(_python_column(frame[name], kind) for name, kind in kinds.items())))
+
+
+def _insert_rows(session, table, kinds, rows):
+    """INSERT executemany langsung ke driver, tanpa pemrosesan parameter per baris SQLAlchemy."""
+    sql = str(insert(table).compile(dialect=session.get_bind().dialect, column_keys=list(kinds)))
+    session.connection().exec_driver_sql(sql, rows)
+    mark_tables_changed(session, table.name)
+
+
+def _upsert_rows(session, table, kinds, rows):
+    """Upsert berdasarkan primary key dengan INSERT multi-VALUES ... ON CONFLICT DO UPDATE.
+
+    Sebanyak mungkin baris per statement, bukan executemany: trigger indeks
+    pencarian FTS5 (search.py) jauh lebih murah bila indeks ditulis sekali per statement.
+    """
+    columns = list(kinds)
+    pk = [c.name for c in table.primary_key.columns]
+    updates = [f"{name} = excluded.{name}" for name in columns if name not in pk]
+    if "version_id" in table.c:
+        updates.append("version_id = version_id + 1")
+    updates = ", ".join(updates)
+    conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+    per_statement = MAX_SQL_PARAMS // len(columns)
+    conn = session.connection()
+    for start in range(0, len(rows), per_statement):
+        batch = rows[start:start + per_statement]
+        conn.exec_driver_sql(
+            f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES {', '.join([placeholder] * len(batch))} "
+            f"ON CONFLICT ({', '.join(pk)}) {conflict}",
+            tuple(itertools.chain.from_iterable(batch)),
+        )
+    mark_tables_changed(session, table.name)
+
+
+def _load_master(session, spec, clean, chunk_size):
+    table = spec.tables[0].__table__
+    kinds = {f.name: f.kind for f in spec.fields if f.name in clean.columns}
+    chunks = 0
+    for start in range(0, len(clean), chunk_size):
+        rows = _rows(clean.iloc[start:start + chunk_size], kinds)
+        _write_chunk(session, chunks, lambda: _upsert_rows(session, table, kinds, rows))
+        chunks += 1
+    return chunks
+
+
+def _load_transaksi(session, clean, chunk_size):
+    """Menulis header + detail transaksi; baris satu transaksi selalu di potongan yang sama."""
+    if "harga" not in clean.columns:
+        clean = clean.assign(harga=np.nan)
+    harga_menu = dict(session.execute(
+        select(Menu.menu_id, Menu.harga).where(Menu.menu_id.in_(clean["menu_id"].unique().tolist()))
+    ).all())
+    subtotal = clean["menu_id"].map({m: float(h) for m, h in harga_menu.items()}) * clean["jumlah"]
+    clean = clean.assign(harga=clean["harga"].fillna(subtotal))
+
+    codes, _ = pd.factorize(clean["transaksi_id"])
+    order = np.argsort(codes, kind="stable")
+    clean, codes = clean.iloc[order], codes[order]
+    lines = np.bincount(codes)
+    tx_chunk = (np.cumsum(lines) - lines) // chunk_size
+    line_chunk = tx_chunk[codes]
+
+    headers = clean.groupby("transaksi_id", sort=False).agg(
+        tanggal_pembelian=("tanggal_pembelian", "first"), pelanggan_id=("pelanggan_id", "first"),
+        karyawan_id=("karyawan_id", "first"), total_transaksi=("harga", "sum"),
+    ).reset_index()
+    header_kinds = {"transaksi_id": "str", "tanggal_pembelian": "date", "pelanggan_id": "str",
+                    "karyawan_id": "str", "total_transaksi": "money"}
+    detail_kinds = {"transaksi_id": "str", "menu_id": "str", "jumlah": "int", "harga": "money"}
+    header_rows = _rows(headers, header_kinds)
+    detail_rows = _rows(clean, detail_kinds)
+    # Batas potongan dalam urutan baris (header dan detail sudah terurut per transaksi)
+    header_bounds = np.searchsorted(tx_chunk, np.arange(int(tx_chunk.max()) + 2)) if len(tx_chunk) else [0]
+    line_bounds = np.searchsorted(line_chunk, np.arange(len(header_bounds)))
+    n_chunks = len(header_bounds) - 1
+    for k in range(n_chunks):
+        def write():
+            _insert_rows(session, Transaksi.__table__, header_kinds,
+                         header_rows[header_bounds[k]:header_bounds[k + 1]])
+            _insert_rows(session, DetailTransaksi.__table__, detail_kinds,
+                         detail_rows[line_bounds[k]:line_bounds[k + 1]])
+        _write_chunk(session, k, write)
+
+    # Rollup dan pemakaian bahan harus mengikuti riwayat yang baru masuk
+    start, end = clean["tanggal_pembelian"].min().date(), clean["tanggal_pembelian"].max().date()
+
+    def refresh(session):
+        rollup.rebuild(session, start, end)
+        forecast.refresh_usage(session, full=True)
+
+    run_write(session, refresh)
+    return n_chunks
+
+
+def _write_chunk(session, chunk_number, write):
+    try:
+        run_write(session, lambda session: write())
+    except Exception as exc:
+        raise ImporterError(
+            f"Potongan ke-{chunk_number + 1} gagal disimpan ({exc}); potongan sebelumnya sudah tersimpan."
+        ) from exc
+
+
+def import_frame(session: Session, dataset, frame, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """Memvalidasi lalu menyimpan baris valid per potongan. Mengembalikan ImportResult."""
+    clean, ditolak = validate(session, dataset, frame)
+    if dry_run or clean.empty:
+        return ImportResult(len(clean), ditolak, 0)
+    if dataset == "transaksi":
+        chunks = _load_transaksi(session, clean, chunk_size)
+    else:
+        chunks = _load_master(session, IMPORTS[dataset], clean, chunk_size)
+    return ImportResult(len(clean), ditolak, chunks)
+
+
+def import_file(session: Session, dataset, source, file_name=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                dry_run=False):
+    """Membaca file CSV/Excel lalu mengimpornya (lihat import_frame)."""
+    return import_frame(session, dataset, read_file(source, file_name), chunk_size, dry_run)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Impor data master atau riwayat transaksi.")
+    parser.add_argument("dataset", choices=list(IMPORTS))
+    parser.add_argument("file")
+    parser.add_argument("--rejects", help="tulis baris yang ditolak ke file CSV ini")
+    parser.add_argument("--dry-run", action="store_true", help="hanya validasi, tanpa menyimpan")
+    args = parser.parse_args()
+
+    from db_config import SessionLocal, init_db
+
+    init_db()
+    with SessionLocal() as session:
+        hasil = import_file(session, args.dataset, args.file, dry_run=args.dry_run)
+    print(f"{hasil.diterima} baris valid, {len(hasil.ditolak)} ditolak, {hasil.potongan} potongan disimpan.")
+    if args.rejects and len(hasil.ditolak):
+        hasil.ditolak.to_csv(args.rejects, index=False)
+        print(f"Baris yang ditolak ditulis ke {args.rejects}.")
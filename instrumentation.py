@@ -0,0 +1,240 @@
+# instrumentation.py
+
+"""Pencatatan latensi SQL per halaman lewat event cursor SQLAlchemy.
+
+Pengganti echo=True untuk mencari halaman yang lambat: alih-alih mencetak setiap
+statement ke stdout, event before/after_cursor_execute pada engine mencatat
+durasi, jumlah baris, dan jumlah panggilan per bentuk statement (spasi, literal,
+dan daftar parameter IN dinormalisasi). Catatan dikelompokkan menurut halaman
+Streamlit (fungsi manage_*) yang sedang berjalan; halaman aktif disimpan di
+contextvar oleh page_scope(), sehingga aman untuk beberapa sesi (thread) sekaligus.
+
+SELECT dengan bentuk yang sama yang berulang minimal N_PLUS_ONE_THRESHOLD kali
+dalam satu rerun halaman ditandai sebagai pola N+1. Ringkasan dibaca lewat
+snapshot() atau to_json() dan ditampilkan di panel admin views/sql_stats.py.
+
+Pencatatan hanya aktif setelah instrument(engine) dipanggil; bootstrap.py melakukannya
+bila RESTORIFY_SQL_STATS=1. Tanpa itu engine tidak memiliki listener tambahan.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import event
+
+SQL_STATS_ENABLED = os.environ.get("RESTORIFY_SQL_STATS", "0") == "1"
+
+N_PLUS_ONE_THRESHOLD = 10
+OUTSIDE_PAGE = "(di luar halaman)"
+
+_SPACE = re.compile(r"\s+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@functools.lru_cache(maxsize=4096)
+def statement_shape(statement):
+    """Bentuk statement: spasi diringkas, literal dan daftar (?, ?, ...) diganti placeholder."""
+    shape = _LITERAL.sub("?", _SPACE.sub(" ", statement).strip())
+    return _PARAM_LIST.sub("(?, ...)", shape)
+
+
+class StatementStats:
+    """Akumulasi satu bentuk statement di satu halaman."""
+
+    __slots__ = ("calls", "total_ms", "max_ms", "rows")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+
+class PageStats:
+    """Akumulasi rerun satu halaman: waktu total, waktu SQL, dan jumlah query."""
+
+    __slots__ = ("reruns", "total_ms", "max_ms", "sql_ms", "queries")
+
+    def __init__(self):
+        self.reruns = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.sql_ms = 0.0
+        self.queries = 0
+
+
+class NPlusOne(NamedTuple):
+    halaman: str
+    bentuk: str
+    maks_per_rerun: int  # pengulangan terbanyak dalam satu rerun
+    kejadian: int  # jumlah rerun yang memicu temuan ini
+    terakhir: datetime
+
+
+class _Rerun:
+    """Query yang dijalankan selama satu rerun halaman."""
+
+    __slots__ = ("page", "shapes", "sql_ms")
+
+    def __init__(self, page):
+        self.page = page
+        self.shapes = Counter()
+        self.sql_ms = 0.0
+
+
+class _CountingCursor:
+    """Membungkus cursor DBAPI agar baris yang di-fetch ikut dihitung ke StatementStats."""
+
+    __slots__ = ("_cursor", "_stats")
+
+    def __init__(self, cursor, stats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def _count(self, n):
+        with _lock:
+            self._stats.rows += n
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+_current = ContextVar("sql_stats_rerun", default=None)
+_lock = threading.Lock()
+_statements = {}  # (halaman, bentuk) -> StatementStats
+_pages = {}  # halaman -> PageStats
+_findings = {}  # (halaman, bentuk) -> NPlusOne
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["sql_stats_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = (time.perf_counter() - conn.info.pop("sql_stats_start")) * 1000
+    rerun = _current.get()
+    shape = statement_shape(statement)
+    key = (rerun.page if rerun is not None else OUTSIDE_PAGE, shape)
+    with _lock:
+        stats = _statements.get(key)
+        if stats is None:
+            stats = _statements[key] = StatementStats()
+        stats.calls += 1
+        stats.total_ms += elapsed
+        stats.max_ms = max(stats.max_ms, elapsed)
+        if cursor.description is None and cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+    if rerun is not None:
+        rerun.shapes[shape] += 1
+        rerun.sql_ms += elapsed
+    if cursor.description is not None and context is not None:
+        # Baris hasil SELECT/RETURNING baru diketahui saat di-fetch oleh Result
+        context.cursor = _CountingCursor(cursor, stats)
+
+
+def instrument(engine):
+    """Memasang listener pencatat pada engine; aman dipanggil berulang kali."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstrument(engine):
+    """Melepas listener pencatat dari engine; statistik yang sudah ada tetap disimpan."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextlib.contextmanager
+def page_scope(page):
+    """Mengelompokkan query di dalam blok ke halaman page sebagai satu rerun."""
+    rerun = _Rerun(page)
+    token = _current.set(rerun)
+    start = time.perf_counter()
+    try:
+        yield rerun
+    finally:
+        _current.reset(token)
+        elapsed = (time.perf_counter() - start) * 1000
+        repeated = [(shape, n) for shape, n in rerun.shapes.items()
+                    if n >= N_PLUS_ONE_THRESHOLD and shape.upper().startswith("SELECT")]
+        with _lock:
+            stats = _pages.get(page)
+            if stats is None:
+                stats = _pages[page] = PageStats()
+            stats.reruns += 1
+            stats.total_ms += elapsed
+            stats.max_ms = max(stats.max_ms, elapsed)
+            stats.sql_ms += rerun.sql_ms
+            stats.queries += sum(rerun.shapes.values())
+            now = datetime.now()
+            for shape, n in repeated:
+                found = _findings.get((page, shape))
+                if found is None:
+                    found = NPlusOne(page, shape, 0, 0, now)
+                _findings[(page, shape)] = found._replace(
+                    maks_per_rerun=max(found.maks_per_rerun, n), kejadian=found.kejadian + 1, terakhir=now)
+
+
+def reset():
+    """Menghapus semua statistik yang terkumpul."""
+    with _lock:
+        _statements.clear()
+        _pages.clear()
+        _findings.clear()
+
+
+def snapshot():
+    """Ringkasan statistik sebagai dict yang siap dijadikan JSON atau DataFrame."""
+    with _lock:
+        pages = [
+            {"halaman": page, "rerun": s.reruns, "rata_rata_ms": s.total_ms / s.reruns, "maks_ms": s.max_ms,
+             "sql_ms_per_rerun": s.sql_ms / s.reruns, "query_per_rerun": s.queries / s.reruns}
+            for page, s in _pages.items()
+        ]
+        statements = [
+            {"halaman": page, "bentuk": shape, "panggilan": s.calls, "total_ms": s.total_ms,
+             "rata_rata_ms": s.total_ms / s.calls, "maks_ms": s.max_ms, "baris": s.rows}
+            for (page, shape), s in _statements.items()
+        ]
+        findings = [f._replace(terakhir=f.terakhir.isoformat(timespec="seconds"))._asdict()
+                    for f in _findings.values()]
+    return {
+        "dibuat": datetime.now().isoformat(timespec="seconds"),
+        "ambang_n_plus_1": N_PLUS_ONE_THRESHOLD,
+        "halaman": sorted(pages, key=lambda p: p["rata_rata_ms"], reverse=True),
+        "statement": sorted(statements, key=lambda s: s["total_ms"], reverse=True),
+        "n_plus_1": sorted(findings, key=lambda f: f["maks_per_rerun"], reverse=True),
+    }
+
+
+def to_json(indent=2):
+    """snapshot() dalam bentuk teks JSON untuk diunduh atau disimpan."""
+    return json.dumps(snapshot(), ensure_ascii=False, indent=indent)
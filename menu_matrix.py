@@ -0,0 +1,112 @@
+# menu_matrix.py
+
+"""Komposisi menu sebagai matriks jarang (sparse) menu x bahan baku.
+
+Tabel komposisi_menu dimuat sekali menjadi tiga array NumPy berformat COO
+(indeks menu, indeks bahan, jumlah bahan), sehingga perhitungan per menu
+(biaya bahan, porsi tersedia, dll.) bisa dilakukan sekaligus untuk semua menu
+tanpa query per baris. Matriks di-cache sampai tabel menu atau komposisi_menu berubah.
+"""
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import KomposisiMenu, Menu
+from utils import cached_by_version
+
+MATRIX_TABLES = (Menu.__tablename__, KomposisiMenu.__tablename__)
+
+
+class MenuMatrix:
+    """Matriks komposisi berformat COO dengan indeks tambahan per bahan (mirip CSC)
+    dan per menu (mirip CSR)."""
+
+    def __init__(self, menu_ids, bahan_ids, rows, cols, qty):
+        self.menu_ids = menu_ids
+        self.bahan_ids = bahan_ids
+        self.menu_index = {menu_id: i for i, menu_id in enumerate(menu_ids)}
+        self.bahan_index = {bahan_id: j for j, bahan_id in enumerate(bahan_ids)}
+        self.rows = rows
+        self.cols = cols
+        self.qty = qty
+        # Entri diurutkan per bahan agar menu pemakai satu bahan bisa diambil sebagai irisan
+        self._by_bahan = np.argsort(cols, kind="stable")
+        self._bahan_offsets = np.searchsorted(cols[self._by_bahan], np.arange(len(bahan_ids) + 1))
+        self._by_menu = np.argsort(rows, kind="stable")
+        self._menu_offsets = np.searchsorted(rows[self._by_menu], np.arange(len(menu_ids) + 1))
+
+    @property
+    def n_menu(self):
+        return len(self.menu_ids)
+
+    @property
+    def n_bahan(self):
+        return len(self.bahan_ids)
+
+    def entries_for_bahan(self, bahan_id):
+        """Indeks entri COO milik satu bahan (kosong jika bahan tidak dipakai menu mana pun)."""
+        j = self.bahan_index.get(bahan_id)
+        if j is None:
+            return self._by_bahan[:0]
+        return self._by_bahan[self._bahan_offsets[j]:self._bahan_offsets[j + 1]]
+
+    def entries_for_columns(self, bahan_idx):
+        """Indeks entri COO milik sekumpulan bahan (berdasarkan indeks kolom)."""
+        if len(bahan_idx) == 0:
+            return self._by_bahan[:0]
+        return np.concatenate([self._by_bahan[self._bahan_offsets[j]:self._bahan_offsets[j + 1]]
+                               for j in bahan_idx])
+
+    def entries_for_menus(self, menu_idx):
+        """Indeks entri COO milik sekumpulan menu (berdasarkan indeks baris)."""
+        return self.expand_menus(menu_idx)[1]
+
+    def expand_menus(self, menu_idx):
+        """Memekarkan daftar indeks menu menjadi entri komposisinya, tanpa loop Python.
+
+        Mengembalikan (posisi, entri): entri[k] adalah indeks entri COO dan posisi[k]
+        menunjuk elemen menu_idx asalnya, sehingga nilai per baris input (mis. jumlah
+        terjual) bisa dibawa ke setiap bahan dengan nilai[posisi].
+        """
+        menu_idx = np.asarray(menu_idx, dtype=np.int64)
+        starts = self._menu_offsets[menu_idx]
+        counts = self._menu_offsets[menu_idx + 1] - starts
+        positions = np.repeat(np.arange(len(menu_idx)), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return positions, self._by_menu[np.repeat(starts, counts) + within]
+
+    def matvec(self, per_bahan):
+        """Menghitung sum(jumlah_bahan x per_bahan[bahan]) untuk setiap menu."""
+        return np.bincount(self.rows, weights=self.qty * per_bahan[self.cols], minlength=self.n_menu)
+
+    def align_bahan(self, bahan_ids, values, fill=0.0):
+        """Menyusun ulang nilai per bahan (dari query) mengikuti urutan kolom matriks."""
+        aligned = np.full(self.n_bahan, fill, dtype=np.float64)
+        for bahan_id, value in zip(bahan_ids, values):
+            j = self.bahan_index.get(bahan_id)
+            if j is not None:
+                aligned[j] = value
+        return aligned
+
+
+def _load_matrix(session):
+    menu_ids = np.array(session.scalars(select(Menu.menu_id).order_by(Menu.menu_id)).all(), dtype=object)
+    komposisi = session.execute(
+        select(KomposisiMenu.menu_id, KomposisiMenu.bahan_id, KomposisiMenu.jumlah_bahan)
+    ).all()
+    if komposisi:
+        menu_col, bahan_col, qty = (np.array(col, dtype=object) for col in zip(*komposisi))
+    else:
+        menu_col = bahan_col = qty = np.array([], dtype=object)
+    # Kolom matriks hanya bahan yang benar-benar dipakai komposisi
+    bahan_ids, cols = np.unique(bahan_col.astype(str), return_inverse=True)
+    menu_index = {menu_id: i for i, menu_id in enumerate(menu_ids)}
+    rows = np.fromiter((menu_index[m] for m in menu_col), dtype=np.int64, count=len(menu_col))
+    return MenuMatrix(menu_ids, bahan_ids.astype(object), rows, cols.astype(np.int64),
+                      qty.astype(np.float64))
+
+
+def get_menu_matrix(session: Session):
+    """MenuMatrix terkini, dimuat ulang hanya jika menu atau komposisi berubah."""
+    return cached_by_version(("menu_matrix",), MATRIX_TABLES, lambda: _load_matrix(session))
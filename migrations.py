@@ -0,0 +1,266 @@
+# migrations.py
+
+"""Runner migrasi skema berversi untuk database SQLite.
+
+Versi skema disimpan di PRAGMA user_version. Setiap migrasi adalah daftar
+langkah (string SQL atau fungsi yang menerima koneksi) yang dijalankan dalam
+satu transaksi. Base.metadata.create_all hanya membuat tabel baru, sedangkan
+perubahan pada tabel yang sudah ada (indeks, kolom, constraint) dilakukan di sini.
+
+Pemakaian:
+    python migrations.py                # upgrade database ke versi terbaru
+    python migrations.py --check-plans  # gagal (exit 1) jika query panas full scan
+"""
+
+import sys
+
+from sqlalchemy import text
+
+
+def _report(message):
+    # Migrasi juga berjalan saat startup Streamlit; pesan masuk ke log server (stderr)
+    print(f"[migrasi] {message}", file=sys.stderr)
+
+
+def _clear_duplicate_fingerprints(conn):
+    # Sidik jari ganda tidak bisa dibedakan saat scan; simpan milik ID terkecil
+    conn.execute(text("UPDATE karyawan SET fingerprint_id = NULL WHERE fingerprint_id = ''"))
+    duplicates = """
+        FROM karyawan
+        WHERE fingerprint_id IS NOT NULL
+          AND karyawan_id NOT IN (
+              SELECT MIN(karyawan_id) FROM karyawan
+              WHERE fingerprint_id IS NOT NULL
+              GROUP BY fingerprint_id
+          )
+    """
+    cleared = conn.execute(text(f"SELECT karyawan_id, fingerprint_id {duplicates} ORDER BY 1")).all()
+    if not cleared:
+        return
+    conn.execute(text(
+        f"UPDATE karyawan SET fingerprint_id = NULL WHERE karyawan_id IN (SELECT karyawan_id {duplicates})"))
+    _report(f"sidik jari ganda dikosongkan pada {len(cleared)} karyawan (daftarkan ulang): "
+            + ", ".join(f"{karyawan_id} ({fingerprint_id})" for karyawan_id, fingerprint_id in cleared))
+
+
+def _clear_duplicate_payroll(conn):
+    # Satu baris gaji per karyawan per periode; simpan hasil perhitungan terakhir
+    conn.execute(text("""
+        DELETE FROM penggajian
+        WHERE penggajian_id NOT IN (
+            SELECT MAX(penggajian_id) FROM penggajian GROUP BY karyawan_id, bulan, tahun
+        )
+    """))
+
+
+def _add_column(table, column, ddl):
+    # create_all sudah membuat kolom pada database baru; hanya tambahkan jika belum ada
+    def step(conn):
+        columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    return step
+
+
+def _clear_duplicate_absensi(conn):
+    # Satu baris absensi per karyawan per hari; utamakan "Hadir", lalu ID terkecil
+    duplicates = """
+        FROM absensi
+        WHERE absensi_id NOT IN (
+            SELECT (SELECT a.absensi_id FROM absensi a
+                    WHERE a.karyawan_id = g.karyawan_id AND a.tanggal = g.tanggal
+                    ORDER BY a.status = 'Hadir' DESC, a.absensi_id LIMIT 1)
+            FROM (SELECT DISTINCT karyawan_id, tanggal FROM absensi) g
+        )
+    """
+    removed = conn.execute(text(f"SELECT absensi_id {duplicates} ORDER BY 1")).scalars().all()
+    if not removed:
+        return
+    conn.execute(text(f"DELETE {duplicates}"))
+    _report(f"{len(removed)} baris absensi ganda (karyawan dan tanggal yang sama) dihapus, "
+            f"absensi_id: {', '.join(map(str, removed))}")
+
+
+def _backfill_penjualan_harian(conn):
+    import rollup
+
+    rollup.rebuild(conn)
+
+
+def _drop_karyawan_from_penjualan_harian(conn):
+    # Rollup per menu tidak lagi dipecah per karyawan (sudah ada penjualan_harian_karyawan);
+    # baris lama dijumlahkan per (tanggal, menu) ke tabel baru
+    from models import PenjualanHarian
+
+    columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(penjualan_harian)")}
+    if "karyawan_id" not in columns:
+        return
+    conn.exec_driver_sql("ALTER TABLE penjualan_harian RENAME TO penjualan_harian_lama")
+    PenjualanHarian.__table__.create(conn)
+    conn.exec_driver_sql("""
+        INSERT INTO penjualan_harian (tanggal, menu_id, pendapatan, jumlah_order, jumlah_item)
+        SELECT tanggal, menu_id, SUM(pendapatan), SUM(jumlah_order), SUM(jumlah_item)
+        FROM penjualan_harian_lama GROUP BY tanggal, menu_id
+    """)
+    conn.exec_driver_sql("DROP TABLE penjualan_harian_lama")
+
+
+def _create_search_indexes(conn):
+    import search
+
+    search.create_indexes(conn)
+
+
+# (versi, deskripsi, langkah-langkah)
+MIGRATIONS = [
+    (1, "Indeks sekunder untuk query panas dan sidik jari unik", [
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_tanggal_pembelian ON transaksi (tanggal_pembelian)",
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_karyawan_id ON transaksi (karyawan_id)",
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_pelanggan_id ON transaksi (pelanggan_id)",
+        "CREATE INDEX IF NOT EXISTS ix_detail_transaksi_transaksi_id ON detail_transaksi (transaksi_id)",
+        "CREATE INDEX IF NOT EXISTS ix_detail_transaksi_menu_id ON detail_transaksi (menu_id)",
+        "CREATE INDEX IF NOT EXISTS ix_komposisi_menu_bahan_id ON komposisi_menu (bahan_id)",
+        "CREATE INDEX IF NOT EXISTS ix_absensi_karyawan_id_tanggal ON absensi (karyawan_id, tanggal)",
+        "CREATE INDEX IF NOT EXISTS ix_absensi_tanggal ON absensi (tanggal)",
+        "CREATE INDEX IF NOT EXISTS ix_feedback_karyawan_id ON feedback (karyawan_id)",
+        "CREATE INDEX IF NOT EXISTS ix_feedback_pelanggan_id ON feedback (pelanggan_id)",
+        _clear_duplicate_fingerprints,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_karyawan_fingerprint_id ON karyawan (fingerprint_id)",
+    ]),
+    (2, "Indeks komposit transaksi untuk paginasi keyset", [
+        "DROP INDEX IF EXISTS ix_transaksi_tanggal_pembelian",
+        "DROP INDEX IF EXISTS ix_transaksi_karyawan_id",
+        "DROP INDEX IF EXISTS ix_transaksi_pelanggan_id",
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_tanggal_id ON transaksi (tanggal_pembelian, transaksi_id)",
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_karyawan_tanggal "
+        "ON transaksi (karyawan_id, tanggal_pembelian, transaksi_id)",
+        "CREATE INDEX IF NOT EXISTS ix_transaksi_pelanggan_tanggal "
+        "ON transaksi (pelanggan_id, tanggal_pembelian, transaksi_id)",
+    ]),
+    (3, "Isi awal rollup penjualan harian dari transaksi yang sudah ada", [
+        _backfill_penjualan_harian,
+    ]),
+    (4, "Indeks detail pemesanan bahan untuk penerimaan barang", [
+        "CREATE INDEX IF NOT EXISTS ix_detail_pemesanan_pemesanan_bahan "
+        "ON detail_pemesanan_bahan (pemesanan_id, bahan_id)",
+    ]),
+    (5, "Satu baris penggajian per karyawan per periode", [
+        _clear_duplicate_payroll,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_penggajian_karyawan_periode "
+        "ON penggajian (karyawan_id, bulan, tahun)",
+    ]),
+    (6, "Jam masuk/pulang absensi dan satu baris absensi per karyawan per hari", [
+        _add_column("absensi", "jam_masuk", "DATETIME"),
+        _add_column("absensi", "jam_keluar", "DATETIME"),
+        _clear_duplicate_absensi,
+        "DROP INDEX IF EXISTS ix_absensi_karyawan_id_tanggal",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_absensi_karyawan_tanggal ON absensi (karyawan_id, tanggal)",
+    ]),
+    (7, "Indeks pencarian FTS5 pelanggan, menu, dan bahan baku beserta trigger sinkronisasi", [
+        _create_search_indexes,
+    ]),
+    (8, "Kolom version_id bahan baku dan transaksi untuk optimistic concurrency", [
+        _add_column("bahan_baku", "version_id", "INTEGER NOT NULL DEFAULT 1"),
+        _add_column("transaksi", "version_id", "INTEGER NOT NULL DEFAULT 1"),
+    ]),
+    (9, "Rollup penjualan_harian per (tanggal, menu) tanpa karyawan_id", [
+        _drop_karyawan_from_penjualan_harian,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(conn):
+    """Membaca versi skema dari PRAGMA user_version."""
+    return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def analyze(bind):
+    """Mengumpulkan statistik ANALYZE untuk query planner."""
+    with bind.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+
+def upgrade(bind):
+    """Menjalankan migrasi yang belum diterapkan, masing-masing dalam satu transaksi.
+
+    Mengembalikan daftar versi yang baru diterapkan.
+    """
+    applied = []
+    with bind.connect() as conn:
+        version = current_version(conn)
+    for target, description, steps in MIGRATIONS:
+        if target <= version:
+            continue
+        with bind.begin() as conn:
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.exec_driver_sql(step)
+            conn.exec_driver_sql(f"PRAGMA user_version = {target}")
+        applied.append(target)
+    if applied:
+        analyze(bind)
+    return applied
+
+
+# -------------------- PEMERIKSAAN QUERY PLAN --------------------
+# Query panas beserta parameter contoh; semuanya harus memakai indeks (SEARCH)
+# tanpa full scan maupun sort tambahan
+HOT_QUERIES = {
+    "detail per transaksi": (
+        "SELECT * FROM detail_transaksi WHERE transaksi_id = :id", {"id": "T001"}),
+    "transaksi per rentang tanggal": (
+        "SELECT * FROM transaksi WHERE tanggal_pembelian BETWEEN :a AND :b",
+        {"a": "2024-01-01", "b": "2024-12-31"}),
+    "absensi karyawan per tanggal": (
+        "SELECT * FROM absensi WHERE karyawan_id = :k AND tanggal = :t",
+        {"k": "K001", "t": "2024-12-01"}),
+    "feedback per karyawan": (
+        "SELECT * FROM feedback WHERE karyawan_id = :k", {"k": "K001"}),
+    "komposisi per bahan": (
+        "SELECT * FROM komposisi_menu WHERE bahan_id = :b", {"b": "BB1"}),
+    "komposisi per menu": (
+        "SELECT * FROM komposisi_menu WHERE menu_id = :m", {"m": "MN1"}),
+    "halaman transaksi per karyawan": (
+        "SELECT * FROM transaksi WHERE karyawan_id = :k AND (tanggal_pembelian, transaksi_id) < (:t, :id) "
+        "ORDER BY tanggal_pembelian DESC, transaksi_id DESC LIMIT 50",
+        {"k": "K001", "t": "2024-12-01", "id": "T001"}),
+    "detail per pemesanan bahan": (
+        "SELECT SUM(jumlah) FROM detail_pemesanan_bahan WHERE pemesanan_id = :p AND bahan_id = :b",
+        {"p": "PB001", "b": "BB1"}),
+    "karyawan per sidik jari": (
+        "SELECT * FROM karyawan WHERE fingerprint_id = :f", {"f": "FID001"}),
+}
+
+
+def find_full_scans(bind, queries=None):
+    """Mengembalikan {nama query: [baris plan]} untuk query yang melakukan full table scan
+    atau pengurutan tambahan (TEMP B-TREE) di luar indeks."""
+    queries = HOT_QUERIES if queries is None else queries
+    offenders = {}
+    with bind.connect() as conn:
+        for name, (sql, params) in queries.items():
+            plan = [row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql), params)]
+            scans = [line for line in plan
+                     if (line.startswith("SCAN") and " USING " not in line) or "TEMP B-TREE" in line]
+            if scans:
+                offenders[name] = plan
+    return offenders
+
+
+if __name__ == "__main__":
+    from db_config import engine, init_db
+
+    init_db()
+    with engine.connect() as connection:
+        print(f"Versi skema: {current_version(connection)} (terbaru: {LATEST_VERSION})")
+    if "--check-plans" in sys.argv:
+        full_scans = find_full_scans(engine)
+        for query_name, query_plan in full_scans.items():
+            print(f"FULL SCAN: {query_name}: {query_plan}")
+        if full_scans:
+            sys.exit(1)
+        print(f"Semua {len(HOT_QUERIES)} query panas memakai indeks.")
@@ -1,14 +1,17 @@
 # models.py
 
 from sqlalchemy import (
-    Column, String, Integer, Date, DECIMAL,
-    ForeignKey, Text
+    Column, String, Integer, Date, DateTime, DECIMAL,
+    ForeignKey, Text, Index
 )
 from sqlalchemy.orm import relationship
 from db_config import Base
 
 class Karyawan(Base):
     __tablename__ = 'karyawan'
+    __table_args__ = (
+        Index('ux_karyawan_fingerprint_id', 'fingerprint_id', unique=True),
+    )
     karyawan_id = Column(String(5), primary_key=True)
     employee_name = Column(String(50), nullable=False)
     position = Column(String(25), nullable=False)
@@ -66,6 +69,10 @@ class BahanBaku(Base):
     satuan = Column(String(20), nullable=False)
     harga_bahan = Column(DECIMAL(15,2), nullable=False)
     supplier_id = Column(String(5), ForeignKey('supplier.supplier_id'))
+    # Naik di setiap perubahan (termasuk pengurangan stok) untuk optimistic concurrency
+    version_id = Column(Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version_id}
 
     # Relationships
     supplier = relationship('Supplier', back_populates='bahan_baku')
@@ -86,11 +93,20 @@ class Menu(Base):
 
 class Transaksi(Base):
     __tablename__ = 'transaksi'
+    __table_args__ = (
+        # Kolom urut + PK di akhir agar paginasi keyset tidak perlu sort
+        Index('ix_transaksi_tanggal_id', 'tanggal_pembelian', 'transaksi_id'),
+        Index('ix_transaksi_karyawan_tanggal', 'karyawan_id', 'tanggal_pembelian', 'transaksi_id'),
+        Index('ix_transaksi_pelanggan_tanggal', 'pelanggan_id', 'tanggal_pembelian', 'transaksi_id'),
+    )
     transaksi_id = Column(String(5), primary_key=True)
     tanggal_pembelian = Column(Date, nullable=False)
     pelanggan_id = Column(String(5), ForeignKey('pelanggan.pelanggan_id'), nullable=False)
     karyawan_id = Column(String(5), ForeignKey('karyawan.karyawan_id'), nullable=False)
     total_transaksi = Column(DECIMAL(15,2), nullable=False)
+    version_id = Column(Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version_id}
 
     # Relationships
     pelanggan = relationship('Pelanggan', back_populates='transaksi')
@@ -100,6 +116,10 @@ class Transaksi(Base):
 
 class DetailTransaksi(Base):
     __tablename__ = 'detail_transaksi'
+    __table_args__ = (
+        Index('ix_detail_transaksi_transaksi_id', 'transaksi_id'),
+        Index('ix_detail_transaksi_menu_id', 'menu_id'),
+    )
     detail_id = Column(Integer, primary_key=True, autoincrement=True)
     transaksi_id = Column(String(5), ForeignKey('transaksi.transaksi_id'), nullable=False)
     menu_id = Column(String(5), ForeignKey('menu.menu_id'), nullable=False)
@@ -113,6 +133,9 @@ class DetailTransaksi(Base):
 
 class KomposisiMenu(Base):
     __tablename__ = 'komposisi_menu'
+    __table_args__ = (
+        Index('ix_komposisi_menu_bahan_id', 'bahan_id'),
+    )
     menu_id = Column(String(5), ForeignKey('menu.menu_id'), primary_key=True)
     bahan_id = Column(String(5), ForeignKey('bahan_baku.bahan_id'), primary_key=True)
     jumlah_bahan = Column(Integer, nullable=False)
@@ -124,10 +147,18 @@ class KomposisiMenu(Base):
 
 class Absensi(Base):
     __tablename__ = 'absensi'
+    __table_args__ = (
+        # Satu baris absensi per karyawan per hari
+        Index('ux_absensi_karyawan_tanggal', 'karyawan_id', 'tanggal', unique=True),
+        Index('ix_absensi_tanggal', 'tanggal'),
+    )
     absensi_id = Column(Integer, primary_key=True, autoincrement=True)
     karyawan_id = Column(String(5), ForeignKey('karyawan.karyawan_id'), nullable=False)
     tanggal = Column(Date, nullable=False)
     status = Column(String(10), nullable=False)
+    # Scan sidik jari pertama dan terakhir hari itu (kosong untuk absensi manual)
+    jam_masuk = Column(DateTime, nullable=True)
+    jam_keluar = Column(DateTime, nullable=True)
 
     # Relationships
     karyawan = relationship('Karyawan', back_populates='absensi')
@@ -135,6 +166,9 @@ class Absensi(Base):
 
 class Penggajian(Base):
     __tablename__ = 'penggajian'
+    __table_args__ = (
+        Index('ux_penggajian_karyawan_periode', 'karyawan_id', 'bulan', 'tahun', unique=True),
+    )
     penggajian_id = Column(Integer, primary_key=True, autoincrement=True)
     karyawan_id = Column(String(5), ForeignKey('karyawan.karyawan_id'), nullable=False)
     bulan = Column(Integer, nullable=False)
@@ -159,6 +193,9 @@ class PemesananBahan(Base):
 
 class DetailPemesananBahan(Base):
     __tablename__ = 'detail_pemesanan_bahan'
+    __table_args__ = (
+        Index('ix_detail_pemesanan_pemesanan_bahan', 'pemesanan_id', 'bahan_id'),
+    )
     detail_pemesanan_id = Column(Integer, primary_key=True, autoincrement=True)
     pemesanan_id = Column(String(5), ForeignKey('pemesanan_bahan.pemesanan_id'), nullable=False)
     bahan_id = Column(String(5), ForeignKey('bahan_baku.bahan_id'), nullable=False)
@@ -172,6 +209,10 @@ class DetailPemesananBahan(Base):
 
 class Feedback(Base):
     __tablename__ = 'feedback'
+    __table_args__ = (
+        Index('ix_feedback_karyawan_id', 'karyawan_id'),
+        Index('ix_feedback_pelanggan_id', 'pelanggan_id'),
+    )
     feedback_id = Column(Integer, primary_key=True, autoincrement=True)
     pelanggan_id = Column(String(5), ForeignKey('pelanggan.pelanggan_id'), nullable=False)
     karyawan_id = Column(String(5), ForeignKey('karyawan.karyawan_id'), nullable=False)
@@ -182,3 +223,39 @@ class Feedback(Base):
     # Relationships
     pelanggan = relationship('Pelanggan', back_populates='feedbacks')
     karyawan = relationship('Karyawan', back_populates='feedbacks')
+
+
+# Rollup penjualan per hari per menu (diperbarui saat checkout); angka per karyawan
+# ada di penjualan_harian_karyawan, sehingga ukurannya O(hari x menu)
+class PenjualanHarian(Base):
+    __tablename__ = 'penjualan_harian'
+    tanggal = Column(Date, primary_key=True)
+    menu_id = Column(String(5), ForeignKey('menu.menu_id'), primary_key=True)
+    pendapatan = Column(DECIMAL(15,2), nullable=False)
+    jumlah_order = Column(Integer, nullable=False)  # transaksi yang memuat menu ini
+    jumlah_item = Column(Integer, nullable=False)
+
+
+# Rollup penjualan per hari per karyawan; jumlah_order di sini adalah jumlah transaksi
+class PenjualanHarianKaryawan(Base):
+    __tablename__ = 'penjualan_harian_karyawan'
+    tanggal = Column(Date, primary_key=True)
+    karyawan_id = Column(String(5), ForeignKey('karyawan.karyawan_id'), primary_key=True)
+    pendapatan = Column(DECIMAL(15,2), nullable=False)
+    jumlah_order = Column(Integer, nullable=False)
+    jumlah_item = Column(Integer, nullable=False)
+
+
+# Pemakaian bahan per hari, diturunkan dari penjualan_harian x komposisi_menu (forecast.py)
+class PemakaianBahanHarian(Base):
+    __tablename__ = 'pemakaian_bahan_harian'
+    tanggal = Column(Date, primary_key=True)
+    bahan_id = Column(String(5), ForeignKey('bahan_baku.bahan_id'), primary_key=True)
+    jumlah = Column(Integer, nullable=False)
+
+
+# Versi terbit per tabel untuk membuang cache baca di proses lain (utils.sync_table_versions)
+class VersiTabel(Base):
+    __tablename__ = 'versi_tabel'
+    nama_tabel = Column(String(50), primary_key=True)
+    versi = Column(Integer, nullable=False)
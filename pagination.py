@@ -0,0 +1,82 @@
+# pagination.py
+
+"""Paginasi keyset untuk tampilan daftar ("Lihat").
+
+Setiap halaman diambil dengan WHERE (kolom_urut, pk) > (nilai terakhir) ... LIMIT n,
+sehingga biaya per halaman tetap konstan berapa pun ukuran tabelnya (tanpa OFFSET).
+Filter dan pengurutan semuanya dijalankan di SQL.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from utils import projection
+
+
+class ListColumn(NamedTuple):
+    label: str
+    column: Any
+    money: bool = False
+
+
+class ListSpec(NamedTuple):
+    key: str
+    columns: list
+    pk: Any
+    sort_columns: dict
+    date_column: Optional[Any] = None
+    karyawan_column: Optional[Any] = None
+    pelanggan_column: Optional[Any] = None
+    # Atribut relasi untuk kolom dari tabel lain (mis. Transaksi.pelanggan), lewat outer join
+    joins: tuple = ()
+
+
+class Page(NamedTuple):
+    rows: list
+    next_cursor: Optional[tuple]
+
+
+def build_filters(spec: ListSpec, date_range=None, karyawan_id=None, pelanggan_id=None):
+    """Menyusun klausa WHERE dari filter yang didukung spec."""
+    clauses = []
+    if date_range and spec.date_column is not None:
+        start, end = date_range
+        if start is not None:
+            clauses.append(spec.date_column >= start)
+        if end is not None:
+            clauses.append(spec.date_column <= end)
+    if karyawan_id and spec.karyawan_column is not None:
+        clauses.append(spec.karyawan_column == karyawan_id)
+    if pelanggan_id and spec.pelanggan_column is not None:
+        clauses.append(spec.pelanggan_column == pelanggan_id)
+    return clauses
+
+
+def fetch_page(session: Session, spec: ListSpec, sort_label, descending=False,
+               filters=(), cursor=None, limit=50):
+    """Mengambil satu halaman baris setelah cursor (nilai_urut, pk) halaman sebelumnya."""
+    sort_col = spec.sort_columns[sort_label]
+    same_as_pk = sort_col is spec.pk
+    stmt = projection([*[c.column for c in spec.columns], sort_col, spec.pk], spec.joins).where(*filters)
+
+    if cursor is not None:
+        if same_as_pk:
+            stmt = stmt.where(spec.pk < cursor[1] if descending else spec.pk > cursor[1])
+        else:
+            key = tuple_(sort_col, spec.pk)
+            stmt = stmt.where(key < tuple_(*cursor) if descending else key > tuple_(*cursor))
+
+    order = [sort_col] if same_as_pk else [sort_col, spec.pk]
+    stmt = stmt.order_by(*[c.desc() if descending else c.asc() for c in order])
+    # Ambil satu baris ekstra untuk mengetahui apakah masih ada halaman berikutnya
+    result = session.execute(stmt.limit(limit + 1)).all()
+
+    n_display = len(spec.columns)
+    rows = [tuple(row[:n_display]) for row in result[:limit]]
+    next_cursor = None
+    if len(result) > limit:
+        last = result[limit - 1]
+        next_cursor = (last[n_display], last[n_display + 1])
+    return Page(rows, next_cursor)
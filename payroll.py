@@ -0,0 +1,150 @@
+# payroll.py
+
+"""Perhitungan gaji bulanan untuk semua karyawan sekaligus.
+
+Absensi dan JadwalKerja bulan tersebut dimuat sebagai DataFrame (proyeksi kolom,
+bukan objek ORM), lalu hari terjadwal, hari hadir, dan jam lembur dihitung dengan
+operasi vektor pandas. Tarif diambil per posisi dari POSITION_RATES. Hasilnya
+menggantikan seluruh baris Penggajian periode itu dalam satu transaksi (hapus lalu
+satu bulk insert), sehingga aman dijalankan ulang.
+
+Aturan:
+- Gaji pokok diprorata dengan hadir pada hari terjadwal / jumlah hari terjadwal
+  (tanpa jadwal: hari hadir / STANDARD_WORK_DAYS, maksimal penuh).
+- Lembur = jam shift di atas STANDARD_HOURS pada hari terjadwal yang dihadiri,
+  ditambah STANDARD_HOURS untuk setiap hari hadir di luar jadwal. Karyawan tanpa
+  jadwal sama sekali di bulan itu tidak mendapat lembur dari hari hadir; hari
+  hadirnya hanya dihitung untuk prorata gaji pokok.
+"""
+
+import calendar
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import String, delete, insert, select, type_coerce
+from sqlalchemy.orm import Session
+
+from concurrency import run_write
+from models import Absensi, JadwalKerja, Karyawan, Penggajian
+
+# posisi -> (gaji pokok per bulan, tarif lembur per jam)
+POSITION_RATES = {
+    "Manager": (8_000_000, 50_000),
+    "Manajer": (8_000_000, 50_000),
+    "Chef": (6_000_000, 40_000),
+    "Cashier": (4_500_000, 30_000),
+    "Waiter": (4_000_000, 25_000),
+    "Operational": (3_800_000, 25_000),
+}
+DEFAULT_RATE = (4_000_000, 25_000)
+
+STANDARD_HOURS = 8
+STANDARD_WORK_DAYS = 26
+PRESENT_STATUS = "Hadir"
+
+# Nama hari pada JadwalKerja.hari, diindeks dengan date.weekday()
+HARI = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
+
+
+def _frame(session, stmt):
+    result = session.execute(stmt)
+    return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+
+def _shift_hours(jam_masuk, jam_pulang):
+    """Durasi shift dalam jam dari kolom teks HH:MM; shift lewat tengah malam ditambah 24 jam."""
+    masuk = pd.to_timedelta(jam_masuk.astype(str) + ":00", errors="coerce")
+    pulang = pd.to_timedelta(jam_pulang.astype(str) + ":00", errors="coerce")
+    hours = (pulang - masuk).dt.total_seconds() / 3600
+    return hours.where(hours > 0, hours + 24).fillna(0)
+
+
+def _scheduled_days(session, bulan, tahun):
+    """(karyawan_id, tanggal, jam_terjadwal) untuk setiap hari terjadwal di bulan tersebut."""
+    jadwal = _frame(session, select(
+        JadwalKerja.karyawan_id, JadwalKerja.hari, JadwalKerja.jam_masuk, JadwalKerja.jam_pulang
+    ))
+    if jadwal.empty:
+        return pd.DataFrame(columns=["karyawan_id", "tanggal", "jam_terjadwal"])
+    jadwal["hari"] = jadwal["hari"].str.strip().str.replace("'", "").str.capitalize()
+    jadwal["jam_terjadwal"] = _shift_hours(jadwal["jam_masuk"], jadwal["jam_pulang"])
+    # Beberapa shift di hari yang sama dijumlahkan
+    jadwal = jadwal.groupby(["karyawan_id", "hari"], as_index=False)["jam_terjadwal"].sum()
+
+    days = pd.date_range(date(tahun, bulan, 1), periods=calendar.monthrange(tahun, bulan)[1], freq="D")
+    kalender = pd.DataFrame({"tanggal": days.strftime("%Y-%m-%d"), "hari": np.array(HARI)[days.weekday]})
+    return kalender.merge(jadwal, on="hari")[["karyawan_id", "tanggal", "jam_terjadwal"]]
+
+
+def compute_payroll(session: Session, bulan, tahun):
+    """Menghitung rincian gaji semua karyawan untuk satu periode tanpa menulis ke database.
+
+    Mengembalikan DataFrame per karyawan: karyawan_id, employee_name, position,
+    hari_terjadwal, hari_hadir, jam_lembur, gaji_pokok, upah_lembur, jumlah_gaji.
+    """
+    start = date(tahun, bulan, 1)
+    end = date(tahun, bulan, calendar.monthrange(tahun, bulan)[1])
+    karyawan = _frame(session, select(Karyawan.karyawan_id, Karyawan.employee_name, Karyawan.position)
+                      .order_by(Karyawan.karyawan_id))
+    # Tanggal dibaca sebagai teks ISO apa adanya (tanpa konversi date per baris)
+    hadir = _frame(session, select(
+        Absensi.karyawan_id, type_coerce(Absensi.tanggal, String).label("tanggal")
+    ).distinct().where(Absensi.tanggal >= start, Absensi.tanggal <= end, Absensi.status == PRESENT_STATUS))
+    terjadwal = _scheduled_days(session, bulan, tahun)
+
+    hari = terjadwal.merge(hadir.assign(hadir=True), on=["karyawan_id", "tanggal"], how="outer")
+    hari["terjadwal"] = hari["jam_terjadwal"].notna()
+    hari["hadir"] = hari["hadir"].eq(True)
+    # Hadir di luar jadwal hanya lembur bagi karyawan yang punya jadwal bulan itu;
+    # tanpa jadwal sama sekali, hari hadir sudah dibayar lewat prorata gaji pokok
+    punya_jadwal = hari.groupby("karyawan_id")["terjadwal"].transform("any")
+    hari["lembur"] = np.where(
+        hari["terjadwal"],
+        np.where(hari["hadir"], np.maximum(hari["jam_terjadwal"].fillna(0) - STANDARD_HOURS, 0), 0),
+        np.where(punya_jadwal, STANDARD_HOURS, 0),
+    )
+    per_karyawan = hari.assign(
+        hadir_terjadwal=hari["hadir"] & hari["terjadwal"],
+    ).groupby("karyawan_id").agg(
+        hari_terjadwal=("terjadwal", "sum"),
+        hari_hadir=("hadir", "sum"),
+        hadir_terjadwal=("hadir_terjadwal", "sum"),
+        jam_lembur=("lembur", "sum"),
+    )
+
+    gaji = karyawan.merge(per_karyawan, left_on="karyawan_id", right_index=True, how="left")
+    for column in ["hari_terjadwal", "hari_hadir", "hadir_terjadwal", "jam_lembur"]:
+        gaji[column] = gaji[column].fillna(0)
+    pokok = gaji["position"].map({p: r[0] for p, r in POSITION_RATES.items()}).fillna(DEFAULT_RATE[0])
+    tarif_lembur = gaji["position"].map({p: r[1] for p, r in POSITION_RATES.items()}).fillna(DEFAULT_RATE[1])
+
+    proporsi = np.where(
+        gaji["hari_terjadwal"] > 0,
+        gaji["hadir_terjadwal"] / gaji["hari_terjadwal"].where(gaji["hari_terjadwal"] > 0, 1),
+        np.minimum(gaji["hari_hadir"] / STANDARD_WORK_DAYS, 1),
+    )
+    gaji["gaji_pokok"] = (pokok * proporsi).round(2)
+    gaji["upah_lembur"] = (gaji["jam_lembur"] * tarif_lembur).round(2)
+    gaji["jumlah_gaji"] = gaji["gaji_pokok"] + gaji["upah_lembur"]
+    gaji = gaji.drop(columns=["hadir_terjadwal"])
+    for column in ["hari_terjadwal", "hari_hadir"]:
+        gaji[column] = gaji[column].astype(int)
+    return gaji
+
+
+def run_payroll(session: Session, bulan, tahun):
+    """Menghitung dan menyimpan gaji satu periode, menggantikan hasil sebelumnya, lalu commit."""
+    gaji = compute_payroll(session, bulan, tahun)
+    rows = [
+        {"karyawan_id": karyawan_id, "bulan": bulan, "tahun": tahun, "jumlah_gaji": jumlah}
+        for karyawan_id, jumlah in zip(gaji["karyawan_id"], gaji["jumlah_gaji"].tolist())
+    ]
+
+    def write(session):
+        session.execute(delete(Penggajian).where(Penggajian.bulan == bulan, Penggajian.tahun == tahun))
+        if rows:
+            session.execute(insert(Penggajian), rows)
+
+    run_write(session, write)
+    return gaji
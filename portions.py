@@ -0,0 +1,120 @@
+# portions.py
+
+"""Indeks porsi tersedia per menu untuk pemilih menu di layar transaksi.
+
+Porsi tersedia sebuah menu = min(floor(stock / jumlah_bahan)) atas seluruh bahan
+komposisinya, dihitung untuk semua menu dalam satu pass NumPy (np.minimum.at).
+Saat stok bahan berubah, kolom stok dimuat ulang lalu hanya menu yang memakai
+bahan yang berubah yang dihitung ulang. Menu tanpa komposisi dianggap tak terbatas.
+"""
+
+import threading
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from menu_matrix import MATRIX_TABLES, get_menu_matrix
+from models import BahanBaku
+from utils import cached_by_version, table_version
+
+# Penanda "tak terbatas" untuk menu tanpa komposisi bahan
+UNLIMITED = np.iinfo(np.int64).max
+
+
+def _load_stock(session, matrix):
+    rows = session.execute(select(BahanBaku.bahan_id, BahanBaku.stock)).all()
+    bahan_ids, stock = zip(*rows) if rows else ((), ())
+    return matrix.align_bahan(bahan_ids, stock)
+
+
+class PortionIndex:
+    """Porsi tersedia per menu beserta stok bahan yang dipakai untuk menghitungnya."""
+
+    def __init__(self, matrix, stock, stock_version):
+        self.matrix = matrix
+        self.stock = stock
+        self.stock_version = stock_version
+        porsi = np.full(matrix.n_menu, UNLIMITED, dtype=np.int64)
+        self._fill(porsi, np.arange(len(matrix.qty)))
+        self.porsi = porsi
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, session: Session):
+        matrix = get_menu_matrix(session)
+        stock_version = table_version(BahanBaku.__tablename__)
+        return cls(matrix, _load_stock(session, matrix), stock_version)
+
+    def _fill(self, porsi, entries):
+        """Mengisi porsi[menu] = min(floor(stock / jumlah_bahan)) untuk entri yang diberikan."""
+        m = self.matrix
+        qty = m.qty[entries]
+        stock = np.maximum(self.stock[m.cols[entries]], 0)
+        per_entry = np.floor_divide(stock, np.where(qty > 0, qty, 1)).astype(np.int64)
+        # Jumlah bahan nol tidak membatasi porsi
+        np.minimum.at(porsi, m.rows[entries], np.where(qty > 0, per_entry, UNLIMITED))
+
+    def update_stock(self, new_stock):
+        """Menerapkan vektor stok baru; hanya menu pemakai bahan yang berubah dihitung ulang.
+
+        Mengembalikan jumlah menu yang dihitung ulang.
+        """
+        m = self.matrix
+        changed = np.flatnonzero(new_stock != self.stock)
+        if not changed.size:
+            return 0
+        touched = np.unique(m.rows[m.entries_for_columns(changed)])
+        self.stock = new_stock
+        # Hitung porsi ke array baru lalu ganti sekaligus agar pembaca tidak melihat nilai setengah jadi
+        porsi = self.porsi.copy()
+        porsi[touched] = UNLIMITED
+        self._fill(porsi, m.entries_for_menus(touched))
+        self.porsi = porsi
+        return touched.size
+
+    def sync(self, session: Session):
+        """Menyamakan stok dengan database jika tabel bahan_baku berubah sejak dimuat."""
+        version = table_version(BahanBaku.__tablename__)
+        if version == self.stock_version:
+            return
+        with self._lock:
+            if version != self.stock_version:
+                self.update_stock(_load_stock(session, self.matrix))
+                self.stock_version = version
+
+    def available(self, menu_id):
+        """Porsi tersedia untuk satu menu, atau None jika tak terbatas / menu tidak dikenal."""
+        i = self.matrix.menu_index.get(menu_id)
+        if i is None or self.porsi[i] == UNLIMITED:
+            return None
+        return int(self.porsi[i])
+
+    def sold_out(self):
+        """Himpunan menu_id yang porsinya habis."""
+        return set(self.matrix.menu_ids[self.porsi == 0])
+
+    def shortages(self, items):
+        """Bahan (bahan_id) yang stoknya tidak cukup untuk seluruh keranjang {menu_id: jumlah}.
+
+        Dihitung di memori dari stok terakhir yang diketahui, sehingga keranjang
+        yang pasti gagal bisa ditolak tanpa menyentuh database.
+        """
+        m = self.matrix
+        jumlah = np.zeros(m.n_menu, dtype=np.float64)
+        for menu_id, qty in items.items():
+            i = m.menu_index.get(menu_id)
+            if i is not None:
+                jumlah[i] += qty
+        entries = m.entries_for_menus(np.flatnonzero(jumlah))
+        need = np.bincount(m.cols[entries], weights=m.qty[entries] * jumlah[m.rows[entries]],
+                           minlength=m.n_bahan)
+        return list(m.bahan_ids[need > self.stock])
+
+
+def get_portions(session: Session):
+    """PortionIndex terkini: dimuat ulang jika menu/komposisi berubah, disinkronkan
+    secara inkremental jika stok bahan berubah."""
+    portions = cached_by_version(("menu_portions",), MATRIX_TABLES, lambda: PortionIndex.load(session))
+    portions.sync(session)
+    return portions
@@ -0,0 +1,174 @@
+# purchasing.py
+
+"""Pemesanan bahan baku ke supplier (PemesananBahan dan DetailPemesananBahan).
+
+Pesanan dibuat sekaligus dengan bulk insert: satu header per supplier dan semua
+baris detailnya, dalam satu transaksi tulis. Perubahan status memakai UPDATE bersyarat
+pada status asal, sehingga dua pengguna tidak bisa memproses pesanan yang sama
+dua kali. Penerimaan barang menaikkan stok semua baris dengan satu UPDATE
+berbasis himpunan di transaksi yang sama dengan perubahan status; karena stok
+dinaikkan relatif (stock = stock + jumlah), aman dijalankan bersamaan dengan
+checkout yang mengurangi bahan yang sama.
+"""
+
+import re
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from concurrency import run_write
+from models import BahanBaku, DetailPemesananBahan, PemesananBahan
+
+STATUS_DRAFT = "Draft"
+STATUS_DIPESAN = "Dipesan"
+STATUS_DIKIRIM = "Dikirim"
+STATUS_DITERIMA = "Diterima"
+STATUS_DIBATALKAN = "Dibatalkan"
+
+# Pesanan yang barangnya belum masuk stok
+OPEN_STATUSES = (STATUS_DRAFT, STATUS_DIPESAN, STATUS_DIKIRIM)
+
+# status asal -> status tujuan yang diizinkan lewat set_status(); Diterima hanya lewat receive()
+TRANSITIONS = {
+    STATUS_DRAFT: (STATUS_DIPESAN, STATUS_DIBATALKAN),
+    STATUS_DIPESAN: (STATUS_DIKIRIM, STATUS_DIBATALKAN),
+    STATUS_DIKIRIM: (STATUS_DIBATALKAN,),
+}
+RECEIVABLE_STATUSES = (STATUS_DIPESAN, STATUS_DIKIRIM)
+
+ID_PREFIX = "PB"
+
+
+class PurchasingError(Exception):
+    """Pesanan bahan tidak dapat diproses."""
+
+
+def next_pemesanan_ids(session: Session, n):
+    """Membuat n ID pesanan baru (PB001, PB002, ...) setelah nomor terbesar yang ada."""
+    existing = session.scalars(
+        select(PemesananBahan.pemesanan_id).where(PemesananBahan.pemesanan_id.like(f"{ID_PREFIX}%"))
+    )
+    numbers = [int(m.group(1)) for pid in existing if (m := re.fullmatch(rf"{ID_PREFIX}(\d+)", pid))]
+    start = max(numbers, default=0) + 1
+    return [f"{ID_PREFIX}{k:03d}" for k in range(start, start + n)]
+
+
+def on_order(session: Session):
+    """{bahan_id: jumlah} yang sudah dipesan tetapi belum diterima."""
+    rows = session.execute(
+        select(DetailPemesananBahan.bahan_id, func.sum(DetailPemesananBahan.jumlah))
+        .join(PemesananBahan, PemesananBahan.pemesanan_id == DetailPemesananBahan.pemesanan_id)
+        .where(PemesananBahan.status.in_(OPEN_STATUSES))
+        .group_by(DetailPemesananBahan.bahan_id)
+    )
+    return dict(rows.all())
+
+
+def orders_with_status(session: Session, statuses):
+    """Daftar (pemesanan_id, supplier_id, tanggal_pemesanan, status) untuk status tertentu."""
+    return session.execute(
+        select(PemesananBahan.pemesanan_id, PemesananBahan.supplier_id,
+               PemesananBahan.tanggal_pemesanan, PemesananBahan.status)
+        .where(PemesananBahan.status.in_(statuses))
+        .order_by(PemesananBahan.tanggal_pemesanan.desc(), PemesananBahan.pemesanan_id.desc())
+    ).all()
+
+
+def order_lines(session: Session, pemesanan_id):
+    """Baris detail pesanan beserta nama dan satuan bahan (satu query join)."""
+    return session.execute(
+        select(DetailPemesananBahan.bahan_id, BahanBaku.nama_bahan, DetailPemesananBahan.jumlah,
+               BahanBaku.satuan, DetailPemesananBahan.harga_satuan)
+        .join(BahanBaku, BahanBaku.bahan_id == DetailPemesananBahan.bahan_id)
+        .where(DetailPemesananBahan.pemesanan_id == pemesanan_id)
+        .order_by(DetailPemesananBahan.detail_pemesanan_id)
+    ).all()
+
+
+def create_orders(session: Session, tanggal, orders, status=STATUS_DRAFT):
+    """Membuat pesanan untuk banyak supplier sekaligus lalu commit.
+
+    orders: {supplier_id: [(bahan_id, jumlah, harga_satuan), ...]}.
+    Mengembalikan {supplier_id: pemesanan_id}.
+    """
+    orders = {supplier_id: lines for supplier_id, lines in orders.items() if lines}
+    if not orders:
+        return {}
+    def write(session):
+        # ID dibaca di dalam transaksi tulis, sehingga tidak bisa bentrok dengan
+        # pesanan yang dibuat bersamaan di sesi lain
+        ids = dict(zip(orders, next_pemesanan_ids(session, len(orders))))
+        session.execute(insert(PemesananBahan), [
+            {"pemesanan_id": ids[supplier_id], "supplier_id": supplier_id,
+             "tanggal_pemesanan": tanggal, "status": status}
+            for supplier_id in orders
+        ])
+        session.execute(insert(DetailPemesananBahan), [
+            {"pemesanan_id": ids[supplier_id], "bahan_id": bahan_id,
+             "jumlah": jumlah, "harga_satuan": harga_satuan}
+            for supplier_id, lines in orders.items()
+            for bahan_id, jumlah, harga_satuan in lines
+        ])
+        return ids
+
+    try:
+        return run_write(session, write)
+    except IntegrityError as exc:
+        raise PurchasingError(f"Pesanan gagal disimpan: {exc.orig}") from exc
+
+
+def _guarded_status_update(session, pemesanan_id, from_statuses, new_status):
+    result = session.execute(
+        update(PemesananBahan)
+        .where(PemesananBahan.pemesanan_id == pemesanan_id, PemesananBahan.status.in_(from_statuses))
+        .values(status=new_status)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _status_error(session, pemesanan_id, new_status):
+    current = session.scalar(select(PemesananBahan.status).where(PemesananBahan.pemesanan_id == pemesanan_id))
+    if current is None:
+        return PurchasingError(f"Pesanan {pemesanan_id} tidak ditemukan.")
+    return PurchasingError(f"Status pesanan {pemesanan_id} tidak bisa diubah dari {current} ke {new_status}.")
+
+
+def set_status(session: Session, pemesanan_id, new_status):
+    """Mengubah status pesanan sesuai TRANSITIONS lalu commit."""
+    allowed_from = [src for src, targets in TRANSITIONS.items() if new_status in targets]
+
+    def write(session):
+        if not _guarded_status_update(session, pemesanan_id, allowed_from, new_status):
+            raise _status_error(session, pemesanan_id, new_status)
+
+    run_write(session, write)
+
+
+def receive(session: Session, pemesanan_id):
+    """Menerima seluruh barang pesanan: status menjadi Diterima dan stok semua bahan
+    dinaikkan dengan satu UPDATE, dalam satu transaksi tulis (concurrency.run_write).
+
+    Mengembalikan jumlah bahan yang stoknya bertambah.
+    """
+    lines = select(DetailPemesananBahan.bahan_id).where(DetailPemesananBahan.pemesanan_id == pemesanan_id)
+    received_per_bahan = (
+        select(func.sum(DetailPemesananBahan.jumlah))
+        .where(DetailPemesananBahan.pemesanan_id == pemesanan_id,
+               DetailPemesananBahan.bahan_id == BahanBaku.bahan_id)
+        .scalar_subquery()
+    )
+
+    def write(session):
+        # Status diubah lebih dulu untuk mencegah penerimaan ganda
+        if not _guarded_status_update(session, pemesanan_id, RECEIVABLE_STATUSES, STATUS_DITERIMA):
+            raise _status_error(session, pemesanan_id, STATUS_DITERIMA)
+        return session.execute(
+            update(BahanBaku)
+            .where(BahanBaku.bahan_id.in_(lines))
+            .values(stock=BahanBaku.stock + received_per_bahan, version_id=BahanBaku.version_id + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    return run_write(session, write)
@@ -0,0 +1,112 @@
+# reports.py
+
+"""Laporan penjualan dari tabel rollup penjualan harian.
+
+Semua pengelompokan dijalankan di SQL atas penjualan_harian dan
+penjualan_harian_karyawan (O(hari), bukan O(pesanan)); pandas hanya menerima
+hasil agregat berupa kolom. Hasil di-cache per rentang tanggal dan versi tabel,
+sehingga rerun Streamlit (ganti tab, klik widget) tidak menghitung ulang.
+"""
+
+from typing import NamedTuple
+
+import pandas as pd
+from sqlalchemy import Float, func, select, type_coerce
+from sqlalchemy.orm import Session
+
+from models import Karyawan, Menu, PenjualanHarian, PenjualanHarianKaryawan
+from utils import cached_by_version
+
+REPORT_TABLES = (
+    PenjualanHarian.__tablename__,
+    PenjualanHarianKaryawan.__tablename__,
+    Menu.__tablename__,
+    Karyawan.__tablename__,
+)
+
+
+class SalesSummary(NamedTuple):
+    pendapatan: float
+    jumlah_order: int
+    jumlah_item: int
+
+    @property
+    def rata_rata_keranjang(self):
+        """Rata-rata nilai belanja per transaksi."""
+        return self.pendapatan / self.jumlah_order if self.jumlah_order else 0.0
+
+    @property
+    def item_per_order(self):
+        return self.jumlah_item / self.jumlah_order if self.jumlah_order else 0.0
+
+
+class SalesReport(NamedTuple):
+    summary: SalesSummary
+    harian: pd.DataFrame
+    menu_terlaris: pd.DataFrame
+    per_karyawan: pd.DataFrame
+
+
+def _sum(column, label):
+    # Hindari konversi Decimal per baris; cukup float untuk tampilan laporan
+    return type_coerce(func.coalesce(func.sum(column), 0), Float).label(label)
+
+
+def _in_range(column, start, end):
+    return [column >= start, column <= end]
+
+
+def _frame(session, stmt):
+    result = session.execute(stmt)
+    return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+
+def _load_report(session, start, end):
+    harian = PenjualanHarianKaryawan
+    daily = _frame(session, select(
+        harian.tanggal.label("Tanggal"),
+        _sum(harian.pendapatan, "Pendapatan"),
+        func.sum(harian.jumlah_order).label("Jumlah Order"),
+        func.sum(harian.jumlah_item).label("Jumlah Item"),
+    ).where(*_in_range(harian.tanggal, start, end))
+     .group_by(harian.tanggal)
+     .order_by(harian.tanggal))
+    daily["Rata-rata Keranjang"] = daily["Pendapatan"] / daily["Jumlah Order"]
+
+    per_menu = _frame(session, select(
+        Menu.menu_id.label("Menu ID"),
+        Menu.nama_menu.label("Nama Menu"),
+        func.sum(PenjualanHarian.jumlah_item).label("Terjual"),
+        func.sum(PenjualanHarian.jumlah_order).label("Jumlah Order"),
+        _sum(PenjualanHarian.pendapatan, "Pendapatan"),
+    ).join(Menu, Menu.menu_id == PenjualanHarian.menu_id)
+     .where(*_in_range(PenjualanHarian.tanggal, start, end))
+     .group_by(Menu.menu_id, Menu.nama_menu)
+     .order_by(func.sum(PenjualanHarian.jumlah_item).desc(), Menu.menu_id))
+
+    per_karyawan = _frame(session, select(
+        Karyawan.karyawan_id.label("Karyawan ID"),
+        Karyawan.employee_name.label("Nama Karyawan"),
+        func.sum(harian.jumlah_order).label("Jumlah Order"),
+        _sum(harian.pendapatan, "Pendapatan"),
+    ).join(Karyawan, Karyawan.karyawan_id == harian.karyawan_id)
+     .where(*_in_range(harian.tanggal, start, end))
+     .group_by(Karyawan.karyawan_id, Karyawan.employee_name)
+     .order_by(func.sum(harian.pendapatan).desc(), Karyawan.karyawan_id))
+    per_karyawan["Rata-rata Keranjang"] = per_karyawan["Pendapatan"] / per_karyawan["Jumlah Order"]
+
+    summary = SalesSummary(
+        float(daily["Pendapatan"].sum()),
+        int(daily["Jumlah Order"].sum()),
+        int(daily["Jumlah Item"].sum()),
+    )
+    return SalesReport(summary, daily, per_menu, per_karyawan)
+
+
+def sales_report(session: Session, start, end):
+    """Laporan penjualan untuk rentang tanggal [start, end], dari cache bila data tidak berubah.
+
+    DataFrame di dalam hasil dipakai bersama antar-rerun; jangan diubah di tempat.
+    """
+    return cached_by_version(("laporan_penjualan", start, end), REPORT_TABLES,
+                             lambda: _load_report(session, start, end))
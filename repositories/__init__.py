@@ -0,0 +1,13 @@
+# repositories/__init__.py
+
+"""Lapisan akses data untuk halaman Streamlit, satu modul per agregat.
+
+Setiap modul (karyawan, pelanggan, supplier, bahan_baku, menu, transaksi,
+feedback, absensi, penggajian) mengembalikan baris NamedTuple ringan dari
+SELECT kolom, bukan objek ORM: tidak ada identity map, snapshot perubahan,
+atau state instance per baris. Penulisan memakai INSERT/UPDATE/DELETE langsung
+lalu commit, sehingga versi tabel tetap naik lewat utils (cache baca ikut
+dibuang). Helper bersamanya ada di repositories.base.
+
+Halaman mengimpor modulnya langsung, mis. `from repositories import karyawan`.
+"""
@@ -0,0 +1,45 @@
+# repositories/absensi.py
+
+"""Data absensi sebagai baris AbsensiRow.
+
+Absensi baru dicatat lewat attendance.scan() dan attendance.ingest_batch().
+"""
+
+from datetime import date, datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Absensi, Karyawan
+from repositories import base
+from utils import list_rows
+
+
+class AbsensiRow(NamedTuple):
+    absensi_id: int
+    karyawan_id: str
+    employee_name: str
+    tanggal: date
+    status: str
+    jam_masuk: Optional[datetime]
+    jam_keluar: Optional[datetime]
+
+
+COLUMNS = [Absensi.absensi_id, Absensi.karyawan_id, Karyawan.employee_name, Absensi.tanggal,
+           Absensi.status, Absensi.jam_masuk, Absensi.jam_keluar]
+
+
+def recent(session: Session, limit=10):
+    """Absensi terbaru beserta nama karyawan."""
+    rows = list_rows(session, COLUMNS, joins=[Absensi.karyawan], order_by=[Absensi.absensi_id.desc()],
+                     limit=limit)
+    return [AbsensiRow._make(row) for row in rows]
+
+
+def get_many(session: Session, absensi_ids):
+    """{absensi_id: AbsensiRow} untuk banyak absensi sekaligus."""
+    rows = {}
+    for batch in base.batches(absensi_ids):
+        for row in list_rows(session, COLUMNS, joins=[Absensi.karyawan], where=[Absensi.absensi_id.in_(batch)]):
+            rows[row.absensi_id] = AbsensiRow._make(row)
+    return rows
@@ -0,0 +1,57 @@
+# repositories/bahan_baku.py
+
+"""Data bahan baku sebagai baris BahanBakuRow."""
+
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import BahanBaku
+from repositories import base
+
+
+class BahanBakuRow(NamedTuple):
+    bahan_id: str
+    nama_bahan: str
+    stock: int
+    satuan: str
+    harga_bahan: Decimal
+    supplier_id: Optional[str]
+    version_id: int
+
+
+def get(session: Session, bahan_id) -> Optional[BahanBakuRow]:
+    return base.get_row(session, BahanBaku, BahanBakuRow, bahan_id)
+
+
+def get_many(session: Session, bahan_ids):
+    """{bahan_id: BahanBakuRow} untuk banyak bahan sekaligus."""
+    return base.get_rows(session, BahanBaku, BahanBakuRow, bahan_ids)
+
+
+def by_supplier(session: Session, supplier_id):
+    """Semua bahan yang dipasok satu supplier, urut ID bahan."""
+    stmt = (select(*base.columns_of(BahanBaku, BahanBakuRow))
+            .where(BahanBaku.supplier_id == supplier_id).order_by(BahanBaku.bahan_id))
+    return [BahanBakuRow._make(row) for row in session.execute(stmt)]
+
+
+def exists(session: Session, bahan_id):
+    return base.exists(session, BahanBaku, bahan_id)
+
+
+def create(session: Session, bahan_id, nama_bahan, stock, satuan, harga_bahan, supplier_id):
+    base.insert_row(session, BahanBaku, bahan_id=bahan_id, nama_bahan=nama_bahan, stock=stock,
+                    satuan=satuan, harga_bahan=harga_bahan, supplier_id=supplier_id)
+
+
+def update(session: Session, bahan_id, expected_version=None, **values):
+    """Memperbarui bahan; dengan expected_version (BahanBakuRow.version_id saat form
+    ditampilkan) gagal WriteConflictError jika stok atau datanya sudah berubah."""
+    return base.update_row(session, BahanBaku, bahan_id, expected_version, **values)
+
+
+def delete(session: Session, bahan_id):
+    return base.delete_row(session, BahanBaku, bahan_id)
@@ -0,0 +1,98 @@
+# repositories/base.py
+
+"""Helper bersama modul repository.
+
+Nama field NamedTuple baris sama dengan nama atribut kolom di model, sehingga
+kolom SELECT cukup diturunkan dari tipe barisnya (columns_of). Semua penulisan
+berjalan lewat concurrency.run_write (BEGIN IMMEDIATE, ulang bila database sibuk).
+"""
+
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from concurrency import WriteConflictError, run_write
+
+# Jumlah ID per query IN saat mengambil banyak baris sekaligus (batas parameter SQLite 32766)
+BATCH_SIZE = 1000
+
+
+def columns_of(model, row_type):
+    """Atribut kolom model untuk setiap field row_type, sesuai urutan field."""
+    return [getattr(model, name) for name in row_type._fields]
+
+
+def primary_key(model):
+    [pk] = inspect(model).primary_key
+    return getattr(model, pk.key)
+
+
+def batches(ids):
+    """ID unik (urutan dipertahankan) dalam potongan BATCH_SIZE untuk query IN."""
+    ids = list(dict.fromkeys(ids))
+    for i in range(0, len(ids), BATCH_SIZE):
+        yield ids[i:i + BATCH_SIZE]
+
+
+def get_row(session: Session, model, row_type, id_value):
+    """Satu baris row_type berdasarkan primary key, atau None."""
+    row = session.execute(select(*columns_of(model, row_type)).where(primary_key(model) == id_value)).first()
+    return None if row is None else row_type._make(row)
+
+
+def get_rows(session: Session, model, row_type, ids):
+    """{id: baris row_type} untuk banyak ID dengan satu query per BATCH_SIZE ID.
+
+    ID yang tidak ditemukan tidak muncul di hasil.
+    """
+    pk = primary_key(model)
+    stmt = select(*columns_of(model, row_type))
+    rows = {}
+    for batch in batches(ids):
+        for row in session.execute(stmt.where(pk.in_(batch))):
+            row = row_type._make(row)
+            rows[getattr(row, pk.key)] = row
+    return rows
+
+
+def exists(session: Session, model, id_value):
+    pk = primary_key(model)
+    return session.scalar(select(pk).where(pk == id_value).limit(1)) is not None
+
+
+def _commit(session, stmt):
+    return run_write(session, lambda session: session.execute(stmt))
+
+
+def insert_row(session: Session, model, **values):
+    """INSERT satu baris lalu commit; gagal (mis. IntegrityError) setelah rollback."""
+    _commit(session, insert(model).values(**values))
+
+
+def update_row(session: Session, model, id_value, expected_version=None, **values):
+    """UPDATE kolom satu baris lalu commit. Mengembalikan True jika barisnya ada.
+
+    Untuk model dengan kolom version_id, versinya ikut dinaikkan; jika expected_version
+    diberikan dan versi baris sudah berbeda, WriteConflictError.
+    """
+    stmt = update(model).where(primary_key(model) == id_value)
+    version = getattr(model, "version_id", None)
+    if version is not None:
+        values["version_id"] = version + 1
+        if expected_version is not None:
+            stmt = stmt.where(version == expected_version)
+    stmt = stmt.values(**values).execution_options(synchronize_session=False)
+
+    def write(session):
+        if session.execute(stmt).rowcount == 1:
+            return True
+        if expected_version is not None and exists(session, model, id_value):
+            raise WriteConflictError(f"{model.__tablename__} {id_value} sudah diubah pengguna lain.")
+        return False
+
+    return run_write(session, write)
+
+
+def delete_row(session: Session, model, id_value):
+    """DELETE satu baris lalu commit. Mengembalikan True jika barisnya ada."""
+    stmt = delete(model).where(primary_key(model) == id_value).execution_options(synchronize_session=False)
+    return _commit(session, stmt).rowcount == 1
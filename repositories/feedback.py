@@ -0,0 +1,42 @@
+# repositories/feedback.py
+
+"""Data feedback pelanggan sebagai baris FeedbackRow."""
+
+from datetime import date
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Feedback
+from repositories import base
+
+
+class FeedbackRow(NamedTuple):
+    feedback_id: int
+    pelanggan_id: str
+    karyawan_id: str
+    tanggal: date
+    rating: int
+    komentar: Optional[str]
+
+
+def get(session: Session, feedback_id) -> Optional[FeedbackRow]:
+    return base.get_row(session, Feedback, FeedbackRow, feedback_id)
+
+
+def get_many(session: Session, feedback_ids):
+    """{feedback_id: FeedbackRow} untuk banyak feedback sekaligus."""
+    return base.get_rows(session, Feedback, FeedbackRow, feedback_ids)
+
+
+def create(session: Session, pelanggan_id, karyawan_id, tanggal, rating, komentar=None):
+    base.insert_row(session, Feedback, pelanggan_id=pelanggan_id, karyawan_id=karyawan_id,
+                    tanggal=tanggal, rating=rating, komentar=komentar)
+
+
+def update(session: Session, feedback_id, **values):
+    return base.update_row(session, Feedback, feedback_id, **values)
+
+
+def delete(session: Session, feedback_id):
+    return base.delete_row(session, Feedback, feedback_id)
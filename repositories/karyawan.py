@@ -0,0 +1,44 @@
+# repositories/karyawan.py
+
+"""Data karyawan sebagai baris KaryawanRow."""
+
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Karyawan
+from repositories import base
+
+
+class KaryawanRow(NamedTuple):
+    karyawan_id: str
+    employee_name: str
+    position: str
+    fingerprint_id: Optional[str]
+
+
+def get(session: Session, karyawan_id) -> Optional[KaryawanRow]:
+    return base.get_row(session, Karyawan, KaryawanRow, karyawan_id)
+
+
+def get_many(session: Session, karyawan_ids):
+    """{karyawan_id: KaryawanRow} untuk banyak karyawan sekaligus."""
+    return base.get_rows(session, Karyawan, KaryawanRow, karyawan_ids)
+
+
+def exists(session: Session, karyawan_id):
+    return base.exists(session, Karyawan, karyawan_id)
+
+
+def create(session: Session, karyawan_id, employee_name, position, fingerprint_id=None):
+    base.insert_row(session, Karyawan, karyawan_id=karyawan_id, employee_name=employee_name,
+                    position=position, fingerprint_id=fingerprint_id)
+
+
+def update(session: Session, karyawan_id, **values):
+    """Mengubah kolom karyawan, mis. update(session, "K001", fingerprint_id="FID001")."""
+    return base.update_row(session, Karyawan, karyawan_id, **values)
+
+
+def delete(session: Session, karyawan_id):
+    return base.delete_row(session, Karyawan, karyawan_id)
@@ -0,0 +1,70 @@
+# repositories/menu.py
+
+"""Data menu dan komposisinya sebagai baris MenuRow dan KomposisiRow."""
+
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import BahanBaku, KomposisiMenu, Menu
+from repositories import base
+from utils import list_rows
+
+
+class MenuRow(NamedTuple):
+    menu_id: str
+    nama_menu: str
+    harga: Decimal
+
+
+class KomposisiRow(NamedTuple):
+    bahan_id: str
+    nama_bahan: str
+    jumlah_bahan: int
+
+
+def get(session: Session, menu_id) -> Optional[MenuRow]:
+    return base.get_row(session, Menu, MenuRow, menu_id)
+
+
+def get_many(session: Session, menu_ids):
+    """{menu_id: MenuRow} untuk banyak menu sekaligus."""
+    return base.get_rows(session, Menu, MenuRow, menu_ids)
+
+
+def exists(session: Session, menu_id):
+    return base.exists(session, Menu, menu_id)
+
+
+def create(session: Session, menu_id, nama_menu, harga):
+    base.insert_row(session, Menu, menu_id=menu_id, nama_menu=nama_menu, harga=harga)
+
+
+def update(session: Session, menu_id, **values):
+    return base.update_row(session, Menu, menu_id, **values)
+
+
+def delete(session: Session, menu_id):
+    return base.delete_row(session, Menu, menu_id)
+
+
+def komposisi(session: Session, menu_id):
+    """Bahan penyusun satu menu beserta nama bahannya, urut ID bahan."""
+    rows = list_rows(
+        session, [KomposisiMenu.bahan_id, BahanBaku.nama_bahan, KomposisiMenu.jumlah_bahan],
+        joins=[KomposisiMenu.bahan_baku], where=[KomposisiMenu.menu_id == menu_id],
+        order_by=[KomposisiMenu.bahan_id],
+    )
+    return [KomposisiRow._make(row) for row in rows]
+
+
+def has_komposisi(session: Session, menu_id, bahan_id):
+    stmt = select(KomposisiMenu.bahan_id).where(KomposisiMenu.menu_id == menu_id,
+                                                KomposisiMenu.bahan_id == bahan_id)
+    return session.scalar(stmt) is not None
+
+
+def add_komposisi(session: Session, menu_id, bahan_id, jumlah_bahan):
+    base.insert_row(session, KomposisiMenu, menu_id=menu_id, bahan_id=bahan_id, jumlah_bahan=jumlah_bahan)
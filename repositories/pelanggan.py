@@ -0,0 +1,42 @@
+# repositories/pelanggan.py
+
+"""Data pelanggan sebagai baris PelangganRow."""
+
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Pelanggan
+from repositories import base
+
+
+class PelangganRow(NamedTuple):
+    pelanggan_id: str
+    cus_name: str
+    contact_info: str
+
+
+def get(session: Session, pelanggan_id) -> Optional[PelangganRow]:
+    return base.get_row(session, Pelanggan, PelangganRow, pelanggan_id)
+
+
+def get_many(session: Session, pelanggan_ids):
+    """{pelanggan_id: PelangganRow} untuk banyak pelanggan sekaligus."""
+    return base.get_rows(session, Pelanggan, PelangganRow, pelanggan_ids)
+
+
+def exists(session: Session, pelanggan_id):
+    return base.exists(session, Pelanggan, pelanggan_id)
+
+
+def create(session: Session, pelanggan_id, cus_name, contact_info):
+    base.insert_row(session, Pelanggan, pelanggan_id=pelanggan_id, cus_name=cus_name,
+                    contact_info=contact_info)
+
+
+def update(session: Session, pelanggan_id, **values):
+    return base.update_row(session, Pelanggan, pelanggan_id, **values)
+
+
+def delete(session: Session, pelanggan_id):
+    return base.delete_row(session, Pelanggan, pelanggan_id)
@@ -0,0 +1,30 @@
+# repositories/penggajian.py
+
+"""Gaji tersimpan sebagai baris GajiRow.
+
+Gaji dihitung dan disimpan lewat payroll.run_payroll().
+"""
+
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy.orm import Session
+
+from models import Karyawan, Penggajian
+from utils import list_rows
+
+
+class GajiRow(NamedTuple):
+    karyawan_id: str
+    employee_name: str
+    jumlah_gaji: Decimal
+
+
+def for_period(session: Session, bulan, tahun):
+    """Gaji semua karyawan untuk satu periode, urut ID karyawan."""
+    rows = list_rows(
+        session, [Penggajian.karyawan_id, Karyawan.employee_name, Penggajian.jumlah_gaji],
+        joins=[Penggajian.karyawan], where=[Penggajian.bulan == bulan, Penggajian.tahun == tahun],
+        order_by=[Penggajian.karyawan_id],
+    )
+    return [GajiRow._make(row) for row in rows]
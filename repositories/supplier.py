@@ -0,0 +1,41 @@
+# repositories/supplier.py
+
+"""Data supplier sebagai baris SupplierRow."""
+
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Supplier
+from repositories import base
+
+
+class SupplierRow(NamedTuple):
+    supplier_id: str
+    supplier_name: str
+    address: str
+
+
+def get(session: Session, supplier_id) -> Optional[SupplierRow]:
+    return base.get_row(session, Supplier, SupplierRow, supplier_id)
+
+
+def get_many(session: Session, supplier_ids):
+    """{supplier_id: SupplierRow} untuk banyak supplier sekaligus."""
+    return base.get_rows(session, Supplier, SupplierRow, supplier_ids)
+
+
+def exists(session: Session, supplier_id):
+    return base.exists(session, Supplier, supplier_id)
+
+
+def create(session: Session, supplier_id, supplier_name, address):
+    base.insert_row(session, Supplier, supplier_id=supplier_id, supplier_name=supplier_name, address=address)
+
+
+def update(session: Session, supplier_id, **values):
+    return base.update_row(session, Supplier, supplier_id, **values)
+
+
+def delete(session: Session, supplier_id):
+    return base.delete_row(session, Supplier, supplier_id)
@@ -0,0 +1,59 @@
+# repositories/transaksi.py
+
+"""Data transaksi dan detailnya sebagai baris TransaksiRow dan DetailRow.
+
+Transaksi baru dibuat lewat checkout.checkout(), yang juga mengurangi stok.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import DetailTransaksi, Menu, Transaksi
+from repositories import base
+
+
+class TransaksiRow(NamedTuple):
+    transaksi_id: str
+    tanggal_pembelian: date
+    pelanggan_id: str
+    karyawan_id: str
+    total_transaksi: Decimal
+    version_id: int
+
+
+class DetailRow(NamedTuple):
+    transaksi_id: str
+    menu_id: str
+    nama_menu: str
+    jumlah: int
+    harga: Decimal
+
+
+def get(session: Session, transaksi_id) -> Optional[TransaksiRow]:
+    return base.get_row(session, Transaksi, TransaksiRow, transaksi_id)
+
+
+def get_many(session: Session, transaksi_ids):
+    """{transaksi_id: TransaksiRow} untuk banyak transaksi sekaligus."""
+    return base.get_rows(session, Transaksi, TransaksiRow, transaksi_ids)
+
+
+def exists(session: Session, transaksi_id):
+    return base.exists(session, Transaksi, transaksi_id)
+
+
+def details(session: Session, transaksi_ids):
+    """{transaksi_id: [DetailRow, ...]} untuk banyak transaksi, satu query per BATCH_SIZE ID."""
+    stmt = (select(DetailTransaksi.transaksi_id, DetailTransaksi.menu_id, Menu.nama_menu,
+                   DetailTransaksi.jumlah, DetailTransaksi.harga)
+            .join(DetailTransaksi.menu).order_by(DetailTransaksi.detail_id))
+    transaksi_ids = list(transaksi_ids)
+    lines = {transaksi_id: [] for transaksi_id in transaksi_ids}
+    for batch in base.batches(transaksi_ids):
+        for row in session.execute(stmt.where(DetailTransaksi.transaksi_id.in_(batch))):
+            lines[row.transaksi_id].append(DetailRow._make(row))
+    return lines
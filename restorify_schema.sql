@@ -6,7 +6,8 @@ USE restorify;
 CREATE TABLE IF NOT EXISTS karyawan (
     karyawan_id VARCHAR(5) PRIMARY KEY,
     employee_name VARCHAR(50) NOT NULL,
-    position VARCHAR(25) NOT NULL
+    position VARCHAR(25) NOT NULL,
+    fingerprint_id VARCHAR(50) NULL
 );
 
 INSERT INTO karyawan (karyawan_id, employee_name, position) VALUES
@@ -170,6 +171,8 @@ CREATE TABLE IF NOT EXISTS absensi (
     karyawan_id VARCHAR(5) NOT NULL,
     tanggal DATE NOT NULL,
     status VARCHAR(10) NOT NULL,
+    jam_masuk DATETIME NULL,
+    jam_keluar DATETIME NULL,
     FOREIGN KEY (karyawan_id) REFERENCES karyawan(karyawan_id)
 );
 
@@ -240,4 +243,55 @@ CREATE TABLE IF NOT EXISTS feedback (
 INSERT INTO feedback (pelanggan_id, karyawan_id, tanggal, rating, komentar) VALUES
     ('P001', 'K003', '2024-12-02', 5, 'Pelayanan sangat memuaskan.'),
     ('P002', 'K001', '2024-12-03', 4, 'Makanan enak dan tempat nyaman.'),
-    ('P003', 'K002', '2024-12-04', 3, NULL);
\ No newline at end of file
+    ('P003', 'K002', '2024-12-04', 3, NULL);
+
+-- Rollup penjualan harian (diperbarui saat checkout, dibangun ulang dengan rollup.py)
+CREATE TABLE IF NOT EXISTS penjualan_harian (
+    tanggal DATE NOT NULL,
+    menu_id VARCHAR(5) NOT NULL,
+    pendapatan DECIMAL(15,2) NOT NULL,
+    jumlah_order INT NOT NULL,
+    jumlah_item INT NOT NULL,
+    PRIMARY KEY (tanggal, menu_id),
+    FOREIGN KEY (menu_id) REFERENCES menu(menu_id)
+);
+
+CREATE TABLE IF NOT EXISTS penjualan_harian_karyawan (
+    tanggal DATE NOT NULL,
+    karyawan_id VARCHAR(5) NOT NULL,
+    pendapatan DECIMAL(15,2) NOT NULL,
+    jumlah_order INT NOT NULL,
+    jumlah_item INT NOT NULL,
+    PRIMARY KEY (tanggal, karyawan_id),
+    FOREIGN KEY (karyawan_id) REFERENCES karyawan(karyawan_id)
+);
+
+-- Pemakaian bahan per hari (diturunkan dari penjualan_harian oleh forecast.py)
+CREATE TABLE IF NOT EXISTS pemakaian_bahan_harian (
+    tanggal DATE NOT NULL,
+    bahan_id VARCHAR(5) NOT NULL,
+    jumlah INT NOT NULL,
+    PRIMARY KEY (tanggal, bahan_id),
+    FOREIGN KEY (bahan_id) REFERENCES bahan_baku(bahan_id)
+);
+
+-- Versi per tabel untuk sinkronisasi cache antar proses (Streamlit dan api.py)
+CREATE TABLE IF NOT EXISTS versi_tabel (
+    nama_tabel VARCHAR(50) PRIMARY KEY,
+    versi INT NOT NULL
+);
+
+-- Indeks sekunder untuk query yang sering dijalankan
+CREATE UNIQUE INDEX ux_karyawan_fingerprint_id ON karyawan (fingerprint_id);
+CREATE INDEX ix_transaksi_tanggal_id ON transaksi (tanggal_pembelian, transaksi_id);
+CREATE INDEX ix_transaksi_karyawan_tanggal ON transaksi (karyawan_id, tanggal_pembelian, transaksi_id);
+CREATE INDEX ix_transaksi_pelanggan_tanggal ON transaksi (pelanggan_id, tanggal_pembelian, transaksi_id);
+CREATE INDEX ix_detail_transaksi_transaksi_id ON detail_transaksi (transaksi_id);
+CREATE INDEX ix_detail_transaksi_menu_id ON detail_transaksi (menu_id);
+CREATE INDEX ix_komposisi_menu_bahan_id ON komposisi_menu (bahan_id);
+CREATE UNIQUE INDEX ux_absensi_karyawan_tanggal ON absensi (karyawan_id, tanggal);
+CREATE INDEX ix_absensi_tanggal ON absensi (tanggal);
+CREATE INDEX ix_feedback_karyawan_id ON feedback (karyawan_id);
+CREATE INDEX ix_feedback_pelanggan_id ON feedback (pelanggan_id);
+CREATE UNIQUE INDEX ux_penggajian_karyawan_periode ON penggajian (karyawan_id, bulan, tahun);
+CREATE INDEX ix_detail_pemesanan_pemesanan_bahan ON detail_pemesanan_bahan (pemesanan_id, bahan_id);
@@ -0,0 +1,146 @@
+# rollup.py
+
+"""Rollup penjualan harian yang dipelihara secara inkremental.
+
+Checkout memanggil record_sale() di dalam transaksi yang sama dengan penyimpanan
+detail, sehingga rollup selalu konsisten dengan detail_transaksi. rebuild()
+membangun ulang rollup dari data yang sudah ada dalam satu pass berbasis himpunan
+(INSERT ... SELECT ... GROUP BY), misalnya setelah impor data historis.
+
+Ada dua rollup: penjualan_harian per (tanggal, menu) dan penjualan_harian_karyawan
+per (tanggal, karyawan). Keduanya sengaja tidak digabung per (tanggal, menu,
+karyawan), karena kombinasi itu tumbuh hampir sebanyak baris detail.
+Pendapatan dihitung dari jumlah DetailTransaksi.harga (subtotal baris).
+
+Pemakaian:
+    python rollup.py rebuild [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+
+import argparse
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import DetailTransaksi, PenjualanHarian, PenjualanHarianKaryawan, Transaksi
+
+
+def record_sale(session, tanggal, karyawan_id, lines):
+    """Menambahkan satu transaksi ke rollup (tanpa commit).
+
+    lines berisi objek dengan atribut menu_id, jumlah, dan subtotal, satu per menu
+    (mis. checkout.CartLine).
+    """
+    if not lines:
+        return
+    per_menu = sqlite_insert(PenjualanHarian)
+    session.execute(
+        per_menu.on_conflict_do_update(
+            index_elements=[PenjualanHarian.tanggal, PenjualanHarian.menu_id],
+            set_={
+                "pendapatan": PenjualanHarian.pendapatan + per_menu.excluded.pendapatan,
+                "jumlah_order": PenjualanHarian.jumlah_order + per_menu.excluded.jumlah_order,
+                "jumlah_item": PenjualanHarian.jumlah_item + per_menu.excluded.jumlah_item,
+            },
+        ),
+        [
+            {
+                "tanggal": tanggal,
+                "menu_id": line.menu_id,
+                "pendapatan": line.subtotal,
+                "jumlah_order": 1,
+                "jumlah_item": line.jumlah,
+            }
+            for line in lines
+        ],
+    )
+    per_karyawan = sqlite_insert(PenjualanHarianKaryawan).values(
+        tanggal=tanggal,
+        karyawan_id=karyawan_id,
+        pendapatan=sum(line.subtotal for line in lines),
+        jumlah_order=1,
+        jumlah_item=sum(line.jumlah for line in lines),
+    )
+    session.execute(per_karyawan.on_conflict_do_update(
+        index_elements=[PenjualanHarianKaryawan.tanggal, PenjualanHarianKaryawan.karyawan_id],
+        set_={
+            "pendapatan": PenjualanHarianKaryawan.pendapatan + per_karyawan.excluded.pendapatan,
+            "jumlah_order": PenjualanHarianKaryawan.jumlah_order + per_karyawan.excluded.jumlah_order,
+            "jumlah_item": PenjualanHarianKaryawan.jumlah_item + per_karyawan.excluded.jumlah_item,
+        },
+    ))
+
+
+def _date_filters(column, start, end):
+    clauses = []
+    if start is not None:
+        clauses.append(column >= start)
+    if end is not None:
+        clauses.append(column <= end)
+    return clauses
+
+
+def rebuild(executor, start=None, end=None):
+    """Membangun ulang rollup untuk rentang tanggal (default: seluruh riwayat), tanpa commit.
+
+    executor boleh berupa Session atau Connection.
+    """
+    executor.execute(delete(PenjualanHarian).where(*_date_filters(PenjualanHarian.tanggal, start, end)))
+    executor.execute(delete(PenjualanHarianKaryawan)
+                     .where(*_date_filters(PenjualanHarianKaryawan.tanggal, start, end)))
+
+    in_range = _date_filters(Transaksi.tanggal_pembelian, start, end)
+    executor.execute(insert(PenjualanHarian).from_select(
+        ["tanggal", "menu_id", "pendapatan", "jumlah_order", "jumlah_item"],
+        select(
+            Transaksi.tanggal_pembelian,
+            DetailTransaksi.menu_id,
+            func.sum(DetailTransaksi.harga),
+            func.count(func.distinct(Transaksi.transaksi_id)),
+            func.sum(DetailTransaksi.jumlah),
+        )
+        .join(DetailTransaksi, DetailTransaksi.transaksi_id == Transaksi.transaksi_id)
+        .where(*in_range)
+        .group_by(Transaksi.tanggal_pembelian, DetailTransaksi.menu_id),
+    ))
+
+    # Total per transaksi dulu, lalu dijumlahkan per hari per karyawan
+    per_transaksi = (
+        select(
+            Transaksi.tanggal_pembelian,
+            Transaksi.karyawan_id,
+            func.sum(DetailTransaksi.harga).label("pendapatan"),
+            func.sum(DetailTransaksi.jumlah).label("jumlah_item"),
+        )
+        .join(DetailTransaksi, DetailTransaksi.transaksi_id == Transaksi.transaksi_id)
+        .where(*in_range)
+        .group_by(Transaksi.transaksi_id)
+        .subquery()
+    )
+    executor.execute(insert(PenjualanHarianKaryawan).from_select(
+        ["tanggal", "karyawan_id", "pendapatan", "jumlah_order", "jumlah_item"],
+        select(
+            per_transaksi.c.tanggal_pembelian,
+            per_transaksi.c.karyawan_id,
+            func.sum(per_transaksi.c.pendapatan),
+            func.count(),
+            func.sum(per_transaksi.c.jumlah_item),
+        )
+        .group_by(per_transaksi.c.tanggal_pembelian, per_transaksi.c.karyawan_id),
+    ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kelola rollup penjualan harian.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--start", type=date.fromisoformat)
+    parser.add_argument("--end", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    from concurrency import run_write
+    from db_config import SessionLocal, init_db
+
+    init_db()
+    with SessionLocal() as session:
+        run_write(session, rebuild, args.start, args.end)
+    print("Rollup penjualan harian berhasil dibangun ulang.")
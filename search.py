@@ -0,0 +1,137 @@
+# search.py
+
+"""Pencarian awalan (type-ahead) pelanggan, menu, dan bahan baku dengan SQLite FTS5.
+
+Setiap tabel punya indeks FTS5 external content (cari_pelanggan, cari_menu,
+cari_bahan_baku) yang menunjuk ke rowid tabel aslinya, sehingga teksnya tidak
+disimpan dua kali. Trigger AFTER INSERT/UPDATE OF/DELETE menjaga indeks tetap
+sinkron untuk semua jalur tulis (halaman, api.py, importer, checkout), termasuk
+upsert ON CONFLICT DO UPDATE. Trigger UPDATE hanya untuk kolom yang diindeks dan
+hanya bila nilainya berubah, jadi perubahan stok atau harga tidak menyentuh indeks.
+
+FTS5 menulis indeks yang tertunda di akhir setiap statement. Penulisan massal
+sebaiknya memakai sedikit statement berisi banyak baris (INSERT multi-VALUES,
+INSERT ... SELECT), bukan executemany per baris; lihat importer._upsert_rows.
+
+Tabel dan trigger dibuat oleh migrasi 7 (lihat migrations.py). Rowid tabel
+tanpa INTEGER PRIMARY KEY bisa berubah oleh VACUUM; jalankan rebuild() setelahnya.
+
+Pemakaian:
+    search(session, Pelanggan, "bud 0812")  # [(pelanggan_id, label), ...] paling cocok dulu
+"""
+
+import re
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models import BahanBaku, Menu, Pelanggan
+
+DEFAULT_LIMIT = 20
+# Awalan pendek bisa cocok dengan hampir semua baris; hanya sejumlah ini kandidat
+# pertama yang diberi peringkat bm25, agar waktu query tidak tumbuh dengan jumlah data
+RANK_CANDIDATES = 500
+
+
+class SearchIndex(NamedTuple):
+    fts_table: str
+    table: str
+    id_column: str
+    columns: tuple  # kolom teks yang diindeks; kolom pertama adalah nama tampilan
+
+
+INDEXES = {
+    Pelanggan: SearchIndex("cari_pelanggan", "pelanggan", "pelanggan_id", ("cus_name", "contact_info")),
+    Menu: SearchIndex("cari_menu", "menu", "menu_id", ("nama_menu",)),
+    BahanBaku: SearchIndex("cari_bahan_baku", "bahan_baku", "bahan_id", ("nama_bahan",)),
+}
+
+
+def ddl(index: SearchIndex):
+    """Pernyataan CREATE untuk tabel FTS5 dan trigger sinkronisasinya."""
+    fts, table, columns = index.fts_table, index.table, ", ".join(index.columns)
+    new_values = ", ".join(f"new.{c}" for c in index.columns)
+    old_values = ", ".join(f"old.{c}" for c in index.columns)
+    delete_old = (f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+                  f"VALUES ('delete', old.rowid, {old_values});")
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.rowid, {new_values});"
+    # Upsert impor ulang menulis nilai yang sama; indeks hanya disentuh bila teksnya berubah
+    changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in index.columns)
+    return [
+        # prefix='1 2 3': awalan pendek dicari lewat indeks awalan, bukan scan semua term
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{table}', "
+        f"content_rowid='rowid', tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {table} "
+        f"WHEN {changed} BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def create_indexes(conn):
+    """Membuat semua indeks pencarian beserta triggernya lalu mengisinya dari data yang ada."""
+    for index in INDEXES.values():
+        for statement in ddl(index):
+            conn.exec_driver_sql(statement)
+    rebuild(conn)
+
+
+def rebuild(conn):
+    """Membangun ulang semua indeks dari tabel aslinya (mis. setelah VACUUM)."""
+    for index in INDEXES.values():
+        conn.exec_driver_sql(f"INSERT INTO {index.fts_table}({index.fts_table}) VALUES ('rebuild')")
+
+
+def match_expression(query):
+    """Ubah teks ketikan pengguna menjadi query FTS5: setiap kata dicari sebagai awalan
+    dan semua kata harus ada, mis. 'bud 0812' -> '"bud"* "0812"*'. None jika kosong."""
+    terms = re.findall(r"\w+", query or "")
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _label(row):
+    nama, *lainnya = row[1:]
+    keterangan = ", ".join(str(v) for v in lainnya if v)
+    return f"{nama} ({keterangan})" if keterangan else nama
+
+
+def search(session: Session, model, query, limit=DEFAULT_LIMIT):
+    """Maksimal limit pasangan (ID, label) yang cocok dengan query.
+
+    ID yang diawali teks query ditampilkan dulu, lalu kecocokan nama (dan kontak
+    pelanggan) menurut peringkat bm25. Query kosong mengembalikan limit baris
+    pertama menurut ID.
+    """
+    index = INDEXES[model]
+    id_column = index.id_column
+    columns = ", ".join(f"t.{c}" for c in (id_column, *index.columns))
+    query = (query or "").strip()
+    # Rentang PK, bukan LIKE, agar indeks primary key terpakai; ID umumnya huruf besar (P001)
+    by_id = text(f"SELECT {columns} FROM {index.table} t WHERE t.{id_column} >= :start "
+                 f"AND t.{id_column} < :end ORDER BY t.{id_column} LIMIT :limit")
+    rows = []
+    for prefix in dict.fromkeys((query, query.upper())):
+        rows = session.execute(by_id, {"start": prefix, "end": prefix + "\uffff", "limit": limit}).all()
+        if rows:
+            break
+    expression = match_expression(query)
+    if expression is not None and len(rows) < limit:
+        found = {row[0] for row in rows}
+        rows += [row for row in session.execute(
+            text(f"SELECT {columns} FROM (SELECT rowid, rank FROM {index.fts_table} "
+                 f"WHERE {index.fts_table} MATCH :expression LIMIT :candidates) f "
+                 f"JOIN {index.table} t ON t.rowid = f.rowid ORDER BY f.rank LIMIT :limit"),
+            {"expression": expression, "candidates": RANK_CANDIDATES, "limit": limit}) if row[0] not in found]
+    return [(row[0], _label(row)) for row in rows[:limit]]
+
+
+def label_of(session: Session, model, id_value):
+    """Label tampilan satu ID, atau None jika tidak ada."""
+    index = INDEXES[model]
+    columns = ", ".join((index.id_column, *index.columns))
+    row = session.execute(text(f"SELECT {columns} FROM {index.table} WHERE {index.id_column} = :id"),
+                          {"id": id_value}).first()
+    return None if row is None else _label(row)
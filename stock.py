@@ -0,0 +1,120 @@
+# stock.py
+
+"""Validasi dan pengurangan stok bahan baku berbasis himpunan (set-based).
+
+Satu query join menghitung kebutuhan semua bahan untuk pesanan, lalu satu UPDATE
+bersyarat mengurangi semua stok sekaligus hanya jika tidak ada bahan yang kurang.
+Karena pengecekan dan pengurangan terjadi dalam satu statement, dua kasir yang
+berebut bahan yang sama tidak akan pernah membuat stok menjadi negatif. Setiap
+pengurangan juga menaikkan BahanBaku.version_id, sehingga form edit bahan yang
+dibuka sebelumnya ditolak saat disimpan (lihat concurrency.py).
+"""
+
+from typing import NamedTuple
+
+from sqlalchemy import case, exists, func, select, update
+from sqlalchemy.orm import Session, aliased
+
+from models import BahanBaku, KomposisiMenu
+
+
+class KebutuhanBahan(NamedTuple):
+    bahan_id: str
+    nama_bahan: str
+    satuan: str
+    stock: int
+    dibutuhkan: int
+
+    @property
+    def kurang(self):
+        return self.stock < self.dibutuhkan
+
+
+class StockReservation(NamedTuple):
+    ok: bool
+    kebutuhan: list
+
+    @property
+    def shortages(self):
+        """Bahan yang stoknya tidak mencukupi."""
+        return [k for k in self.kebutuhan if k.kurang]
+
+
+def _kebutuhan_subquery(items):
+    """Subquery (bahan_id, total) berisi total kebutuhan tiap bahan untuk semua item."""
+    jumlah_per_menu = case(items, value=KomposisiMenu.menu_id)
+    return (
+        select(
+            KomposisiMenu.bahan_id,
+            func.sum(KomposisiMenu.jumlah_bahan * jumlah_per_menu).label("total"),
+        )
+        .where(KomposisiMenu.menu_id.in_(list(items)))
+        .group_by(KomposisiMenu.bahan_id)
+        .subquery("kebutuhan")
+    )
+
+
+def get_kebutuhan(session: Session, items):
+    """Menghitung kebutuhan dan stok tiap bahan untuk {menu_id: jumlah} dalam satu query join."""
+    kebutuhan = _kebutuhan_subquery(items)
+    rows = session.execute(
+        select(
+            BahanBaku.bahan_id, BahanBaku.nama_bahan, BahanBaku.satuan,
+            BahanBaku.stock, kebutuhan.c.total,
+        )
+        .join(kebutuhan, kebutuhan.c.bahan_id == BahanBaku.bahan_id)
+        .order_by(BahanBaku.bahan_id)
+    )
+    return [KebutuhanBahan(*row) for row in rows]
+
+
+def reserve_items(session: Session, items):
+    """Memeriksa dan mengurangi stok untuk {menu_id: jumlah} secara atomik.
+
+    Tidak melakukan commit: pemanggil menentukan batas transaksi, sehingga
+    reservasi bisa digabung dengan penulisan lain (mis. detail transaksi).
+    Jika ada bahan yang kurang, UPDATE bersyarat tidak mengubah baris apa pun,
+    StockReservation.ok bernilai False dan .shortages berisi bahan-bahan tersebut;
+    pemanggil sebaiknya tetap melakukan rollback.
+    """
+    items = {menu_id: jumlah for menu_id, jumlah in items.items() if jumlah > 0}
+    if not items:
+        return StockReservation(True, [])
+
+    kebutuhan_list = get_kebutuhan(session, items)
+    if not kebutuhan_list:
+        # Menu tanpa komposisi tidak memakai bahan baku
+        return StockReservation(True, [])
+    if any(k.kurang for k in kebutuhan_list):
+        return StockReservation(False, kebutuhan_list)
+
+    # Pengecekan ulang dan pengurangan dalam satu UPDATE bersyarat. Subquery
+    # dipakai (bukan CTE) karena sqlite3 tidak melaporkan rowcount untuk WITH ... UPDATE.
+    kebutuhan = _kebutuhan_subquery(items)
+    bahan_lain = aliased(BahanBaku)
+    total_per_bahan = (
+        select(func.sum(KomposisiMenu.jumlah_bahan * case(items, value=KomposisiMenu.menu_id)))
+        .where(KomposisiMenu.menu_id.in_(list(items)), KomposisiMenu.bahan_id == BahanBaku.bahan_id)
+        .scalar_subquery()
+    )
+    result = session.execute(
+        update(BahanBaku)
+        .where(BahanBaku.bahan_id.in_(
+            select(KomposisiMenu.bahan_id).where(KomposisiMenu.menu_id.in_(list(items)))
+        ))
+        .where(~exists().where(
+            bahan_lain.bahan_id == kebutuhan.c.bahan_id,
+            bahan_lain.stock < kebutuhan.c.total,
+        ))
+        .values(stock=BahanBaku.stock - total_per_bahan, version_id=BahanBaku.version_id + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(kebutuhan_list):
+        # Stok berubah oleh transaksi lain di antara SELECT dan UPDATE
+        return StockReservation(False, get_kebutuhan(session, items))
+    return StockReservation(True, kebutuhan_list)
+
+
+def reserve_stock(session: Session, menu_id, jumlah):
+    """Memeriksa dan mengurangi stok bahan untuk satu menu sebanyak jumlah porsi."""
+    return reserve_items(session, {menu_id: jumlah})
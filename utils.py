@@ -1,26 +1,223 @@
 # utils.py
 
-from sqlalchemy.orm import Session
-from models import Base
-
-def get_all(session: Session, model):
-    """Mengambil semua entri dari model tertentu."""
-    return session.query(model).all()
-
-def get_by_id(session: Session, model, id_value, id_field):
-    """Mengambil entri berdasarkan ID dari model tertentu."""
-    return session.query(model).filter(id_field == id_value).first()
-
-def add_instance(session: Session, instance):
-    """Menambahkan instansi baru ke database."""
-    session.add(instance)
-    session.commit()
-
-def update_instance(session: Session):
-    """Menyimpan perubahan pada database."""
-    session.commit()
-
-def delete_instance(session: Session, instance):
-    """Menghapus instansi dari database."""
-    session.delete(instance)
-    session.commit()
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import MANYTOONE, Session, joinedload, load_only, raiseload, selectinload
+from models import (
+    Karyawan, Pelanggan, Supplier, BahanBaku, Menu, Feedback, VersiTabel
+)
+
+# -------------------- QUERY DAFTAR TANPA N+1 --------------------
+# Tampilan daftar mendeklarasikan relasi dan kolom yang dibutuhkan di depan, sehingga
+# satu halaman berisi N baris selalu memakan jumlah query yang tetap:
+# - list_rows(): proyeksi kolom biasa, relasi digabung dengan outer join (1 query)
+# - list_objects(): objek ORM; relasi many-to-one lewat joinedload, koleksi lewat
+#   selectinload (1 query + 1 per koleksi). Relasi lain yang tidak dideklarasikan
+#   memakai raiseload, jadi lazy load per baris gagal dengan jelas alih-alih diam-diam N+1.
+
+def projection(columns, joins=()):
+    """SELECT kolom-kolom (boleh dari tabel relasi) dengan outer join lewat atribut
+    relasi, mis. projection([Transaksi.transaksi_id, Pelanggan.cus_name], [Transaksi.pelanggan])."""
+    stmt = select(*columns)
+    for relation in joins:
+        stmt = stmt.outerjoin(relation)
+    return stmt
+
+def list_rows(session: Session, columns, joins=(), where=(), order_by=(), limit=None):
+    """Baris tuple hasil projection() dalam satu query."""
+    stmt = projection(columns, joins).where(*where).order_by(*order_by)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return session.execute(stmt).all()
+
+def relationship_loads(model, paths):
+    """Opsi loader untuk path relasi bertitik, mis. ("pelanggan", "detail_transaksi.menu")."""
+    options = []
+    for path in paths:
+        option, current = None, model
+        for name in path.split("."):
+            attr = getattr(current, name)
+            prop = attr.property
+            if prop.direction is MANYTOONE:
+                # FK wajib isi: inner join cukup dan lebih murah
+                innerjoin = not any(column.nullable for column in prop.local_columns)
+                option = (joinedload(attr, innerjoin=innerjoin) if option is None
+                          else option.joinedload(attr, innerjoin=innerjoin))
+            else:
+                option = selectinload(attr) if option is None else option.selectinload(attr)
+            current = prop.mapper.class_
+        options.append(option)
+    # Relasi yang tidak dideklarasikan tidak boleh memicu query per baris
+    options.append(raiseload("*", sql_only=True))
+    return options
+
+def list_objects(session: Session, model, relationships=(), where=(), order_by=(), limit=None, columns=None):
+    """Objek model beserta relasi yang dideklarasikan, dalam jumlah query tetap.
+
+    columns membatasi kolom model utama yang dimuat (load_only).
+    """
+    stmt = select(model).where(*where).order_by(*order_by).options(*relationship_loads(model, relationships))
+    if columns:
+        stmt = stmt.options(load_only(*columns))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return session.scalars(stmt).unique().all()
+
+# -------------------- CACHE BACA BERVERSI PER TABEL --------------------
+# Setiap tabel punya penghitung versi yang naik setiap kali ada commit yang
+# mengubah tabel tersebut. Cache disimpan per (kunci, versi), sehingga pembaca
+# tidak pernah melihat data basi dan tabel yang tidak berubah tidak di-query ulang.
+# Cache ini berlaku per proses (satu server Streamlit).
+#
+# Agar proses lain yang memakai database yang sama (mis. api.py di samping
+# Streamlit) ikut membuang cache-nya, setiap commit juga menaikkan versi tabel di
+# tabel versi_tabel dalam transaksi yang sama. Proses membaca tabel kecil itu di
+# awal setiap rerun/request lewat sync_table_versions().
+
+_version_lock = threading.Lock()
+_table_versions = {}
+_read_cache = {}
+# group -> kunci cache berurutan dari yang paling lama tidak dipakai (LRU)
+_cache_groups = {}
+# versi_tabel terakhir yang sudah diketahui proses ini
+_shared_versions = {}
+
+# Proyeksi ringan (ID, nama) untuk daftar pilihan di form
+REFERENCE_COLUMNS = {
+    Karyawan: (Karyawan.karyawan_id, Karyawan.employee_name),
+    Pelanggan: (Pelanggan.pelanggan_id, Pelanggan.cus_name),
+    Supplier: (Supplier.supplier_id, Supplier.supplier_name),
+    BahanBaku: (BahanBaku.bahan_id, BahanBaku.nama_bahan),
+    Menu: (Menu.menu_id, Menu.nama_menu),
+    Feedback: (Feedback.feedback_id, Feedback.pelanggan_id),
+}
+
+def table_version(table_name):
+    """Mengembalikan versi terkini sebuah tabel."""
+    return _table_versions.get(table_name, 0)
+
+def bump_table_version(*table_names):
+    """Menaikkan versi tabel; dipakai otomatis saat commit, atau manual untuk
+    penulisan di luar Session (mis. lewat engine.begin())."""
+    with _version_lock:
+        for name in table_names:
+            _table_versions[name] = _table_versions.get(name, 0) + 1
+        # Buang entri cache dengan versi lama agar memori tidak terus tumbuh
+        for key in [k for k, (versions, _) in _read_cache.items()
+                    if any(name in dict(versions) for name in table_names)]:
+            del _read_cache[key]
+            for keys in _cache_groups.values():
+                keys.pop(key, None)
+
+def cached_by_version(key, table_names, loader, group=None, max_entries=None):
+    """Mengembalikan hasil loader() yang di-cache selama versi tabel tidak berubah.
+
+    Kunci yang jumlahnya tidak terbatas (mis. halaman daftar per filter teks bebas)
+    diberi group dan max_entries: entri group itu yang paling lama tidak dipakai
+    dibuang begitu jumlahnya melewati max_entries.
+    """
+    versions = tuple((name, table_version(name)) for name in table_names)
+    entry = _read_cache.get(key)
+    if entry is not None and entry[0] == versions:
+        if group is not None:
+            with _version_lock:
+                keys = _cache_groups.get(group)
+                if keys is not None and key in keys:
+                    keys.move_to_end(key)
+        return entry[1]
+    value = loader()
+    with _version_lock:
+        _read_cache[key] = (versions, value)
+        if group is not None:
+            keys = _cache_groups.setdefault(group, OrderedDict())
+            keys[key] = None
+            keys.move_to_end(key)
+            while max_entries is not None and len(keys) > max_entries:
+                oldest, _ = keys.popitem(last=False)
+                _read_cache.pop(oldest, None)
+    return value
+
+def sync_table_versions(session: Session):
+    """Membuang cache tabel yang diubah proses lain sejak pemeriksaan terakhir.
+
+    Mengembalikan daftar tabel yang versinya dinaikkan.
+    """
+    rows = session.execute(select(VersiTabel.nama_tabel, VersiTabel.versi)).all()
+    with _version_lock:
+        stale = [name for name, versi in rows if _shared_versions.get(name) != versi]
+        _shared_versions.update(rows)
+    if stale:
+        bump_table_version(*stale)
+    return stale
+
+def get_reference_list(session: Session, model):
+    """Daftar (ID, nama) untuk model referensi, diambil dari cache berversi."""
+    id_col, name_col = REFERENCE_COLUMNS[model]
+    table_name = model.__tablename__
+
+    def load():
+        return [tuple(row) for row in session.execute(select(id_col, name_col).order_by(id_col))]
+
+    return cached_by_version(("reference", table_name), (table_name,), load)
+
+def get_reference_ids(session: Session, model):
+    """Daftar ID untuk selectbox, diambil dari cache berversi."""
+    return [row[0] for row in get_reference_list(session, model)]
+
+def _pending_tables(session):
+    return session.info.setdefault("changed_tables", set())
+
+def mark_tables_changed(session: Session, *table_names):
+    """Mencatat tabel yang diubah di luar event ORM (mis. lewat exec_driver_sql)
+    agar versinya ikut naik saat session di-commit."""
+    _pending_tables(session).update(table_names)
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    tables = _pending_tables(session)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    # INSERT/UPDATE/DELETE massal lewat session.execute() tidak melewati flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and table.name != VersiTabel.__tablename__:
+            _pending_tables(orm_execute_state.session).add(table.name)
+
+@event.listens_for(Session, "before_commit")
+def _publish_changed_tables(session):
+    # Flush dulu agar tabel dari perubahan ORM yang belum di-flush ikut tercatat
+    session.flush()
+    tables = sorted(session.info.get("changed_tables", ()))
+    if not tables:
+        return
+    stmt = sqlite_insert(VersiTabel).values([{"nama_tabel": name, "versi": 1} for name in tables])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VersiTabel.nama_tabel], set_={"versi": VersiTabel.versi + 1}
+    ).returning(VersiTabel.nama_tabel, VersiTabel.versi)
+    session.info["published_versions"] = session.execute(stmt).all()
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    tables = session.info.pop("changed_tables", None)
+    published = session.info.pop("published_versions", ())
+    with _version_lock:
+        # Kenaikan milik sendiri tidak perlu dibuang lagi oleh sync_table_versions(),
+        # kecuali ada proses lain yang menaikkan versi di antaranya
+        for name, versi in published:
+            if _shared_versions.get(name) == versi - 1:
+                _shared_versions[name] = versi
+    if tables:
+        bump_table_version(*tables)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop("changed_tables", None)
+    session.info.pop("published_versions", None)
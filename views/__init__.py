@@ -0,0 +1,42 @@
+# views/__init__.py
+
+"""Halaman aplikasi Streamlit, dimuat saat pertama kali dibuka.
+
+app.py hanya mengimpor paket ini. Modul halaman (beserta pandas dan modul layanan
+yang dipakainya) baru diimpor oleh load_page() ketika halamannya dipilih pertama
+kali, lalu tetap ada di sys.modules sehingga rerun berikutnya tidak mengimpor,
+mem-parse, atau mengompilasi ulang kode halaman.
+"""
+
+import importlib
+
+from instrumentation import SQL_STATS_ENABLED
+
+# label navigasi -> (modul di paket views, fungsi halaman)
+PAGES = {
+    "Beranda": ("home", "show_home"),
+    "Karyawan": ("karyawan", "manage_karyawan"),
+    "Pelanggan": ("pelanggan", "manage_pelanggan"),
+    "Supplier": ("supplier", "manage_supplier"),
+    "Bahan Baku": ("bahan_baku", "manage_bahan_baku"),
+    "Menu": ("menu", "manage_menu"),
+    "Transaksi": ("transaksi", "manage_transaksi"),
+    "Feedback": ("feedback", "manage_feedback"),
+    "Absensi Sidik Jari": ("absensi", "manage_fingerprint_absensi"),  # Menu Baru
+    "Pemesanan Bahan": ("pemesanan_bahan", "manage_pemesanan_bahan"),
+    "Penggajian": ("penggajian", "manage_penggajian"),
+    "Laporan": ("laporan", "manage_laporan"),
+    "Impor Data": ("impor", "manage_import"),
+    "Ekspor Data": ("ekspor", "manage_export"),
+}
+
+# Panel kinerja SQL hanya tersedia bila instrumentasi aktif (RESTORIFY_SQL_STATS=1)
+if SQL_STATS_ENABLED:
+    PAGES["Kinerja SQL"] = ("sql_stats", "manage_sql_stats")
+
+
+def load_page(label):
+    """Fungsi halaman untuk label navigasi; modulnya diimpor saat pertama kali dibutuhkan."""
+    module_name, function_name = PAGES[label]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, function_name)
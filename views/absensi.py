@@ -0,0 +1,96 @@
+# views/absensi.py
+
+"""Halaman absensi sidik jari (mockup)."""
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from attendance import AKSI_MASUK, AKSI_TIDAK_DIKENAL, ingest_batch, scan as scan_fingerprint
+from models import Karyawan
+from repositories import absensi as absensi_repo, karyawan as karyawan_repo
+from utils import cached_by_version, get_reference_ids
+
+def manage_fingerprint_absensi(session: Session):
+    st.subheader("Absensi dengan Sidik Jari (Mockup)")
+    
+    tab1, tab2 = st.tabs(["Pendaftaran Sidik Jari", "Scan Sidik Jari & Absen"])
+
+    # Tab 1: Pendaftaran Sidik Jari
+    with tab1:
+        st.write("## Daftarkan/Mutakhirkan ID Sidik Jari Karyawan")
+        karyawan_ids = get_reference_ids(session, Karyawan)
+        if karyawan_ids:
+            selected_karyawan_id = st.selectbox("Pilih Karyawan", karyawan_ids)
+            karyawan_terpilih = karyawan_repo.get(session, selected_karyawan_id)
+            if karyawan_terpilih:
+                st.write(f"ID Sidik Jari sekarang: **{karyawan_terpilih.fingerprint_id or '(Belum ada)'}**")
+                new_fp = st.text_input("Masukkan ID Sidik Jari Baru (mis. FIDxxx)")
+                if st.button("Simpan Sidik Jari"):
+                    if not new_fp:
+                        st.error("Masukkan ID Sidik Jari.")
+                    else:
+                        try:
+                            karyawan_repo.update(session, selected_karyawan_id, fingerprint_id=new_fp)
+                            st.success("ID Sidik Jari berhasil diperbarui.")
+                        except IntegrityError:
+                            st.error("ID Sidik Jari sudah dipakai karyawan lain.")
+        else:
+            st.info("Belum ada data karyawan. Tambahkan karyawan terlebih dahulu.")
+
+    # Tab 2: Scan Sidik Jari & Absen
+    with tab2:
+        st.write("## Lakukan Scan Sidik Jari (Mock)")
+        fp_input = st.text_input("Masukkan ID Sidik Jari yang terdeteksi sensor (mock)")
+        if st.button("Absen"):
+            if not fp_input:
+                st.error("Tolong isi ID Sidik Jari.")
+            else:
+                hasil = scan_fingerprint(session, fp_input)
+                if hasil.aksi == AKSI_TIDAK_DIKENAL:
+                    st.error("Sidik jari tidak dikenali!")
+                elif hasil.aksi == AKSI_MASUK:
+                    st.success(f"{hasil.employee_name} absen masuk pukul "
+                               f"{hasil.jam_masuk:%H:%M} (ID: {hasil.karyawan_id}).")
+                else:
+                    st.success(f"{hasil.employee_name} absen pulang pukul "
+                               f"{hasil.jam_keluar:%H:%M} (ID: {hasil.karyawan_id}).")
+
+        with st.expander("Unggah Scan dari Mesin Absen (CSV)"):
+            st.caption("Kolom: fingerprint_id, waktu (YYYY-MM-DD HH:MM:SS).")
+            scan_file = st.file_uploader("File scan", type=["csv"], key="scan_file")
+            if scan_file is not None and st.button("Proses Scan"):
+                scans = pd.read_csv(scan_file, dtype={"fingerprint_id": str})
+                if not {"fingerprint_id", "waktu"} <= set(scans.columns):
+                    st.error("File harus memiliki kolom fingerprint_id dan waktu.")
+                    st.stop()
+                # Waktu yang tidak valid menjadi NaT dan dilaporkan per baris oleh ingest_batch
+                waktu = pd.to_datetime(scans["waktu"], errors="coerce").dt.to_pydatetime()
+                hasil = ingest_batch(session, zip(scans["fingerprint_id"], waktu))
+                st.success(f"{hasil.diterima} scan diproses menjadi {hasil.baris_absensi} baris absensi.")
+                if hasil.ditolak:
+                    st.warning(f"{len(hasil.ditolak)} scan ditolak karena sidik jari tidak dikenali.")
+                    st.dataframe(pd.DataFrame(hasil.ditolak, columns=["fingerprint_id", "waktu"]))
+                if hasil.tidak_valid:
+                    st.warning(f"{len(hasil.tidak_valid)} baris dilewati karena tidak valid.")
+                    rusak = scans.iloc[[urutan - 1 for urutan, _, _ in hasil.tidak_valid]].assign(
+                        alasan=[alasan for _, _, alasan in hasil.tidak_valid])
+                    rusak.index += 2  # nomor baris di file CSV (baris 1 = header)
+                    st.dataframe(rusak)
+
+        st.write("---")
+        st.write("### Riwayat Absensi Terakhir")
+        df = cached_by_version(("riwayat_absensi",), ("absensi", "karyawan"), lambda: recent_absensi(session))
+        if not df.empty:
+            st.dataframe(df, use_container_width=True)
+        else:
+            st.info("Belum ada data absensi.")
+
+def recent_absensi(session: Session, limit=10):
+    """Absensi terakhir beserta nama karyawan sebagai DataFrame tampilan."""
+    df = pd.DataFrame(absensi_repo.recent(session, limit), columns=["Absensi ID", "Karyawan ID", "Nama Karyawan", "Tanggal",
+                                     "Status", "Jam Masuk", "Jam Pulang"])
+    for column in ["Jam Masuk", "Jam Pulang"]:
+        df[column] = pd.to_datetime(df[column]).dt.strftime("%H:%M:%S")
+    return df
@@ -0,0 +1,165 @@
+# views/bahan_baku.py
+
+"""Halaman kelola data bahan baku serta perkiraan dan pesan ulang."""
+
+from datetime import date
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from concurrency import DatabaseBusyError, WriteConflictError, run_write
+from forecast import create_draft_orders, refresh_usage, reorder_plan
+from models import BahanBaku, Supplier
+from pagination import ListColumn, ListSpec
+from purchasing import PurchasingError
+from repositories import bahan_baku as bahan_baku_repo
+from utils import cached_by_version, get_reference_ids
+from views.common import remember_version, search_select, show_paginated_table, shown_version
+
+BAHAN_BAKU_LIST = ListSpec(
+    key="lihat_bahan_baku",
+    columns=[
+        ListColumn("ID Bahan Baku", BahanBaku.bahan_id),
+        ListColumn("Nama Bahan", BahanBaku.nama_bahan),
+        ListColumn("Stok", BahanBaku.stock),
+        ListColumn("Satuan", BahanBaku.satuan),
+        ListColumn("Harga Bahan", BahanBaku.harga_bahan, money=True),
+        ListColumn("Supplier ID", BahanBaku.supplier_id),
+    ],
+    pk=BahanBaku.bahan_id,
+    sort_columns={"ID Bahan Baku": BahanBaku.bahan_id, "Nama Bahan": BahanBaku.nama_bahan,
+                  "Stok": BahanBaku.stock},
+)
+
+# Tabel yang dibaca reorder_plan(); rencana di-cache sampai salah satunya berubah
+PLAN_TABLES = ("bahan_baku", "pemakaian_bahan_harian", "pemesanan_bahan", "detail_pemesanan_bahan")
+
+# session_state: {bahan_id: version_id yang sedang ditampilkan form Perbarui}
+VERSI_KEY = "versi_perbarui_bahan_baku"
+
+def manage_bahan_baku(session: Session):
+    st.subheader("Kelola Data Bahan Baku")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus", "Perkiraan & Pesan Ulang"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Bahan Baku")
+        with st.form("form_tambah_bahan_baku", clear_on_submit=True):
+            bahan_id = st.text_input("ID Bahan Baku")
+            nama_bahan = st.text_input("Nama Bahan")
+            stock = st.number_input("Stok", min_value=0, value=0)
+            satuan = st.text_input("Satuan")
+            harga_bahan = st.number_input("Harga Bahan", min_value=0.0, value=0.0)
+
+            supplier_ids = get_reference_ids(session, Supplier)
+            if supplier_ids:
+                supplier_id = st.selectbox("Supplier ID", supplier_ids)
+            else:
+                st.warning("Belum ada supplier. Tambahkan supplier terlebih dahulu.")
+                supplier_id = None
+
+            submit = st.form_submit_button("Simpan")  # Tombol submit
+            if submit:
+                if not bahan_id or not nama_bahan or not satuan or not supplier_id:
+                    st.error("Semua field wajib diisi.")
+                else:
+                    if bahan_baku_repo.exists(session, bahan_id):
+                        st.error("ID Bahan Baku sudah ada.")
+                    else:
+                        bahan_baku_repo.create(session, bahan_id, nama_bahan, stock, satuan, harga_bahan, supplier_id)
+                        st.success("Data bahan baku berhasil ditambahkan.")
+        if not get_reference_ids(session, Supplier):
+            st.warning("Belum ada supplier. Tambahkan supplier terlebih dahulu.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Bahan Baku")
+        show_paginated_table(session, BAHAN_BAKU_LIST, "Belum ada data bahan baku.", 'daftar_bahan_baku.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Data Bahan Baku")
+        selected_bahan_id = search_select(session, BahanBaku, "Bahan Baku", key="perbarui_bahan_baku")
+        if selected_bahan_id:
+            selected_bahan = bahan_baku_repo.get(session, selected_bahan_id)
+            if selected_bahan:
+                with st.form("form_perbarui_bahan_baku"):
+                    nama_bahan = st.text_input("Nama Bahan", value=selected_bahan.nama_bahan)
+                    stock = st.number_input("Stok", min_value=0, value=selected_bahan.stock)
+                    satuan = st.text_input("Satuan", value=selected_bahan.satuan)
+                    harga_bahan = st.number_input("Harga Bahan", min_value=0.0, value=float(selected_bahan.harga_bahan))
+
+                    supplier_ids = get_reference_ids(session, Supplier)
+                    if selected_bahan.supplier_id in supplier_ids:
+                        idx = supplier_ids.index(selected_bahan.supplier_id)
+                    else:
+                        idx = 0
+                    if supplier_ids:
+                        supplier_id = st.selectbox("Supplier ID", supplier_ids, index=idx)
+                    else:
+                        st.warning("Belum ada supplier. Tambahkan supplier terlebih dahulu.")
+                        supplier_id = None
+
+                    submit = st.form_submit_button("Perbarui")  # Tombol submit
+                    versi = shown_version(VERSI_KEY, selected_bahan_id, selected_bahan.version_id, submit)
+                    if submit:
+                        if not nama_bahan or not satuan or not supplier_id:
+                            st.error("Semua field wajib diisi.")
+                        else:
+                            try:
+                                bahan_baku_repo.update(session, selected_bahan_id, versi, nama_bahan=nama_bahan,
+                                                       stock=stock, satuan=satuan, harga_bahan=harga_bahan,
+                                                       supplier_id=supplier_id)
+                                st.success("Data bahan baku berhasil diperbarui.")
+                                remember_version(VERSI_KEY, selected_bahan_id, versi + 1)
+                            except WriteConflictError:
+                                # Mis. stok berkurang oleh checkout kasir lain sejak form dibuka;
+                                # form kini menampilkan nilai terbaru
+                                remember_version(VERSI_KEY, selected_bahan_id, selected_bahan.version_id)
+                                st.error("Data bahan baku sudah berubah sejak form dibuka. "
+                                         "Periksa nilai terbaru lalu simpan ulang.")
+                            except DatabaseBusyError as exc:
+                                st.error(str(exc))
+
+    elif action == "Hapus":
+        st.subheader("Hapus Data Bahan Baku")
+        selected_bahan_id = search_select(session, BahanBaku, "Bahan Baku", key="hapus_bahan_baku")
+        if selected_bahan_id:
+            if st.button("Hapus"):
+                if bahan_baku_repo.delete(session, selected_bahan_id):
+                    st.success("Data bahan baku berhasil dihapus.")
+
+    elif action == "Perkiraan & Pesan Ulang":
+        st.subheader("Perkiraan Pemakaian dan Titik Pesan Ulang")
+        # Pemakaian harian hanya diperbarui jika ada penjualan baru
+        cached_by_version(("pemakaian_bahan",), ("penjualan_harian",), lambda: refresh_usage_and_commit(session))
+        plan, df = cached_by_version(("rencana_pesan_ulang", date.today()), PLAN_TABLES,
+                                     lambda: load_plan(session))
+        if plan.empty:
+            st.info("Belum ada data bahan baku.")
+            return
+        perlu_pesan = plan[plan["saran_pesan"] > 0]
+        st.write(f"{len(perlu_pesan)} dari {len(plan)} bahan sudah mencapai titik pesan ulang.")
+        hanya_perlu = st.checkbox("Hanya bahan yang perlu dipesan", value=True)
+        st.dataframe(df[df["Saran Pesan"] > 0] if hanya_perlu else df, use_container_width=True)
+        if not perlu_pesan.empty and st.button("Buat Draft Pesanan"):
+            try:
+                dibuat = create_draft_orders(session, plan)
+            except PurchasingError as exc:
+                st.error(str(exc))
+            else:
+                st.success(f"{len(dibuat)} draft pesanan dibuat: {', '.join(dibuat.values())}.")
+
+def load_plan(session: Session):
+    """Rencana pesan ulang beserta tabel tampilannya, untuk di-cache per versi tabel."""
+    plan = reorder_plan(session)
+    if plan.empty:
+        return plan, plan
+    df = plan.rename(columns={
+        "bahan_id": "ID Bahan", "nama_bahan": "Nama Bahan", "satuan": "Satuan",
+        "supplier_id": "Supplier", "stock": "Stok", "dipesan": "Sedang Dipesan",
+        "rata_rata_harian": "Rata-rata/Hari", "titik_pesan_ulang": "Titik Pesan Ulang",
+        "saran_pesan": "Saran Pesan",
+    }).drop(columns=["harga_bahan"])
+    df["Rata-rata/Hari"] = df["Rata-rata/Hari"].round(2)
+    return plan, df
+
+def refresh_usage_and_commit(session: Session):
+    return run_write(session, refresh_usage)
@@ -0,0 +1,137 @@
+# views/common.py
+
+"""Helper tampilan yang dipakai beberapa halaman."""
+
+import locale
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from models import Karyawan
+from pagination import ListSpec, build_filters, fetch_page
+from search import label_of, search
+from utils import cached_by_version, get_reference_ids
+
+# Halaman daftar yang di-cache per spec (semua sesi); filter teks bebas membuat
+# signature baru di setiap ketikan, jadi jumlahnya dibatasi (LRU)
+MAX_CACHED_PAGES = 64
+
+def format_rupiah(number):
+    """Fungsi membantu format angka ke rupiah (opsional)."""
+    try:
+        return f"Rp {locale.format_string('%0.2f', number, grouping=True)}"
+    except:
+        return f"Rp {number:.2f}"
+
+def list_tables(spec: ListSpec):
+    """Nama tabel yang dibaca spec: tabel utama dan tabel relasi yang di-join."""
+    return (spec.pk.class_.__tablename__,
+            *(relation.property.mapper.class_.__tablename__ for relation in spec.joins))
+
+def show_paginated_table(session: Session, spec: ListSpec, empty_message, file_name):
+    """Menampilkan tabel daftar dengan paginasi keyset, filter, dan pengurutan di SQL."""
+    key = spec.key
+    col_sort, col_order, col_size = st.columns(3)
+    sort_label = col_sort.selectbox("Urutkan", list(spec.sort_columns), key=f"{key}_sort")
+    descending = col_order.radio("Arah", ["Naik", "Turun"], horizontal=True, key=f"{key}_order") == "Turun"
+    page_size = col_size.selectbox("Baris per halaman", [25, 50, 100, 250], index=1, key=f"{key}_size")
+
+    date_range = karyawan_id = pelanggan_id = None
+    if spec.date_column is not None or spec.karyawan_column is not None or spec.pelanggan_column is not None:
+        with st.expander("Filter"):
+            if spec.date_column is not None and st.checkbox("Filter tanggal", key=f"{key}_use_date"):
+                rentang = st.date_input("Rentang tanggal", (datetime.today().replace(day=1), datetime.today()),
+                                        key=f"{key}_date")
+                if isinstance(rentang, (list, tuple)) and len(rentang) == 2:
+                    date_range = tuple(rentang)
+            if spec.karyawan_column is not None:
+                pilihan = st.selectbox("Karyawan", ["Semua"] + get_reference_ids(session, Karyawan),
+                                       key=f"{key}_karyawan")
+                karyawan_id = None if pilihan == "Semua" else pilihan
+            if spec.pelanggan_column is not None:
+                pelanggan_id = st.text_input("ID Pelanggan", key=f"{key}_pelanggan").strip() or None
+
+    # Reset posisi halaman jika filter atau urutan berubah
+    signature = (sort_label, descending, page_size, date_range, karyawan_id, pelanggan_id)
+    state_key = f"{key}_cursors"
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[state_key] = [None]
+    cursors = st.session_state[state_key]
+
+    def load():
+        filters = build_filters(spec, date_range, karyawan_id, pelanggan_id)
+        page = fetch_page(session, spec, sort_label, descending, filters, cursors[-1], page_size)
+        df = pd.DataFrame(page.rows, columns=[c.label for c in spec.columns])
+        for column in spec.columns:
+            if column.money:
+                df[column.label] = df[column.label].apply(format_rupiah)
+        return df, page.next_cursor
+
+    # Halaman yang sama tidak di-query dan diformat ulang di setiap rerun selama tabelnya tidak berubah
+    df, next_cursor = cached_by_version(("daftar", key, signature, cursors[-1]), list_tables(spec), load,
+                                        group=("daftar", key), max_entries=MAX_CACHED_PAGES)
+    if df.empty and len(cursors) == 1:
+        st.info(empty_message)
+        return
+
+    st.dataframe(df, use_container_width=True)
+
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    if col_prev.button("Sebelumnya", key=f"{key}_prev", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    col_info.write(f"Halaman {len(cursors)}")
+    if col_next.button("Berikutnya", key=f"{key}_next", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
+
+    # CSV baru dibuat saat tombol diklik, tidak disimpan di cache maupun di setiap rerun
+    st.download_button(
+        label="Download CSV (halaman ini)",
+        data=lambda: df.to_csv(index=False).encode('utf-8'),
+        file_name=file_name,
+        mime='text/csv',
+        key=f"{key}_csv",
+        on_click="ignore",
+    )
+
+def search_select(session: Session, model, label, key, default=None, exclude=(), suffix=None):
+    """Pemilih type-ahead: kotak cari lalu selectbox berisi hasil teratas dari search.search().
+
+    Hanya hasil pencarian yang dikirim ke browser, bukan seluruh daftar ID. default
+    (mis. nilai tersimpan saat mengedit) selalu ikut sebagai pilihan; ID di exclude
+    disembunyikan; suffix(id) menambah keterangan pada label. Mengembalikan ID terpilih,
+    atau None jika tidak ada yang cocok.
+    """
+    query = st.text_input(f"Cari {label}", key=f"{key}_cari", placeholder="Ketik ID atau nama")
+    hits = {id_value: nama for id_value, nama in search(session, model, query) if id_value not in exclude}
+    if default is not None and default not in hits:
+        nama = label_of(session, model, default)
+        if nama is not None:
+            hits = {default: nama, **hits}
+    if not hits:
+        st.info(f"Tidak ada {label} yang cocok.")
+        return None
+    options = list(hits)
+    return st.selectbox(
+        label, options, index=options.index(default) if default in hits else 0, key=key,
+        format_func=lambda i: f"{i} - {hits[i]}{suffix(i) if suffix else ''}",
+    )
+
+def shown_version(key, row_id, version, submitted):
+    """Versi baris (version_id) yang terlihat pengguna saat form dikirim.
+
+    Saat submit, skrip membaca ulang baris dan mendapat versi terbaru, jadi yang
+    dipakai sebagai expected_version adalah versi yang dicatat di rerun sebelumnya.
+    """
+    versions = st.session_state.setdefault(key, {})
+    if not submitted or row_id not in versions:
+        versions[row_id] = version
+    return versions[row_id]
+
+def remember_version(key, row_id, version):
+    """Mencatat versi yang kini ditampilkan form setelah submit (berhasil atau konflik)."""
+    st.session_state.setdefault(key, {})[row_id] = version
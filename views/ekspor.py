@@ -0,0 +1,66 @@
+# views/ekspor.py
+
+"""Halaman ekspor data ke file.
+
+File ekspor ditulis ke direktori sementara milik sesi browser; file lama dihapus
+saat file baru disiapkan, dan direktorinya ikut terhapus ketika sesi berakhir
+(TemporaryDirectory dibersihkan saat session_state dibuang). Tombol download
+membaca file hanya ketika diklik, bukan di setiap rerun.
+"""
+
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from export import EXPORT_FORMATS, EXPORTS
+
+
+def _export_dir():
+    """Direktori sementara per sesi; dihapus otomatis saat sesi dibuang."""
+    if "dir_ekspor" not in st.session_state:
+        st.session_state.dir_ekspor = tempfile.TemporaryDirectory(prefix="restorify_ekspor_")
+    return st.session_state.dir_ekspor.name
+
+
+def _discard_export():
+    previous = st.session_state.pop("file_ekspor", None)
+    if previous is not None:
+        Path(previous[0]).unlink(missing_ok=True)
+
+
+def manage_export(session: Session):
+    st.subheader("Ekspor Data")
+    st.write("Data ditulis bertahap ke file sehingga tabel besar tidak dimuat sekaligus ke memori.")
+
+    dataset = st.selectbox("Tabel", list(EXPORTS), format_func=lambda name: name.replace("_", " + ").title())
+    fmt = st.radio("Format", list(EXPORT_FORMATS), horizontal=True)
+    start = end = None
+    if EXPORTS[dataset][1] is not None and st.checkbox("Filter rentang tanggal"):
+        rentang = st.date_input("Rentang tanggal", (datetime.today().replace(day=1), datetime.today()))
+        if isinstance(rentang, (list, tuple)) and len(rentang) == 2:
+            start, end = rentang
+
+    if st.button("Siapkan File"):
+        _discard_export()
+        writer, suffix, mime = EXPORT_FORMATS[fmt]
+        handle, path = tempfile.mkstemp(prefix=f"{dataset}_", suffix=suffix, dir=_export_dir())
+        os.close(handle)
+        try:
+            with st.spinner("Mengekspor data..."):
+                rows = writer(session.get_bind(), dataset, path, start, end)
+        except RuntimeError as exc:
+            Path(path).unlink(missing_ok=True)
+            st.error(str(exc))
+        else:
+            st.session_state.file_ekspor = (path, f"{dataset}{suffix}", mime, rows)
+
+    if st.session_state.get("file_ekspor"):
+        path, file_name, mime, rows = st.session_state.file_ekspor
+        st.success(f"{rows} baris siap diunduh.")
+        # data berupa callable: file dibaca saat tombol diklik, bukan di setiap rerun
+        st.download_button(label=f"Download {file_name}", data=Path(path).read_bytes, file_name=file_name,
+                           mime=mime, on_click="ignore")
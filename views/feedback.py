@@ -0,0 +1,105 @@
+# views/feedback.py
+
+"""Halaman kelola feedback pelanggan."""
+
+from datetime import datetime
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from models import Feedback, Karyawan, Pelanggan
+from pagination import ListColumn, ListSpec
+from repositories import feedback as feedback_repo
+from utils import get_reference_ids
+from views.common import search_select, show_paginated_table
+
+FEEDBACK_LIST = ListSpec(
+    key="lihat_feedback",
+    columns=[
+        ListColumn("ID Feedback", Feedback.feedback_id),
+        ListColumn("ID Pelanggan", Feedback.pelanggan_id),
+        ListColumn("Nama Pelanggan", Pelanggan.cus_name),
+        ListColumn("ID Karyawan", Feedback.karyawan_id),
+        ListColumn("Nama Karyawan", Karyawan.employee_name),
+        ListColumn("Tanggal", Feedback.tanggal),
+        ListColumn("Rating", Feedback.rating),
+        ListColumn("Komentar", Feedback.komentar),
+    ],
+    pk=Feedback.feedback_id,
+    sort_columns={"Tanggal": Feedback.tanggal, "ID Feedback": Feedback.feedback_id, "Rating": Feedback.rating},
+    date_column=Feedback.tanggal,
+    karyawan_column=Feedback.karyawan_id,
+    pelanggan_column=Feedback.pelanggan_id,
+    joins=(Feedback.pelanggan, Feedback.karyawan),
+)
+
+def manage_feedback(session: Session):
+    st.subheader("Kelola Feedback")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Feedback")
+        # Pencarian pelanggan di luar form agar hasilnya diperbarui saat mengetik
+        pelanggan_id = search_select(session, Pelanggan, "Pelanggan", key="tambah_feedback_pelanggan")
+        with st.form("form_tambah_feedback", clear_on_submit=True):
+            tanggal = st.date_input("Tanggal Feedback", datetime.today())
+            karyawan_ids = get_reference_ids(session, Karyawan)
+
+            karyawan_id = st.selectbox("Karyawan ID", karyawan_ids) if karyawan_ids else None
+            rating = st.slider("Rating (1-5)", min_value=1, max_value=5, value=5)
+            komentar = st.text_area("Komentar (Opsional)", height=100)
+
+            submit = st.form_submit_button("Simpan Feedback")  # Tombol submit
+            if submit:
+                if not pelanggan_id or not karyawan_id:
+                    st.error("Pelanggan dan Karyawan wajib dipilih.")
+                else:
+                    feedback_repo.create(session, pelanggan_id, karyawan_id, tanggal, rating,
+                                         komentar if komentar.strip() != '' else None)
+                    st.success("Feedback berhasil ditambahkan.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Feedback")
+        show_paginated_table(session, FEEDBACK_LIST, "Belum ada data feedback.", 'daftar_feedback.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Feedback")
+        feedback_ids = get_reference_ids(session, Feedback)
+        if feedback_ids:
+            selected_feedback_id = st.selectbox("Pilih ID Feedback", feedback_ids)
+            selected_feedback = feedback_repo.get(session, selected_feedback_id)
+            if selected_feedback:
+                pelanggan_id = search_select(session, Pelanggan, "Pelanggan", key=f"perbarui_feedback_pelanggan_{selected_feedback_id}",
+                                             default=selected_feedback.pelanggan_id)
+                with st.form("form_perbarui_feedback"):
+                    tanggal = st.date_input("Tanggal Feedback", selected_feedback.tanggal)
+                    karyawan_ids = get_reference_ids(session, Karyawan)
+
+                    karyawan_id = st.selectbox("Karyawan ID", karyawan_ids, 
+                                               index=karyawan_ids.index(selected_feedback.karyawan_id)) if karyawan_ids else None
+                    rating = st.slider("Rating (1-5)", min_value=1, max_value=5, value=selected_feedback.rating)
+                    komentar_val = selected_feedback.komentar if selected_feedback.komentar else ""
+                    komentar = st.text_area("Komentar (Opsional)", value=komentar_val, height=100)
+
+                    submit = st.form_submit_button("Perbarui Feedback")  # Tombol submit
+                    if submit:
+                        if not pelanggan_id or not karyawan_id:
+                            st.error("Pelanggan dan Karyawan wajib dipilih.")
+                        else:
+                            feedback_repo.update(session, selected_feedback_id, pelanggan_id=pelanggan_id,
+                                                 karyawan_id=karyawan_id, tanggal=tanggal, rating=rating,
+                                                 komentar=komentar if komentar.strip() != '' else None)
+                            st.success("Feedback berhasil diperbarui.")
+        else:
+            st.info("Belum ada data feedback.")
+
+    elif action == "Hapus":
+        st.subheader("Hapus Feedback")
+        feedback_ids = get_reference_ids(session, Feedback)
+        if feedback_ids:
+            selected_feedback_id = st.selectbox("Pilih ID Feedback", feedback_ids)
+            if st.button("Hapus Feedback"):
+                if feedback_repo.delete(session, selected_feedback_id):
+                    st.success("Feedback berhasil dihapus.")
+        else:
+            st.info("Belum ada data feedback.")
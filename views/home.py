@@ -0,0 +1,19 @@
+# views/home.py
+
+"""Halaman beranda."""
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+def show_home(session: Session):
+    st.subheader("Selamat Datang di Sistem Manajemen Restoran")
+    st.write("""
+        Aplikasi ini membantu Anda dalam mengelola operasi restoran secara efisien.
+        Anda dapat mengelola data karyawan, pelanggan, supplier, bahan baku, menu, transaksi,
+        feedback, dan juga fitur absensi sidik jari (mockup).
+    """)
+    st.image(
+        "https://img.freepik.com/free-vector/"
+        "woman-wearing-medical-mask-client_52683-41295.jpg",
+        use_container_width=True
+    )
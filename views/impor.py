@@ -0,0 +1,42 @@
+# views/impor.py
+
+"""Halaman impor data CSV/Excel."""
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from importer import IMPORTS, ImporterError, import_file
+
+def manage_import(session: Session):
+    st.subheader("Impor Data")
+    st.write("File CSV/Excel divalidasi utuh lebih dulu; baris yang lolos disimpan per potongan "
+             "dan baris yang ditolak bisa diunduh beserta alasannya.")
+
+    dataset = st.selectbox("Data", list(IMPORTS), format_func=lambda name: name.replace("_", " ").title())
+    kolom = ", ".join(f.name if f.required else f"{f.name} (opsional)" for f in IMPORTS[dataset].fields)
+    st.caption(f"Kolom: {kolom}")
+    if dataset == "transaksi":
+        st.caption("Satu baris per menu per transaksi; harga = subtotal baris (kosong = harga menu x jumlah).")
+    uploaded = st.file_uploader("File", type=["csv", "xlsx"])
+    dry_run = st.checkbox("Hanya validasi (tanpa menyimpan)")
+
+    if uploaded is not None and st.button("Impor"):
+        try:
+            with st.spinner("Mengimpor data..."):
+                hasil = import_file(session, dataset, uploaded, uploaded.name, dry_run=dry_run)
+        except ImporterError as exc:
+            st.error(str(exc))
+            return
+        if dry_run:
+            st.info(f"{hasil.diterima} baris valid (belum disimpan).")
+        else:
+            st.success(f"{hasil.diterima} baris disimpan dalam {hasil.potongan} potongan.")
+        if len(hasil.ditolak):
+            st.warning(f"{len(hasil.ditolak)} baris ditolak.")
+            st.dataframe(hasil.ditolak.head(1000), use_container_width=True)
+            st.download_button(
+                label="Download baris yang ditolak (CSV)",
+                data=hasil.ditolak.to_csv(index=False).encode('utf-8'),
+                file_name=f"{dataset}_ditolak.csv",
+                mime='text/csv',
+            )
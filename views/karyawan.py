@@ -0,0 +1,99 @@
+# views/karyawan.py
+
+"""Halaman kelola data karyawan."""
+
+import streamlit as st
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Karyawan
+from pagination import ListColumn, ListSpec
+from repositories import karyawan as karyawan_repo
+from utils import get_reference_ids
+from views.common import show_paginated_table
+
+KARYAWAN_LIST = ListSpec(
+    key="lihat_karyawan",
+    columns=[
+        ListColumn("ID Karyawan", Karyawan.karyawan_id),
+        ListColumn("Nama", Karyawan.employee_name),
+        ListColumn("Posisi", Karyawan.position),
+        ListColumn("Fingerprint ID", func.coalesce(Karyawan.fingerprint_id, "-")),
+    ],
+    pk=Karyawan.karyawan_id,
+    sort_columns={"ID Karyawan": Karyawan.karyawan_id, "Nama": Karyawan.employee_name,
+                  "Posisi": Karyawan.position},
+)
+
+def manage_karyawan(session: Session):
+    st.subheader("Kelola Data Karyawan")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Karyawan")
+        with st.form("form_tambah_karyawan", clear_on_submit=True):
+            karyawan_id = st.text_input("ID Karyawan")
+            employee_name = st.text_input("Nama Karyawan")
+            position = st.selectbox("Posisi", ["Waiter", "Cashier", "Chef", "Manager", "Operational"])
+            fingerprint_id = st.text_input("ID Sidik Jari (Opsional, mock)")
+            submit = st.form_submit_button("Simpan")  # Tombol submit
+
+            if submit:
+                if not karyawan_id or not employee_name or not position:
+                    st.error("Semua field wajib diisi (kecuali sidik jari opsional).")
+                else:
+                    if karyawan_repo.exists(session, karyawan_id):
+                        st.error("ID Karyawan sudah ada.")
+                    else:
+                        try:
+                            karyawan_repo.create(session, karyawan_id, employee_name, position,
+                                                 fingerprint_id if fingerprint_id else None)
+                            st.success("Data karyawan berhasil ditambahkan.")
+                        except IntegrityError:
+                            st.error("ID Sidik Jari sudah dipakai karyawan lain.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Karyawan")
+        show_paginated_table(session, KARYAWAN_LIST, "Belum ada data karyawan.", 'daftar_karyawan.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Data Karyawan")
+        karyawan_ids = get_reference_ids(session, Karyawan)
+        if karyawan_ids:
+            selected_karyawan_id = st.selectbox("Pilih ID Karyawan", karyawan_ids)
+            selected_karyawan = karyawan_repo.get(session, selected_karyawan_id)
+            if selected_karyawan:
+                with st.form("form_perbarui_karyawan"):
+                    employee_name = st.text_input("Nama Karyawan", value=selected_karyawan.employee_name)
+                    position_options = ["Waiter", "Cashier", "Chef", "Manager", "Operational"]
+                    pos_idx = position_options.index(selected_karyawan.position) if selected_karyawan.position in position_options else 0
+                    position = st.selectbox("Posisi", position_options, index=pos_idx)
+                    fingerprint_val = selected_karyawan.fingerprint_id if selected_karyawan.fingerprint_id else ""
+                    fingerprint_id = st.text_input("ID Sidik Jari (Opsional)", value=fingerprint_val)
+                    submit = st.form_submit_button("Perbarui")  # Tombol submit
+
+                    if submit:
+                        if not employee_name or not position:
+                            st.error("Nama dan Posisi wajib diisi.")
+                        else:
+                            try:
+                                karyawan_repo.update(session, selected_karyawan_id, employee_name=employee_name,
+                                                     position=position,
+                                                     fingerprint_id=fingerprint_id if fingerprint_id else None)
+                                st.success("Data karyawan berhasil diperbarui.")
+                            except IntegrityError:
+                                st.error("ID Sidik Jari sudah dipakai karyawan lain.")
+        else:
+            st.info("Belum ada data karyawan.")
+
+    elif action == "Hapus":
+        st.subheader("Hapus Data Karyawan")
+        karyawan_ids = get_reference_ids(session, Karyawan)
+        if karyawan_ids:
+            selected_karyawan_id = st.selectbox("Pilih ID Karyawan", karyawan_ids)
+            if st.button("Hapus"):
+                if karyawan_repo.delete(session, selected_karyawan_id):
+                    st.success("Data karyawan berhasil dihapus.")
+        else:
+            st.info("Belum ada data karyawan.")
@@ -0,0 +1,64 @@
+# views/laporan.py
+
+"""Halaman laporan penjualan."""
+
+from datetime import datetime
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from reports import sales_report
+from views.common import format_rupiah
+
+def chart_spec(mark, x, x_type, y):
+    """Spesifikasi Vega-Lite tetap untuk st.vega_lite_chart.
+
+    st.line_chart/st.bar_chart menyusun dan memvalidasi grafik Altair di setiap
+    rerun (puluhan ms per grafik); spesifikasi ini cukup dibuat sekali saat modul diimpor.
+    """
+    encoding_x = {"field": x, "type": x_type}
+    if x_type == "nominal":
+        encoding_x["sort"] = "-y"
+    return {
+        "mark": {"type": mark, "tooltip": True},
+        "encoding": {"x": encoding_x, "y": {"field": y, "type": "quantitative"}},
+    }
+
+PENDAPATAN_HARIAN_CHART = chart_spec("line", "Tanggal", "temporal", "Pendapatan")
+KERANJANG_HARIAN_CHART = chart_spec("bar", "Tanggal", "temporal", "Rata-rata Keranjang")
+MENU_TERLARIS_CHART = chart_spec("bar", "Nama Menu", "nominal", "Terjual")
+PER_KARYAWAN_CHART = chart_spec("bar", "Nama Karyawan", "nominal", "Pendapatan")
+
+def manage_laporan(session: Session):
+    st.subheader("Laporan Penjualan")
+
+    today = datetime.today().date()
+    rentang = st.date_input("Rentang tanggal", (today.replace(day=1), today), key="laporan_rentang")
+    if not isinstance(rentang, (list, tuple)) or len(rentang) != 2:
+        st.info("Pilih tanggal awal dan akhir.")
+        return
+    start, end = rentang
+
+    report = sales_report(session, start, end)
+    summary = report.summary
+    if not summary.jumlah_order:
+        st.info("Belum ada penjualan pada rentang tanggal ini.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Pendapatan", format_rupiah(summary.pendapatan))
+    col2.metric("Jumlah Transaksi", summary.jumlah_order)
+    col3.metric("Rata-rata Keranjang", format_rupiah(summary.rata_rata_keranjang))
+    col4.metric("Item per Transaksi", f"{summary.item_per_order:.2f}")
+
+    tab_harian, tab_menu, tab_karyawan = st.tabs(["Pendapatan Harian", "Menu Terlaris", "Per Karyawan"])
+    with tab_harian:
+        st.vega_lite_chart(report.harian, PENDAPATAN_HARIAN_CHART, use_container_width=True)
+        st.vega_lite_chart(report.harian, KERANJANG_HARIAN_CHART, use_container_width=True)
+        st.dataframe(report.harian, use_container_width=True)
+    with tab_menu:
+        st.vega_lite_chart(report.menu_terlaris.head(10), MENU_TERLARIS_CHART, use_container_width=True)
+        st.dataframe(report.menu_terlaris, use_container_width=True)
+    with tab_karyawan:
+        st.vega_lite_chart(report.per_karyawan, PER_KARYAWAN_CHART, use_container_width=True)
+        st.dataframe(report.per_karyawan, use_container_width=True)
@@ -0,0 +1,135 @@
+# views/menu.py
+
+"""Halaman kelola data menu, komposisi, serta biaya dan margin."""
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from costing import get_costing
+from menu_matrix import MATRIX_TABLES
+from models import BahanBaku, Menu
+from pagination import ListColumn, ListSpec
+from repositories import menu as menu_repo
+from utils import cached_by_version
+from views.common import format_rupiah, search_select, show_paginated_table
+
+MENU_LIST = ListSpec(
+    key="lihat_menu",
+    columns=[
+        ListColumn("ID Menu", Menu.menu_id),
+        ListColumn("Nama Menu", Menu.nama_menu),
+        ListColumn("Harga", Menu.harga, money=True),
+    ],
+    pk=Menu.menu_id,
+    sort_columns={"ID Menu": Menu.menu_id, "Nama Menu": Menu.nama_menu, "Harga": Menu.harga},
+)
+
+# Tabel sumber data tampilan yang di-cache per versi tabel
+KOMPOSISI_TABLES = ("komposisi_menu", "bahan_baku")
+COSTING_TABLES = (*MATRIX_TABLES, "bahan_baku")
+
+def manage_menu(session: Session):
+    st.subheader("Kelola Data Menu")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus", "Kelola Komposisi", "Biaya & Margin"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Menu")
+        with st.form("form_tambah_menu", clear_on_submit=True):
+            menu_id = st.text_input("ID Menu")
+            nama_menu = st.text_input("Nama Menu")
+            harga = st.number_input("Harga", min_value=0.0, value=0.0)
+            submit = st.form_submit_button("Simpan")  # Tombol submit
+
+            if submit:
+                if not menu_id or not nama_menu:
+                    st.error("Semua field wajib diisi.")
+                else:
+                    if menu_repo.exists(session, menu_id):
+                        st.error("ID Menu sudah ada.")
+                    else:
+                        menu_repo.create(session, menu_id, nama_menu, harga)
+                        st.success("Data menu berhasil ditambahkan.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Menu")
+        show_paginated_table(session, MENU_LIST, "Belum ada data menu.", 'daftar_menu.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Data Menu")
+        selected_menu_id = search_select(session, Menu, "Menu", key="perbarui_menu")
+        if selected_menu_id:
+            selected_menu = menu_repo.get(session, selected_menu_id)
+            if selected_menu:
+                with st.form("form_perbarui_menu"):
+                    nama_menu = st.text_input("Nama Menu", value=selected_menu.nama_menu)
+                    harga = st.number_input("Harga", min_value=0.0, value=float(selected_menu.harga))
+                    submit = st.form_submit_button("Perbarui")  # Tombol submit
+
+                    if submit:
+                        if not nama_menu:
+                            st.error("Nama menu wajib diisi.")
+                        else:
+                            menu_repo.update(session, selected_menu_id, nama_menu=nama_menu, harga=harga)
+                            st.success("Data menu berhasil diperbarui.")
+
+    elif action == "Hapus":
+        st.subheader("Hapus Data Menu")
+        selected_menu_id = search_select(session, Menu, "Menu", key="hapus_menu")
+        if selected_menu_id:
+            if st.button("Hapus"):
+                if menu_repo.delete(session, selected_menu_id):
+                    st.success("Data menu berhasil dihapus.")
+
+    elif action == "Kelola Komposisi":
+        st.subheader("Kelola Komposisi Menu")
+        selected_menu_id = search_select(session, Menu, "Menu", key="komposisi_menu")
+        if selected_menu_id:
+            selected_menu = menu_repo.get(session, selected_menu_id)
+            if selected_menu:
+                st.write(f"Nama Menu: {selected_menu.nama_menu}")
+
+                # Tampilkan komposisi saat ini
+                df_komposisi = cached_by_version(("komposisi", selected_menu_id), KOMPOSISI_TABLES,
+                                                 lambda: komposisi_frame(session, selected_menu_id))
+                if not df_komposisi.empty:
+                    st.dataframe(df_komposisi)
+                else:
+                    st.info("Belum ada komposisi untuk menu ini.")
+
+                st.write("---")
+                st.write("### Tambah Bahan Baku ke Komposisi")
+                selected_bahan_id = search_select(session, BahanBaku, "Bahan Baku", key="komposisi_bahan")
+                if selected_bahan_id:
+                    jumlah_bahan = st.number_input("Jumlah Bahan", min_value=1, value=1)
+                    tambah_item = st.button("Tambah ke Komposisi")
+
+                    if tambah_item:
+                        if menu_repo.has_komposisi(session, selected_menu_id, selected_bahan_id):
+                            st.error("Bahan baku sudah ada dalam komposisi.")
+                        else:
+                            menu_repo.add_komposisi(session, selected_menu_id, selected_bahan_id, jumlah_bahan)
+                            st.success("Bahan baku berhasil ditambahkan ke komposisi.")
+
+    elif action == "Biaya & Margin":
+        st.subheader("Biaya Bahan dan Margin Menu")
+        df = cached_by_version(("biaya_margin",), COSTING_TABLES, lambda: costing_frame(session))
+        if df.empty:
+            st.info("Belum ada data menu.")
+        else:
+            st.dataframe(df, use_container_width=True)
+
+def komposisi_frame(session: Session, menu_id):
+    """Komposisi satu menu beserta nama bahannya sebagai DataFrame tampilan."""
+    return pd.DataFrame(menu_repo.komposisi(session, menu_id), columns=["ID Bahan", "Nama Bahan", "Jumlah"])
+
+def costing_frame(session: Session):
+    """Tabel biaya dan margin yang sudah diurutkan dan diformat."""
+    df = get_costing(session).to_frame()
+    if df.empty:
+        return df
+    df = df.sort_values("Margin %", na_position="first")
+    for kolom in ["Harga Jual", "Biaya Bahan", "Margin"]:
+        df[kolom] = df[kolom].map(format_rupiah)
+    df["Margin %"] = df["Margin %"].map(lambda v: "-" if pd.isna(v) else f"{v:.1f}%")
+    return df
@@ -0,0 +1,74 @@
+# views/pelanggan.py
+
+"""Halaman kelola data pelanggan."""
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from models import Pelanggan
+from pagination import ListColumn, ListSpec
+from repositories import pelanggan as pelanggan_repo
+from views.common import search_select, show_paginated_table
+
+PELANGGAN_LIST = ListSpec(
+    key="lihat_pelanggan",
+    columns=[
+        ListColumn("ID Pelanggan", Pelanggan.pelanggan_id),
+        ListColumn("Nama", Pelanggan.cus_name),
+        ListColumn("Kontak", Pelanggan.contact_info),
+    ],
+    pk=Pelanggan.pelanggan_id,
+    sort_columns={"ID Pelanggan": Pelanggan.pelanggan_id, "Nama": Pelanggan.cus_name},
+)
+
+def manage_pelanggan(session: Session):
+    st.subheader("Kelola Data Pelanggan")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Pelanggan")
+        with st.form("form_tambah_pelanggan", clear_on_submit=True):
+            pelanggan_id = st.text_input("ID Pelanggan")
+            cus_name = st.text_input("Nama Pelanggan")
+            contact_info = st.text_input("Kontak")
+            submit = st.form_submit_button("Simpan")  # Tombol submit
+
+            if submit:
+                if not pelanggan_id or not cus_name or not contact_info:
+                    st.error("Semua field wajib diisi.")
+                else:
+                    if pelanggan_repo.exists(session, pelanggan_id):
+                        st.error("ID Pelanggan sudah ada.")
+                    else:
+                        pelanggan_repo.create(session, pelanggan_id, cus_name, contact_info)
+                        st.success("Data pelanggan berhasil ditambahkan.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Pelanggan")
+        show_paginated_table(session, PELANGGAN_LIST, "Belum ada data pelanggan.", 'daftar_pelanggan.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Data Pelanggan")
+        selected_pelanggan_id = search_select(session, Pelanggan, "Pelanggan", key="perbarui_pelanggan")
+        if selected_pelanggan_id:
+            selected_pelanggan = pelanggan_repo.get(session, selected_pelanggan_id)
+            if selected_pelanggan:
+                with st.form("form_perbarui_pelanggan"):
+                    cus_name = st.text_input("Nama Pelanggan", value=selected_pelanggan.cus_name)
+                    contact_info = st.text_input("Kontak", value=selected_pelanggan.contact_info)
+                    submit = st.form_submit_button("Perbarui")  # Tombol submit
+
+                    if submit:
+                        if not cus_name or not contact_info:
+                            st.error("Semua field wajib diisi.")
+                        else:
+                            pelanggan_repo.update(session, selected_pelanggan_id, cus_name=cus_name,
+                                                  contact_info=contact_info)
+                            st.success("Data pelanggan berhasil diperbarui.")
+
+    elif action == "Hapus":
+        st.subheader("Hapus Data Pelanggan")
+        selected_pelanggan_id = search_select(session, Pelanggan, "Pelanggan", key="hapus_pelanggan")
+        if selected_pelanggan_id and st.button("Hapus"):
+            if pelanggan_repo.delete(session, selected_pelanggan_id):
+                st.success("Data pelanggan berhasil dihapus.")
@@ -0,0 +1,117 @@
+# views/pemesanan_bahan.py
+
+"""Halaman pemesanan bahan ke supplier."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from models import PemesananBahan, Supplier
+from pagination import ListColumn, ListSpec
+from purchasing import (
+    RECEIVABLE_STATUSES, STATUS_DIPESAN, STATUS_DRAFT, TRANSITIONS,
+    PurchasingError, create_orders, order_lines, orders_with_status, receive, set_status
+)
+from repositories import bahan_baku as bahan_baku_repo
+from utils import get_reference_ids
+from views.common import format_rupiah, show_paginated_table
+
+PEMESANAN_LIST = ListSpec(
+    key="lihat_pemesanan",
+    columns=[
+        ListColumn("ID Pemesanan", PemesananBahan.pemesanan_id),
+        ListColumn("ID Supplier", PemesananBahan.supplier_id),
+        ListColumn("Tanggal Pemesanan", PemesananBahan.tanggal_pemesanan),
+        ListColumn("Status", PemesananBahan.status),
+    ],
+    pk=PemesananBahan.pemesanan_id,
+    sort_columns={"Tanggal Pemesanan": PemesananBahan.tanggal_pemesanan,
+                  "ID Pemesanan": PemesananBahan.pemesanan_id, "Status": PemesananBahan.status},
+    date_column=PemesananBahan.tanggal_pemesanan,
+)
+
+def show_order_lines(session: Session, pemesanan_id):
+    lines = order_lines(session, pemesanan_id)
+    df = pd.DataFrame(lines, columns=["ID Bahan", "Nama Bahan", "Jumlah", "Satuan", "Harga Satuan"])
+    df["Harga Satuan"] = df["Harga Satuan"].apply(format_rupiah)
+    st.dataframe(df, use_container_width=True)
+
+def pilih_pesanan(session: Session, statuses, label):
+    """Selectbox pesanan dengan status tertentu; mengembalikan baris terpilih atau None."""
+    orders = orders_with_status(session, statuses)
+    if not orders:
+        st.info("Tidak ada pesanan dengan status yang sesuai.")
+        return None
+    return st.selectbox(label, orders, format_func=lambda o: f"{o[0]} - {o[1]} ({o[2]}, {o[3]})")
+
+def manage_pemesanan_bahan(session: Session):
+    st.subheader("Kelola Pemesanan Bahan")
+    action = st.selectbox("Aksi", ["Buat Pesanan", "Lihat", "Ubah Status", "Terima Barang"])
+
+    if action == "Buat Pesanan":
+        st.subheader("Buat Pesanan ke Supplier")
+        supplier_ids = get_reference_ids(session, Supplier)
+        if not supplier_ids:
+            st.info("Belum ada data supplier.")
+            return
+        supplier_id = st.selectbox("Supplier", supplier_ids)
+        tanggal = st.date_input("Tanggal Pemesanan", datetime.today())
+        status = st.radio("Status awal", [STATUS_DRAFT, STATUS_DIPESAN], horizontal=True)
+        bahan = bahan_baku_repo.by_supplier(session, supplier_id)
+        if not bahan:
+            st.info("Supplier ini belum memasok bahan baku apa pun.")
+            return
+        df = pd.DataFrame([(b.bahan_id, b.nama_bahan, b.satuan, b.stock, b.harga_bahan) for b in bahan],
+                          columns=["ID Bahan", "Nama Bahan", "Satuan", "Stok", "Harga Satuan"])
+        df["Harga Satuan"] = df["Harga Satuan"].astype(float)
+        df["Jumlah Pesan"] = 0
+        edited = st.data_editor(
+            df, use_container_width=True, hide_index=True, key=f"pesanan_{supplier_id}",
+            disabled=["ID Bahan", "Nama Bahan", "Satuan", "Stok"],
+        )
+        dipesan = edited[edited["Jumlah Pesan"] > 0]
+        if st.button("Simpan Pesanan"):
+            if dipesan.empty:
+                st.warning("Isi jumlah pesan untuk minimal satu bahan.")
+            else:
+                lines = list(zip(dipesan["ID Bahan"], dipesan["Jumlah Pesan"].astype(int),
+                                 dipesan["Harga Satuan"]))
+                try:
+                    ids = create_orders(session, tanggal, {supplier_id: lines}, status=status)
+                except PurchasingError as exc:
+                    st.error(str(exc))
+                else:
+                    st.success(f"Pesanan {ids[supplier_id]} berhasil dibuat.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Pemesanan Bahan")
+        show_paginated_table(session, PEMESANAN_LIST, "Belum ada pemesanan bahan.", 'daftar_pemesanan.csv')
+
+    elif action == "Ubah Status":
+        st.subheader("Ubah Status Pesanan")
+        pesanan = pilih_pesanan(session, list(TRANSITIONS), "Pilih Pesanan")
+        if pesanan:
+            show_order_lines(session, pesanan[0])
+            status_baru = st.selectbox("Status Baru", TRANSITIONS[pesanan[3]])
+            if st.button("Ubah Status"):
+                try:
+                    set_status(session, pesanan[0], status_baru)
+                except PurchasingError as exc:
+                    st.error(str(exc))
+                else:
+                    st.success(f"Status pesanan {pesanan[0]} menjadi {status_baru}.")
+
+    elif action == "Terima Barang":
+        st.subheader("Terima Barang dari Supplier")
+        pesanan = pilih_pesanan(session, RECEIVABLE_STATUSES, "Pilih Pesanan")
+        if pesanan:
+            show_order_lines(session, pesanan[0])
+            if st.button("Terima Semua Barang"):
+                try:
+                    jumlah_bahan = receive(session, pesanan[0])
+                except PurchasingError as exc:
+                    st.error(str(exc))
+                else:
+                    st.success(f"Pesanan {pesanan[0]} diterima; stok {jumlah_bahan} bahan bertambah.")
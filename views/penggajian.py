@@ -0,0 +1,52 @@
+# views/penggajian.py
+
+"""Halaman penggajian bulanan."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from payroll import run_payroll
+from repositories import penggajian as penggajian_repo
+from utils import cached_by_version
+from views.common import format_rupiah
+
+def manage_penggajian(session: Session):
+    st.subheader("Penggajian Bulanan")
+    today = datetime.today()
+    col_bulan, col_tahun = st.columns(2)
+    bulan = col_bulan.selectbox("Bulan", list(range(1, 13)), index=today.month - 1)
+    tahun = col_tahun.number_input("Tahun", min_value=2000, max_value=2100, value=today.year)
+
+    if st.button("Hitung dan Simpan Gaji"):
+        with st.spinner("Menghitung gaji..."):
+            gaji = run_payroll(session, bulan, int(tahun))
+        st.success(f"Gaji {len(gaji)} karyawan untuk {bulan}/{tahun} disimpan.")
+        st.session_state.rincian_gaji = (bulan, int(tahun), gaji)
+
+    rincian = st.session_state.get("rincian_gaji")
+    if rincian and rincian[:2] == (bulan, int(tahun)):
+        df = rincian[2].rename(columns={
+            "karyawan_id": "ID Karyawan", "employee_name": "Nama", "position": "Posisi",
+            "hari_terjadwal": "Hari Terjadwal", "hari_hadir": "Hari Hadir", "jam_lembur": "Jam Lembur",
+            "gaji_pokok": "Gaji Pokok", "upah_lembur": "Upah Lembur", "jumlah_gaji": "Jumlah Gaji",
+        })
+        st.write(f"Total gaji: {format_rupiah(df['Jumlah Gaji'].sum())}")
+        for kolom in ["Gaji Pokok", "Upah Lembur", "Jumlah Gaji"]:
+            df[kolom] = df[kolom].apply(format_rupiah)
+        st.dataframe(df, use_container_width=True)
+    else:
+        df = cached_by_version(("gaji_tersimpan", bulan, int(tahun)), ("penggajian", "karyawan"),
+                               lambda: saved_payroll(session, bulan, int(tahun)))
+        if not df.empty:
+            st.dataframe(df, use_container_width=True)
+        else:
+            st.info("Gaji periode ini belum dihitung.")
+
+def saved_payroll(session: Session, bulan, tahun):
+    """Gaji yang sudah disimpan untuk satu periode sebagai DataFrame tampilan."""
+    df = pd.DataFrame(penggajian_repo.for_period(session, bulan, tahun), columns=["ID Karyawan", "Nama", "Jumlah Gaji"])
+    df["Jumlah Gaji"] = df["Jumlah Gaji"].apply(format_rupiah)
+    return df
@@ -0,0 +1,48 @@
+# views/sql_stats.py
+
+"""Panel kinerja SQL (hanya bila RESTORIFY_SQL_STATS=1)."""
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from instrumentation import (
+    N_PLUS_ONE_THRESHOLD, reset as reset_sql_stats, snapshot as sql_stats_snapshot, to_json as sql_stats_json
+)
+
+def manage_sql_stats(session: Session):
+    st.subheader("Kinerja SQL")
+    st.write(
+        "Latensi halaman dan query SQL per fungsi halaman sejak proses dimulai atau sejak reset. "
+        f"SELECT yang sama berulang {N_PLUS_ONE_THRESHOLD} kali atau lebih dalam "
+        "satu rerun ditandai sebagai pola N+1."
+    )
+    data = sql_stats_snapshot()
+
+    col_unduh, col_reset = st.columns(2)
+    col_unduh.download_button("Unduh JSON", sql_stats_json(), file_name="kinerja_sql.json",
+                              mime="application/json")
+    if col_reset.button("Reset Statistik"):
+        reset_sql_stats()
+        st.rerun()
+
+    st.markdown("**Latensi per Halaman**")
+    if data["halaman"]:
+        st.dataframe(pd.DataFrame(data["halaman"]).round(2), use_container_width=True)
+    else:
+        st.info("Belum ada data. Buka beberapa halaman lalu kembali ke sini.")
+
+    st.markdown("**Pola N+1**")
+    if data["n_plus_1"]:
+        st.warning(f"{len(data['n_plus_1'])} statement berulang dalam satu rerun.")
+        st.dataframe(pd.DataFrame(data["n_plus_1"]), use_container_width=True)
+    else:
+        st.success("Tidak ada pola N+1 terdeteksi.")
+
+    st.markdown("**Statement SQL**")
+    statements = pd.DataFrame(data["statement"])
+    if not statements.empty:
+        halaman = st.selectbox("Halaman", ["Semua"] + sorted(statements["halaman"].unique()))
+        if halaman != "Semua":
+            statements = statements[statements["halaman"] == halaman]
+        st.dataframe(statements.head(100).round(2), use_container_width=True)
@@ -0,0 +1,82 @@
+# views/supplier.py
+
+"""Halaman kelola data supplier."""
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from models import Supplier
+from pagination import ListColumn, ListSpec
+from repositories import supplier as supplier_repo
+from utils import get_reference_ids
+from views.common import show_paginated_table
+
+SUPPLIER_LIST = ListSpec(
+    key="lihat_supplier",
+    columns=[
+        ListColumn("ID Supplier", Supplier.supplier_id),
+        ListColumn("Nama Supplier", Supplier.supplier_name),
+        ListColumn("Alamat", Supplier.address),
+    ],
+    pk=Supplier.supplier_id,
+    sort_columns={"ID Supplier": Supplier.supplier_id, "Nama Supplier": Supplier.supplier_name},
+)
+
+def manage_supplier(session: Session):
+    st.subheader("Kelola Data Supplier")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat", "Perbarui", "Hapus"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Supplier")
+        with st.form("form_tambah_supplier", clear_on_submit=True):
+            supplier_id = st.text_input("ID Supplier")
+            supplier_name = st.text_input("Nama Supplier")
+            address = st.text_input("Alamat")
+            submit = st.form_submit_button("Simpan")  # Tombol submit
+
+            if submit:
+                if not supplier_id or not supplier_name or not address:
+                    st.error("Semua field wajib diisi.")
+                else:
+                    if supplier_repo.exists(session, supplier_id):
+                        st.error("ID Supplier sudah ada.")
+                    else:
+                        supplier_repo.create(session, supplier_id, supplier_name, address)
+                        st.success("Data supplier berhasil ditambahkan.")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Supplier")
+        show_paginated_table(session, SUPPLIER_LIST, "Belum ada data supplier.", 'daftar_supplier.csv')
+
+    elif action == "Perbarui":
+        st.subheader("Perbarui Data Supplier")
+        supplier_ids = get_reference_ids(session, Supplier)
+        if supplier_ids:
+            selected_supplier_id = st.selectbox("Pilih ID Supplier", supplier_ids)
+            selected_supplier = supplier_repo.get(session, selected_supplier_id)
+            if selected_supplier:
+                with st.form("form_perbarui_supplier"):
+                    supplier_name = st.text_input("Nama Supplier", value=selected_supplier.supplier_name)
+                    address = st.text_input("Alamat", value=selected_supplier.address)
+                    submit = st.form_submit_button("Perbarui")  # Tombol submit
+
+                    if submit:
+                        if not supplier_name or not address:
+                            st.error("Semua field wajib diisi.")
+                        else:
+                            supplier_repo.update(session, selected_supplier_id, supplier_name=supplier_name,
+                                                 address=address)
+                            st.success("Data supplier berhasil diperbarui.")
+        else:
+            st.info("Belum ada data supplier.")
+
+    elif action == "Hapus":
+        st.subheader("Hapus Data Supplier")
+        supplier_ids = get_reference_ids(session, Supplier)
+        if supplier_ids:
+            selected_supplier_id = st.selectbox("Pilih ID Supplier", supplier_ids)
+            if st.button("Hapus"):
+                if supplier_repo.delete(session, selected_supplier_id):
+                    st.success("Data supplier berhasil dihapus.")
+        else:
+            st.info("Belum ada data supplier.")
@@ -0,0 +1,184 @@
+# views/transaksi.py
+
+"""Halaman transaksi: editor keranjang, checkout, dan daftar transaksi."""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from cart import Cart, menu_prices
+from checkout import CheckoutError, InsufficientStockError, checkout
+from concurrency import DatabaseBusyError
+from db_config import SessionLocal
+from instrumentation import page_scope
+from models import BahanBaku, Karyawan, Menu, Pelanggan, Transaksi
+from pagination import ListColumn, ListSpec
+from portions import get_portions
+from repositories import feedback as feedback_repo
+from utils import get_reference_ids, get_reference_list, sync_table_versions
+from views.common import format_rupiah, search_select, show_paginated_table
+
+TRANSAKSI_LIST = ListSpec(
+    key="lihat_transaksi",
+    columns=[
+        ListColumn("ID Transaksi", Transaksi.transaksi_id),
+        ListColumn("Tanggal Pembelian", Transaksi.tanggal_pembelian),
+        ListColumn("ID Pelanggan", Transaksi.pelanggan_id),
+        ListColumn("Nama Pelanggan", Pelanggan.cus_name),
+        ListColumn("ID Karyawan", Transaksi.karyawan_id),
+        ListColumn("Nama Karyawan", Karyawan.employee_name),
+        ListColumn("Total Transaksi", Transaksi.total_transaksi, money=True),
+    ],
+    pk=Transaksi.transaksi_id,
+    sort_columns={"Tanggal Pembelian": Transaksi.tanggal_pembelian, "ID Transaksi": Transaksi.transaksi_id,
+                  "Total Transaksi": Transaksi.total_transaksi},
+    date_column=Transaksi.tanggal_pembelian,
+    karyawan_column=Transaksi.karyawan_id,
+    pelanggan_column=Transaksi.pelanggan_id,
+    joins=(Transaksi.pelanggan, Transaksi.karyawan),
+)
+
+def keterangan_porsi(porsi, menu_id):
+    """Keterangan sisa porsi menurut stok bahan untuk label pilihan menu."""
+    tersedia = porsi.available(menu_id)
+    if tersedia is None:
+        return ""
+    if tersedia == 0:
+        return " - habis"
+    return f" - sisa {tersedia} porsi"
+
+def nama_bahan_list(session: Session, bahan_ids):
+    nama = dict(get_reference_list(session, BahanBaku))
+    return ", ".join(nama.get(b, b) for b in bahan_ids)
+
+def tambah_item(porsi, prices):
+    """Callback tombol Tambah Item: menambah satu baris jika stok bahan mencukupi."""
+    keranjang = st.session_state.keranjang
+    menu_id = st.session_state.keranjang_menu
+    jumlah = int(st.session_state.keranjang_jumlah)
+    kurang = porsi.shortages(keranjang.with_added(menu_id, jumlah))
+    if kurang:
+        st.session_state.keranjang_kurang = kurang
+    else:
+        keranjang.add(menu_id, jumlah, prices)
+
+def hapus_item():
+    """Callback tombol Hapus Item."""
+    st.session_state.keranjang.remove(st.session_state.keranjang_hapus)
+
+@st.fragment
+def cart_editor():
+    """Pemilih menu, jumlah, isi keranjang, dan total sementara.
+
+    Sebagai fragment, menambah atau menghapus item hanya menjalankan ulang fungsi
+    ini, bukan seluruh halaman. Perubahan keranjang dilakukan di callback tombol
+    sebelum fragment digambar ulang, dan hanya baris yang berubah yang dihitung.
+    """
+    keranjang = st.session_state.keranjang
+    # Fragment dapat dijalankan tanpa halaman, jadi memakai sesi database sendiri
+    with SessionLocal() as session, page_scope("cart_editor"):
+        sync_table_versions(session)
+        keranjang.sync(session)
+        porsi = get_portions(session)
+        prices = menu_prices(session)
+
+        sembunyikan = st.checkbox("Sembunyikan menu yang habis", value=True, key="keranjang_sembunyikan_habis")
+        menu_id = search_select(session, Menu, "Menu", key="keranjang_menu",
+                                exclude=porsi.sold_out() if sembunyikan else (),
+                                suffix=lambda m: keterangan_porsi(porsi, m))
+        if menu_id is not None:
+            st.number_input("Jumlah", min_value=1, value=1, key="keranjang_jumlah")
+            st.button("Tambah Item", on_click=tambah_item, args=(porsi, prices))
+            kurang = st.session_state.pop("keranjang_kurang", None)
+            if kurang:
+                st.error(f"Stok bahan tidak mencukupi: {nama_bahan_list(session, kurang)}.")
+
+        # Isi keranjang dengan harga dari cache menu; total dijaga keranjang, tidak dijumlah ulang
+        if keranjang:
+            df_detail = pd.DataFrame(
+                [(line.nama_menu, line.jumlah, format_rupiah(line.subtotal)) for line in keranjang],
+                columns=["Menu", "Jumlah", "Harga"]
+            )
+            st.table(df_detail)
+            st.write(f"Total sementara: {format_rupiah(keranjang.total)}")
+            col_item, col_hapus, col_kosong = st.columns([2, 1, 1])
+            col_item.selectbox("Item", list(keranjang.lines), key="keranjang_hapus",
+                               format_func=lambda m: keranjang.lines[m].nama_menu)
+            col_hapus.button("Hapus Item", on_click=hapus_item)
+            col_kosong.button("Kosongkan Keranjang", on_click=keranjang.clear)
+
+def manage_transaksi(session: Session):
+    st.subheader("Kelola Data Transaksi")
+    action = st.selectbox("Aksi", ["Tambah", "Lihat"])
+
+    if action == "Tambah":
+        st.subheader("Tambah Data Transaksi")
+        # Keranjang disimpan di session state; database baru disentuh saat checkout
+        if 'keranjang' not in st.session_state:
+            st.session_state.keranjang = Cart()
+        keranjang = st.session_state.keranjang
+
+        karyawan_ids = get_reference_ids(session, Karyawan)
+        if not karyawan_ids:
+            st.warning("Belum ada karyawan.")
+
+        transaksi_id = st.text_input("ID Transaksi")
+        tanggal_pembelian = st.date_input("Tanggal Pembelian", datetime.today())
+        pelanggan_id = search_select(session, Pelanggan, "Pelanggan", key="transaksi_pelanggan")
+        karyawan_id = st.selectbox("Karyawan ID", karyawan_ids) if karyawan_ids else None
+
+        # Editor keranjang digambar setelah checkout diproses, agar keranjang yang baru
+        # dikosongkan oleh checkout tidak tampil lagi di rerun yang sama
+        detail = st.expander("Tambah Detail Transaksi", expanded=True)
+
+        # Tombol untuk menyelesaikan transaksi: header, detail, dan stok disimpan sekaligus
+        if st.button("Selesaikan Transaksi"):
+            kurang = get_portions(session).shortages(keranjang.items())
+            if not keranjang:
+                st.warning("Tidak ada detail transaksi yang ditambahkan.")
+            elif not pelanggan_id or not karyawan_id:
+                st.error("Pelanggan dan Karyawan wajib dipilih.")
+            elif kurang:
+                # Keranjang pasti gagal menurut indeks porsi; tidak perlu ke database
+                st.error(f"Stok bahan tidak mencukupi: {nama_bahan_list(session, kurang)}.")
+            else:
+                try:
+                    hasil = checkout(
+                        session, transaksi_id, tanggal_pembelian,
+                        pelanggan_id, karyawan_id, keranjang.items()
+                    )
+                except InsufficientStockError as exc:
+                    for kurang in exc.shortages:
+                        st.error(
+                            f"Stok bahan {kurang.nama_bahan} tidak mencukupi "
+                            f"(butuh {kurang.dibutuhkan}, tersedia {kurang.stock} {kurang.satuan})."
+                        )
+                except (CheckoutError, DatabaseBusyError) as exc:
+                    st.error(str(exc))
+                else:
+                    st.success(f"Transaksi selesai dengan total: {format_rupiah(hasil.total_transaksi)}")
+                    keranjang.clear()
+                    st.session_state.transaksi_terakhir = (pelanggan_id, karyawan_id)
+
+        with detail:
+            cart_editor()
+
+        # Bagian feedback untuk transaksi yang baru selesai
+        if st.session_state.get('transaksi_terakhir'):
+            pelanggan_fb, karyawan_fb = st.session_state.transaksi_terakhir
+            st.subheader("Beri Rating dan Feedback")
+            with st.form("form_feedback"):
+                rating = st.slider("Rating (1-5)", min_value=1, max_value=5, value=5)
+                komentar = st.text_area("Komentar (Opsional)", height=100)
+                submit_feedback = st.form_submit_button("Simpan Feedback")
+                if submit_feedback:
+                    feedback_repo.create(session, pelanggan_fb, karyawan_fb, datetime.today(), rating,
+                                         komentar if komentar.strip() != '' else None)
+                    st.session_state.transaksi_terakhir = None
+                    st.success("Feedback berhasil disimpan. Terima kasih!")
+
+    elif action == "Lihat":
+        st.subheader("Daftar Transaksi")
+        show_paginated_table(session, TRANSAKSI_LIST, "Belum ada data transaksi.", 'daftar_transaksi.csv')